@@ -0,0 +1,93 @@
+"""
+Backend benchmark: PaddleOCR inference vs ONNX Runtime on CPU.
+
+Processes the same images with each backend and reports import/model load
+time, per-image latency (median and p95) and throughput, plus how often the
+two backends produce identical text. Requires paddleocr, onnxruntime and
+the PP-OCR models exported to ONNX (det.onnx, rec.onnx, cls.onnx, keys.txt).
+
+Usage:
+    python benchmarks/bench_backends.py ./scans/ --model-dir ./onnx/
+        [--threads 8] [--repeat 3]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from smart_ocr.core.config import OCRConfig  # noqa: E402
+from smart_ocr.core.ocr_engine import OCREngine  # noqa: E402
+
+
+def run(config: OCRConfig, images: list, repeat: int) -> dict:
+    """Time model loading and per-image latency for one backend."""
+    start = time.perf_counter()
+    engine = OCREngine(config)
+    engine.warmup()
+    load_seconds = time.perf_counter() - start
+    engine.process_image(images[0])
+
+    latencies = []
+    texts = []
+    for _ in range(repeat):
+        texts = []
+        for image in images:
+            image_start = time.perf_counter()
+            texts.append(engine.process_image(image).text)
+            latencies.append(time.perf_counter() - image_start)
+
+    latencies.sort()
+    return {
+        "load": load_seconds,
+        "median": statistics.median(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))],
+        "throughput": len(latencies) / sum(latencies),
+        "texts": texts,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--model-dir", type=Path, required=True)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    images = OCREngine(OCRConfig(show_log=False)).find_images(args.directory)
+    if not images:
+        print(f"No images found in {args.directory}", file=sys.stderr)
+        return 1
+
+    common = dict(show_log=False, cpu_threads=args.threads, decoder="opencv")
+    stats = {
+        "paddle": run(OCRConfig(backend="paddle", **common), images, args.repeat),
+        "onnxruntime": run(
+            OCRConfig(backend="onnxruntime", onnx_model_dir=args.model_dir, **common),
+            images,
+            args.repeat,
+        ),
+    }
+
+    print(f"{len(images)} images x {args.repeat}, {args.threads} threads")
+    print(f"{'backend':<12} {'load s':>8} {'median ms':>10} {'p95 ms':>8} {'img/s':>7}")
+    for name, row in stats.items():
+        print(
+            f"{name:<12} {row['load']:>8.2f} {row['median'] * 1000:>10.1f} "
+            f"{row['p95'] * 1000:>8.1f} {row['throughput']:>7.2f}"
+        )
+    speedup = stats["paddle"]["median"] / stats["onnxruntime"]["median"]
+    same = sum(
+        a == b for a, b in zip(stats["paddle"]["texts"], stats["onnxruntime"]["texts"])
+    )
+    print(f"median latency speedup: {speedup:.2f}x")
+    print(f"identical text:         {same}/{len(images)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
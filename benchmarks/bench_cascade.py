@@ -0,0 +1,89 @@
+"""
+Cascade benchmark: single full-resolution pass vs two-pass cascade.
+
+Runs the same images through the engine twice, once normally and once with
+``cascade=True``, then reports wall time, speedup, how many lines the
+cascade escalated to full resolution, and how often the two runs agree on
+the page text. Requires PaddleOCR and a directory of real scans.
+
+Usage:
+    python benchmarks/bench_cascade.py ./scans/ [--max-side 960]
+        [--threshold 0.85] [--decoder opencv] [--gpu]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from smart_ocr.core.config import OCRConfig  # noqa: E402
+from smart_ocr.core.ocr_engine import OCREngine  # noqa: E402
+
+
+def run(config: OCRConfig, images: list) -> tuple:
+    """Process ``images`` after a warm-up image; return (seconds, results, stats)."""
+    engine = OCREngine(config)
+    engine.warmup()
+    engine.process_image(images[0])
+    engine.stats.reset()
+
+    start = time.perf_counter()
+    results = engine.process_images(images)
+    return time.perf_counter() - start, results, engine.stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--max-side", type=int, default=960)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--decoder", default="opencv")
+    parser.add_argument("--gpu", action="store_true")
+    parser.add_argument("--recursive", "-r", action="store_true")
+    args = parser.parse_args()
+
+    common = dict(use_gpu=args.gpu, show_log=False, decoder=args.decoder)
+    images = OCREngine(OCRConfig(**common)).find_images(
+        args.directory, recursive=args.recursive
+    )
+    if not images:
+        print(f"No images found in {args.directory}", file=sys.stderr)
+        return 1
+
+    base_time, base_results, _ = run(OCRConfig(**common), images)
+    cascade_time, cascade_results, stats = run(
+        OCRConfig(
+            cascade=True,
+            cascade_max_side=args.max_side,
+            cascade_threshold=args.threshold,
+            **common,
+        ),
+        images,
+    )
+
+    lines = stats.get("lines")
+    escalated = stats.get("cascade_escalated")
+    same = sum(a.text == b.text for a, b in zip(base_results, cascade_results))
+    base_conf = sum(r.average_confidence for r in base_results) / len(base_results)
+    cascade_conf = sum(r.average_confidence for r in cascade_results) / len(
+        cascade_results
+    )
+
+    print(f"images:             {len(images)}")
+    print(f"full resolution:    {base_time:.2f}s  (avg conf {base_conf:.3f})")
+    print(f"cascade:            {cascade_time:.2f}s  (avg conf {cascade_conf:.3f})")
+    print(f"speedup:            {base_time / cascade_time:.2f}x")
+    print(
+        f"escalated lines:    {escalated}/{lines} "
+        f"({escalated / max(lines, 1):.1%}), "
+        f"{stats.get('cascade_improved')} improved"
+    )
+    print(f"identical pages:    {same}/{len(images)}")
+    print(stats.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Decoder benchmark: path-based loading vs reduced-size and memory-mapped decoding.
+
+Generates a 20-megapixel JPEG and large uncompressed BMP/TIFF scans, then
+times each decoder and records peak Python-tracked memory (numpy buffers
+are tracked by tracemalloc). The "path" baseline is a full-size
+``cv2.imread``, which is what PaddleOCR does when given a file path.
+
+Usage:
+    python benchmarks/bench_decoders.py [--max-side 2000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from smart_ocr.core.decoders import create_decoder  # noqa: E402
+
+
+def make_samples(directory: Path) -> list:
+    """Write synthetic document scans in each format."""
+    rng = np.random.default_rng(0)
+    page = np.full((3648, 5472, 3), 245, dtype=np.uint8)
+    for y in range(200, 3400, 90):
+        page[y : y + 30, 300 : rng.integers(1500, 5200)] = 20
+    noise = rng.integers(0, 12, size=page.shape, dtype=np.uint8)
+    page = cv2.subtract(page, noise)
+
+    samples = []
+    for name, kwargs in [
+        ("scan_20mp.jpg", {"quality": 90}),
+        ("scan_20mp.bmp", {}),
+        ("scan_20mp.tiff", {}),
+    ]:
+        path = directory / name
+        Image.fromarray(page).save(path, **kwargs)
+        samples.append(path)
+    return samples
+
+
+def baseline(path: Path) -> tuple:
+    """Full-size cv2.imread, as PaddleOCR performs for a path input."""
+    image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+    return image.shape
+
+
+def measure(func, repeat: int) -> tuple:
+    """Return (median seconds, peak MB) over ``repeat`` runs."""
+    timings = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        shape = func()
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(timings), peak / (1024 * 1024), shape
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-side", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        samples = make_samples(Path(tmp))
+        print(f"{'file':<16} {'decoder':<22} {'median ms':>10} {'peak MB':>9}  shape")
+        for path in samples:
+            rows = [("path (cv2.imread)", lambda: baseline(path))]
+            for name in ("opencv", "pillow"):
+                decoder = create_decoder(name, max_side=args.max_side, mmap_min_mb=1)
+                rows.append(
+                    (f"{name} max={args.max_side}",
+                     lambda d=decoder: d.decode(path).data.shape)
+                )
+            full = create_decoder("pillow", mmap_min_mb=1)
+            rows.append(("pillow full size", lambda: full.decode(path).data.shape))
+
+            for label, func in rows:
+                seconds, peak_mb, shape = measure(func, args.repeat)
+                print(
+                    f"{path.name:<16} {label:<22} {seconds * 1000:>10.1f} "
+                    f"{peak_mb:>9.1f}  {shape}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Result serialisation benchmark: binary records vs to_dict plus JSON.
+
+Encodes and decodes synthetic OCRResult pages with ``to_bytes`` /
+``from_bytes`` and with ``json.dumps(to_dict())`` / ``from_dict(json.loads())``,
+and reports the time per page and the encoded size. Pages have the given
+number of lines of mixed Chinese and ASCII text with four-point boxes.
+
+No models are needed.
+
+Usage:
+    python benchmarks/bench_result_format.py [--pages 200]
+        [--lines 20 80 300]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from smart_ocr.core.ocr_engine import OCRLine, OCRResult  # noqa: E402
+
+ALPHABET = "的一是在不了有和人這中大為上個國我以要他時來用們生到作地於出就分對成會可主發年動"
+ALPHABET += "0123456789ABCDEFabcdef -:/"
+
+
+def make_page(rng: random.Random, index: int, lines: int) -> OCRResult:
+    """A synthetic page of ``lines`` boxed text lines."""
+    page = []
+    for row in range(lines):
+        x, y = rng.randint(0, 1500), 40 * row + rng.randint(0, 5)
+        width = rng.randint(80, 900)
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(4, 30)))
+        box = [[x, y], [x + width, y], [x + width, y + 32], [x, y + 32]]
+        page.append(OCRLine(text, rng.uniform(0.5, 1.0), box))
+    return OCRResult(Path(f"scans/page_{index:05d}.png"), page)
+
+
+def measure(
+    pages: List[OCRResult], encode: Callable, decode: Callable, repeat: int = 3
+) -> tuple:
+    """Return (encode seconds, decode seconds, bytes) per page, best of runs."""
+    encode_time = decode_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encoded = [encode(page) for page in pages]
+        encode_time = min(encode_time, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for data in encoded:
+            decode(data)
+        decode_time = min(decode_time, time.perf_counter() - start)
+
+    size = sum(len(data) for data in encoded)
+    count = len(pages)
+    return encode_time / count, decode_time / count, size / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--lines", type=int, nargs="+", default=[20, 80, 300])
+    args = parser.parse_args()
+
+    formats = {
+        "json": (
+            lambda r: json.dumps(r.to_dict(), ensure_ascii=False).encode("utf-8"),
+            lambda data: OCRResult.from_dict(json.loads(data)),
+        ),
+        "bin": (OCRResult.to_bytes, OCRResult.from_bytes),
+    }
+
+    rng = random.Random(0)
+    print(f"{'lines/page':<12} {'format':<6} {'encode':>10} {'decode':>10} {'KB':>8}")
+    for lines in args.lines:
+        pages = [make_page(rng, i, lines) for i in range(args.pages)]
+        for name, (encode, decode) in formats.items():
+            encode_time, decode_time, size = measure(pages, encode, decode)
+            print(
+                f"{lines:<12} {name:<6} {encode_time * 1e6:>8.0f}us "
+                f"{decode_time * 1e6:>8.0f}us {size / 1024:>8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Worker hand-off benchmark: shared memory image ring vs pickling.
+
+Sends decoded page images from the parent to a spawned worker process and
+measures the round trip, either pickled through a Pipe (what a
+multiprocessing queue does) or written into a ``SharedImageRing`` slot
+with only the handle sent. The worker reads every byte of each image, so
+both transports pay the same cost for actually using the pixels.
+
+No models are needed.
+
+Usage:
+    python benchmarks/bench_shm_transport.py [--images 50]
+        [--dpi 200 300 600]
+"""
+
+import argparse
+import sys
+import time
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from smart_ocr.core.image_ring import SharedImageRing  # noqa: E402
+
+
+def worker(conn, ring_spec) -> None:
+    """Receive images (arrays or ring handles), read them, reply."""
+    ring = SharedImageRing.attach(*ring_spec) if ring_spec else None
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        image = ring.view(message) if ring is not None else message
+        conn.send(int(image.max()))
+        del image
+    if ring is not None:
+        ring.close()
+
+
+def measure(image: np.ndarray, count: int, shared: bool) -> tuple:
+    """Return (seconds per image, parent CPU seconds per image)."""
+    context = get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    ring = SharedImageRing(1, image.nbytes) if shared else None
+    ring_spec = (ring.name, ring.slots, ring.slot_bytes) if ring else None
+    process = context.Process(target=worker, args=(child_conn, ring_spec))
+    process.start()
+
+    def send() -> None:
+        parent_conn.send(ring.write(0, image) if ring is not None else image)
+        parent_conn.recv()
+
+    send()  # warm up the worker and fault in the slot pages
+    start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(count):
+        send()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    parent_conn.send(None)
+    process.join()
+    if ring is not None:
+        ring.close()
+    return elapsed / count, cpu / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=50)
+    parser.add_argument("--dpi", type=int, nargs="+", default=[200, 300, 600])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'A4 page':<16} {'MB':>6} {'pickle':>10} {'shm':>10} {'gain':>6}")
+    for dpi in args.dpi:
+        shape = (round(11.69 * dpi), round(8.27 * dpi), 3)
+        image = rng.integers(0, 256, shape, dtype=np.uint8)
+        pickled, pickled_cpu = measure(image, args.images, shared=False)
+        shared, shared_cpu = measure(image, args.images, shared=True)
+        print(
+            f"{f'{dpi} dpi':<16} {image.nbytes / 1e6:>6.1f} "
+            f"{pickled * 1000:>8.2f}ms {shared * 1000:>8.2f}ms "
+            f"{pickled / shared:>5.1f}x"
+        )
+        print(
+            f"{'  parent CPU':<16} {'':>6} "
+            f"{pickled_cpu * 1000:>8.2f}ms {shared_cpu * 1000:>8.2f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
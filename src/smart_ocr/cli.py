@@ -5,13 +5,45 @@ Provides CLI commands for OCR processing.
 """
 
 import argparse
+import contextlib
+import dataclasses
 import io
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
-from .core.config import OCRConfig
-from .core.ocr_engine import OCREngine
+from .core.config import (
+    SUPPORTED_BACKENDS,
+    SUPPORTED_DECODERS,
+    SUPPORTED_EXPORT_FORMATS,
+    OCRConfig,
+)
+from .core.discovery import read_file_list
+from .core.evaluation import (
+    EvaluationReport,
+    compare,
+    evaluate,
+    format_tradeoff,
+    load_corpus,
+    worsened_files,
+)
+from .core.ocr_engine import OCREngine, OCRResult
+from .core.readers import check_mergeable, detect_format, merge_results
+from .core.sharding import parse_shard, shard_of
+from .core.supervisor import (
+    ProcessingFailure,
+    SupervisedRunner,
+    write_quarantine,
+)
+from .core.watcher import FolderWatcher
+from .core.writers import (
+    RollingWriter,
+    compressed_path,
+    create_writer,
+    effective_compression,
+    parse_formats,
+    uncompressible_formats,
+)
 
 
 def _setup_utf8_output() -> None:
@@ -21,6 +53,210 @@ def _setup_utf8_output() -> None:
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
 
+def _shard_arg(value: str) -> tuple:
+    """argparse type for ``--shard i/N``."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _formats_arg(value: str) -> str:
+    """argparse type for ``--format json,csv,xlsx``."""
+    try:
+        return ",".join(parse_formats(value))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _warn_uncompressed(formats: str, compress: Optional[str]) -> None:
+    """Warn, before any work starts, about formats --compress cannot apply to."""
+    for fmt in uncompressible_formats(formats, compress):
+        print(
+            f"Warning: {fmt} cannot be compressed, it is written uncompressed",
+            file=sys.stderr,
+        )
+
+
+def _blank_note(results: List[OCRResult]) -> str:
+    """Summary suffix counting pages skipped as blank, if any."""
+    blank = sum(1 for result in results if result.blank)
+    return f" ({blank} blank)" if blank else ""
+
+
+def _add_engine_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the OCR engine options shared by process and watch."""
+    parser.add_argument(
+        "--lang",
+        "-l",
+        type=str,
+        default="ch",
+        help="Language for OCR (default: ch for Chinese)",
+    )
+    parser.add_argument("--gpu", action="store_true", help="Use GPU acceleration")
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=SUPPORTED_BACKENDS,
+        default="paddle",
+        help="Inference backend (default: paddle)",
+    )
+    parser.add_argument(
+        "--model-dir",
+        type=str,
+        default=None,
+        help="Directory with det.onnx, rec.onnx, cls.onnx and keys.txt",
+    )
+    parser.add_argument(
+        "--quantized",
+        action="store_true",
+        help="Load the INT8 models (det.int8.onnx, rec.int8.onnx)",
+    )
+    parser.add_argument(
+        "--bundle",
+        type=str,
+        default=None,
+        help="Verified model bundle directory to load models from (offline)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=10,
+        help="CPU inference threads (default: 10)",
+    )
+    parser.add_argument(
+        "--template",
+        type=str,
+        default=None,
+        help="Form template JSON: recognize only its named regions",
+    )
+    parser.add_argument(
+        "--decoder",
+        type=str,
+        choices=SUPPORTED_DECODERS,
+        default="path",
+        help="Image decoder (default: path, PaddleOCR reads the file)",
+    )
+    parser.add_argument(
+        "--decode-max-side",
+        type=int,
+        default=None,
+        help="Decode images directly to at most this many pixels per side",
+    )
+    parser.add_argument(
+        "--rec-batch",
+        type=int,
+        default=6,
+        help="Text lines per recognition batch (default: 6)",
+    )
+    parser.add_argument(
+        "--page-batch",
+        type=int,
+        default=1,
+        help="Pool recognition of this many pages' text lines (default: 1)",
+    )
+    parser.add_argument(
+        "--rec-cache",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Cache recognition of up to N repeated text crops (default: off)",
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="OCR a downscaled image first; re-read only weak lines at full size",
+    )
+    parser.add_argument(
+        "--cascade-max-side",
+        type=int,
+        default=960,
+        help="Longest side of the cascade's first pass (default: 960)",
+    )
+    parser.add_argument(
+        "--cascade-threshold",
+        type=float,
+        default=0.85,
+        help="Re-read lines below this confidence at full size (default: 0.85)",
+    )
+    parser.add_argument(
+        "--lexicon",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Correct near-misses of the terms in FILE (one term per line)",
+    )
+    parser.add_argument(
+        "--lexicon-distance",
+        type=int,
+        default=1,
+        help="Most edits corrected per lexicon term (default: 1)",
+    )
+    parser.add_argument(
+        "--halfwidth",
+        action="store_true",
+        help="Convert full-width digits, letters and spaces to half-width",
+    )
+    parser.add_argument(
+        "--convert-dict",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Convert text with an OpenCC-format dictionary file or directory",
+    )
+    parser.add_argument(
+        "--skip-blank",
+        action="store_true",
+        help="Detect blank pages from their ink coverage and skip OCR on them",
+    )
+    parser.add_argument(
+        "--blank-threshold",
+        type=float,
+        default=0.0005,
+        help="Pages with less ink coverage than this are blank (default: 0.0005)",
+    )
+
+
+def _build_config(
+    args: argparse.Namespace, preset: Optional[OCRConfig] = None
+) -> OCRConfig:
+    """
+    Create the OCR configuration from parsed engine options.
+
+    When ``preset`` is given (e.g. ``OCRConfig.for_english()``), its language
+    and tuning are kept and only the remaining options are applied to it.
+    """
+    options = dict(
+        lang=args.lang,
+        use_gpu=args.gpu,
+        backend=args.backend,
+        onnx_model_dir=args.model_dir,
+        quantized=args.quantized,
+        model_bundle=args.bundle,
+        cpu_threads=args.threads,
+        show_log=not args.quiet,
+        template=args.template,
+        decoder=args.decoder,
+        decode_max_side=args.decode_max_side,
+        rec_batch_num=args.rec_batch,
+        rec_page_batch=args.page_batch,
+        rec_cache_size=args.rec_cache,
+        cascade=args.cascade,
+        cascade_max_side=args.cascade_max_side,
+        cascade_threshold=args.cascade_threshold,
+        lexicon=args.lexicon,
+        lexicon_max_distance=args.lexicon_distance,
+        normalize_width=args.halfwidth,
+        conversion_dict=args.convert_dict,
+        skip_blank=args.skip_blank,
+        blank_threshold=args.blank_threshold,
+    )
+    if preset is None:
+        return OCRConfig(**options)
+    del options["lang"]
+    return dataclasses.replace(preset, **options)
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -41,8 +277,72 @@ Examples:
   # Use GPU acceleration
   smart-ocr process image.png --gpu
 
+  # Run the PP-OCR models exported to ONNX on CPU, without paddlepaddle
+  smart-ocr process ./documents/ --backend onnxruntime --model-dir ./onnx/
+
   # Process with English language
   smart-ocr process image.png --lang en
+
+  # OCR once, export JSON for systems and XLSX for people (result.json/.xlsx)
+  smart-ocr process ./documents/ -r -o result.json -f json,xlsx
+
+  # Searchable PDF archive: scans with an invisible, selectable text layer
+  smart-ocr process ./scans/ -r -o archive.pdf -f pdf
+
+  # Write a gzip-compressed JSON export (result.json.gz)
+  smart-ocr process ./documents/ -r -o result.json -f json --compress gzip
+
+  # Split a corpus across four machines, then merge the shard outputs
+  smart-ocr process ./corpus/ -r --shard 0/4 -o shard0.json -f json
+  smart-ocr merge shard0.json shard1.json shard2.json shard3.json -o all.xlsx
+
+  # Isolate each image in a worker process with a 60s timeout
+  smart-ocr process ./documents/ --supervised --workers 2 --timeout 60 -o out.json
+
+  # Hand decoded images to 4 workers through shared memory, not pickling
+  smart-ocr process ./scans/ --supervised --workers 4 --shared-memory -o out.jsonl
+
+  # Process an explicit file list piped in by another system
+  find /archive -name '*.tiff' -newer last-run | smart-ocr process --files-from -
+
+  # Decode large JPEG scans straight to 2000px with Pillow draft mode
+  smart-ocr process ./scans/ --decoder pillow --decode-max-side 2000
+
+  # Fast low-resolution pass, full-resolution re-OCR of weak lines only
+  smart-ocr process ./scans/ --cascade --cascade-threshold 0.9 --profile
+
+  # Fix misread bank and utility names against a lexicon of known terms
+  smart-ocr process ./statements/ --lexicon banks.txt -o out.json -f json
+
+  # Half-width digits and Simplified to Traditional (OpenCC ST dictionaries)
+  smart-ocr process ./scans/ --halfwidth --convert-dict ./opencc/st/
+
+  # Skip OCR on blank separator pages and backsides of a scanned batch
+  smart-ocr process ./scans/ -r --skip-blank -o out.jsonl -f jsonl
+
+  # Recognize only the named regions of a fixed-layout form
+  smart-ocr process form.png --template form.json -o fields.json -f json
+
+  # Recognize text lines of 8 pages together in width-sorted batches of 16
+  smart-ocr process ./documents/ --page-batch 8 --rec-batch 16
+
+  # Reuse recognition of labels repeated on every page of a form batch
+  smart-ocr process ./forms/ --rec-cache 4096 --profile
+
+  # Score a labelled corpus and fail if accuracy or speed regressed
+  smart-ocr evaluate ./golden/ --baseline golden-baseline.json
+
+  # Quantize the ONNX models to INT8, then measure the trade-off vs FP32
+  smart-ocr quantize ./calibration/ --model-dir ./onnx/
+  smart-ocr evaluate ./golden/ --backend onnxruntime --model-dir ./onnx/ \
+      --quantized --baseline fp32-baseline.json --cer-tolerance 0.02
+
+  # Pin the models in a checksummed bundle, then run offline from it
+  smart-ocr bundle fetch 2024.10 --lang ch -o ./models/
+  smart-ocr process ./documents/ --bundle ./models/2024.10/
+
+  # Continuously process new files dropped into an inbox
+  smart-ocr watch ./inbox/ --output ./results/ --format jsonl
         """,
     )
 
@@ -54,35 +354,334 @@ Examples:
 
     # Process command
     process_parser = subparsers.add_parser("process", help="Process image(s) for OCR")
-    process_parser.add_argument("input", type=str, help="Input image file or directory")
+    process_parser.add_argument(
+        "input", type=str, nargs="?", help="Input image file or directory"
+    )
+    process_parser.add_argument(
+        "--files-from",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Process the image paths listed in FILE, one per line ('-': stdin)",
+    )
     process_parser.add_argument(
         "--output", "-o", type=str, default=None, help="Output file path"
     )
     process_parser.add_argument(
         "--format",
         "-f",
-        type=str,
-        choices=["txt", "json", "csv", "xlsx"],
+        type=_formats_arg,
         default="txt",
-        help="Output format (default: txt)",
+        help=(
+            "Output format, or several comma-separated, written in one pass "
+            f"({', '.join(SUPPORTED_EXPORT_FORMATS)}; default: txt)"
+        ),
     )
+    _add_engine_arguments(process_parser)
     process_parser.add_argument(
-        "--lang",
-        "-l",
+        "--recursive", "-r", action="store_true", help="Process directories recursively"
+    )
+    process_parser.add_argument(
+        "--no-sort",
+        action="store_true",
+        help="Take directory files in listing order (starts sooner on huge dirs)",
+    )
+    process_parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        default=None,
+        metavar="i/N",
+        help="Process only shard i of N (zero-based) of a directory or file list",
+    )
+    process_parser.add_argument(
+        "--compress",
         type=str,
-        default="ch",
-        help="Language for OCR (default: ch for Chinese)",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Stream output through a compressor (adds .gz / .zst)",
     )
     process_parser.add_argument(
-        "--gpu", action="store_true", help="Use GPU acceleration"
+        "--quiet", "-q", action="store_true", help="Suppress output"
     )
     process_parser.add_argument(
-        "--recursive", "-r", action="store_true", help="Process directories recursively"
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and counters after processing",
+    )
+    process_parser.add_argument(
+        "--supervised",
+        action="store_true",
+        help="Run OCR in isolated worker processes with per-image timeouts",
     )
     process_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes in supervised mode (default: 1)",
+    )
+    process_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=120.0,
+        help="Seconds allowed per image in supervised mode (default: 120)",
+    )
+    process_parser.add_argument(
+        "--max-images-per-worker",
+        type=int,
+        default=500,
+        help="Recycle a worker after this many images (default: 500, 0: never)",
+    )
+    process_parser.add_argument(
+        "--max-worker-rss",
+        type=float,
+        default=None,
+        help="Recycle a worker once its memory exceeds this many MB",
+    )
+    process_parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="Decode in the parent and hand images to workers via shared memory",
+    )
+    process_parser.add_argument(
+        "--shm-slot-mb",
+        type=float,
+        default=64.0,
+        help="Shared memory slot size; larger images go by path (default: 64)",
+    )
+    process_parser.add_argument(
+        "--retries",
+        type=int,
+        default=1,
+        help="Retries for images whose worker hung or crashed (default: 1)",
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Continuously process new images in a directory"
+    )
+    watch_parser.add_argument("input", type=str, help="Directory to watch")
+    watch_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="output",
+        help="Directory for rolling result files (default: output)",
+    )
+    watch_parser.add_argument(
+        "--format",
+        "-f",
+        type=str,
+        choices=["txt", "jsonl", "csv"],
+        default="jsonl",
+        help="Output format (default: jsonl)",
+    )
+    _add_engine_arguments(watch_parser)
+    watch_parser.add_argument(
+        "--recursive", "-r", action="store_true", help="Watch subdirectories too"
+    )
+    watch_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Maximum images per micro-batch (default: 8)",
+    )
+    watch_parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=0.5,
+        help="Seconds a ready file waits for batch-mates (default: 0.5)",
+    )
+    watch_parser.add_argument(
+        "--settle",
+        type=float,
+        default=1.0,
+        help="Seconds a file size must stay unchanged (default: 1.0)",
+    )
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Force scandir polling instead of inotify",
+    )
+    watch_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between directory scans when polling (default: 1.0)",
+    )
+    watch_parser.add_argument(
+        "--roll-interval",
+        type=float,
+        default=3600,
+        help="Seconds before starting a new output file (default: 3600)",
+    )
+    watch_parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Ignore files already present when the watch starts",
+    )
+    watch_parser.add_argument(
+        "--compress",
+        type=str,
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Stream output through a compressor (adds .gz / .zst)",
+    )
+    watch_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress output"
+    )
+
+    # Merge command
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge exported results (e.g. shard outputs) into one file"
+    )
+    merge_parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=str,
+        help="Exported result files to merge (json, jsonl or bin)",
+    )
+    merge_parser.add_argument(
+        "--output", "-o", type=str, required=True, help="Merged output file path"
+    )
+    merge_parser.add_argument(
+        "--format",
+        "-f",
+        type=str,
+        choices=SUPPORTED_EXPORT_FORMATS,
+        default=None,
+        help="Output format (default: inferred from the output suffix)",
+    )
+    merge_parser.add_argument(
+        "--compress",
+        type=str,
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Stream output through a compressor (adds .gz / .zst)",
+    )
+    merge_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress output"
+    )
+
+    # Evaluate command
+    evaluate_parser = subparsers.add_parser(
+        "evaluate", help="Score a labelled corpus against a stored baseline"
+    )
+    evaluate_parser.add_argument(
+        "corpus", type=str, help="Directory of images with .gt.txt ground truth"
+    )
+    evaluate_parser.add_argument(
+        "--preset",
+        type=str,
+        choices=["chinese", "english"],
+        default=None,
+        help="Start from OCRConfig.for_chinese() / for_english()",
+    )
+    _add_engine_arguments(evaluate_parser)
+    evaluate_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="Baseline JSON to compare against; exit 1 on regression",
+    )
+    evaluate_parser.add_argument(
+        "--save-baseline",
+        type=str,
+        default=None,
+        help="Write this run's scores as a new baseline JSON",
+    )
+    evaluate_parser.add_argument(
+        "--cer-tolerance",
+        type=float,
+        default=0.005,
+        help="Allowed absolute CER increase (default: 0.005)",
+    )
+    evaluate_parser.add_argument(
+        "--wer-tolerance",
+        type=float,
+        default=0.01,
+        help="Allowed absolute WER increase (default: 0.01)",
+    )
+    evaluate_parser.add_argument(
+        "--speed-tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative throughput drop (default: 0.10)",
+    )
+    evaluate_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress per-file output"
+    )
+
+    # Quantize command
+    quantize_parser = subparsers.add_parser(
+        "quantize", help="Quantize the ONNX det/rec models to INT8"
+    )
+    quantize_parser.add_argument(
+        "calibration", type=str, help="Directory of representative images"
+    )
+    quantize_parser.add_argument(
+        "--model-dir",
+        type=str,
+        required=True,
+        help="Directory with det.onnx, rec.onnx and keys.txt",
+    )
+    quantize_parser.add_argument(
+        "--max-images",
+        type=int,
+        default=50,
+        help="Calibration images to use (default: 50)",
+    )
+    quantize_parser.add_argument(
+        "--per-channel",
+        action="store_true",
+        help="Per-channel weight quantization (slower, usually more accurate)",
+    )
+    quantize_parser.add_argument(
         "--quiet", "-q", action="store_true", help="Suppress output"
     )
 
+    # Bundle command
+    bundle_parser = subparsers.add_parser(
+        "bundle", help="Create or verify an offline model bundle"
+    )
+    bundle_subparsers = bundle_parser.add_subparsers(dest="bundle_command")
+    fetch_parser = bundle_subparsers.add_parser(
+        "fetch", help="Download PaddleOCR's models and pack them"
+    )
+    fetch_parser.add_argument(
+        "--lang", "-l", type=str, default="ch", help="Language (default: ch)"
+    )
+    pack_parser = bundle_subparsers.add_parser(
+        "pack", help="Pack an ONNX model dir or det/ rec/ cls/ model dirs"
+    )
+    pack_parser.add_argument("source", type=str, help="Directory with the models")
+    pack_parser.add_argument(
+        "--lang", "-l", type=str, default="ch", help="Language (default: ch)"
+    )
+    pack_parser.add_argument(
+        "--no-external-data",
+        action="store_true",
+        help="Keep ONNX weights inside the model files",
+    )
+    for sub in (fetch_parser, pack_parser):
+        sub.add_argument(
+            "bundle_version",
+            metavar="version",
+            help="Bundle version, used as its directory name",
+        )
+        sub.add_argument(
+            "--output",
+            "-o",
+            type=str,
+            default="models",
+            help="Directory receiving the bundle (default: models)",
+        )
+    verify_parser = bundle_subparsers.add_parser(
+        "verify", help="Check a bundle against its checksums"
+    )
+    verify_parser.add_argument("path", type=str, help="Bundle directory")
+    for sub in (fetch_parser, pack_parser, verify_parser):
+        sub.add_argument("--quiet", "-q", action="store_true", help="Suppress output")
+
     # Config command
     config_parser = subparsers.add_parser("config", help="Show or modify configuration")
     config_parser.add_argument(
@@ -94,38 +693,317 @@ Examples:
 
 def process_command(args: argparse.Namespace) -> int:
     """Handle the process command."""
-    input_path = Path(args.input)
+    if args.input is None and args.files_from is None:
+        print("Error: Give an input path or --files-from", file=sys.stderr)
+        return 1
+    input_path = Path(args.input or "")
+    if args.output:
+        _warn_uncompressed(args.format, args.compress)
+    if args.shard and args.files_from is None and input_path.is_file():
+        print("Error: --shard needs a directory or --files-from", file=sys.stderr)
+        return 1
 
     # Create configuration
-    config = OCRConfig(lang=args.lang, use_gpu=args.gpu, show_log=not args.quiet)
+    config = _build_config(args)
 
     # Initialize engine
     engine = OCREngine(config)
 
     # Process input
-    if input_path.is_file():
-        results = [engine.process_image(input_path)]
+    failures: List[ProcessingFailure] = []
+    image_paths: Optional[Iterable[Path]] = None
+    if args.files_from is not None:
+        image_paths = read_file_list(args.files_from)
+        if args.shard:
+            # Listed paths are hashed as given, so nodes sharing a list agree
+            index, count = args.shard
+            image_paths = (p for p in image_paths if shard_of(p, count) == index)
+    elif not input_path.exists():
+        print(f"Error: Input not found: {input_path}", file=sys.stderr)
+        return 1
+    elif args.supervised:
+        image_paths = (
+            [input_path]
+            if input_path.is_file()
+            else engine.find_images(
+                input_path, recursive=args.recursive, shard=args.shard
+            )
+        )
+
+    # Pages are exported as they are processed, and the pdf writer reuses
+    # the decoded images instead of decoding every source file again
+    writer = (
+        engine.create_export_writer(args.output, args.format, args.compress)
+        if args.output
+        else None
+    )
+    on_page = writer.write if writer is not None else None
+    with writer or contextlib.nullcontext():
+        if args.supervised and image_paths is not None:
+            runner = SupervisedRunner(
+                config,
+                workers=args.workers,
+                timeout=args.timeout,
+                max_images_per_worker=args.max_images_per_worker or None,
+                max_rss_mb=args.max_worker_rss,
+                retries=args.retries,
+                shared_memory=args.shared_memory,
+                shm_slot_mb=args.shm_slot_mb,
+            )
+            results, failures = runner.run(image_paths)
+            if writer is not None:
+                writer.write_all(results)
+            if not args.quiet:
+                print(
+                    f"Processed {len(results)} images{_blank_note(results)}, "
+                    f"{len(failures)} failed"
+                )
+                for failure in failures:
+                    print(f"  {failure.source_file}: {failure.reason}")
+        elif image_paths is not None:
+            results = engine.process_images(image_paths, on_page=on_page)
+            if not args.quiet:
+                print(f"Processed {len(results)} images{_blank_note(results)}")
+        elif input_path.is_file():
+            results = [engine.process_image(input_path)]
+            if writer is not None:
+                writer.write(results[0])
+            if not args.quiet:
+                print(f"Processed: {input_path}")
+                print(f"Confidence: {results[0].average_confidence:.2%}")
+                print("-" * 40)
+                if results[0].blank:
+                    print("(blank page)")
+                elif results[0].fields is not None:
+                    for name, text in results[0].fields.items():
+                        print(f"{name}: {text}")
+                else:
+                    print(results[0].text)
+        else:
+            results = engine.process_directory(
+                input_path,
+                recursive=args.recursive,
+                shard=args.shard,
+                sort=not args.no_sort,
+                on_page=on_page,
+            )
+            if not args.quiet:
+                print(f"Processed {len(results)} images{_blank_note(results)}")
+
+    if writer is not None:
+        output_path = writer.paths[0]
         if not args.quiet:
-            print(f"Processed: {input_path}")
-            print(f"Confidence: {results[0].average_confidence:.2%}")
-            print("-" * 40)
-            print(results[0].text)
-    elif input_path.is_dir():
-        results = engine.process_directory(input_path, recursive=args.recursive)
+            for path in writer.paths:
+                print(f"Results exported to: {path}")
+        if failures:
+            quarantine_path = write_quarantine(
+                failures, output_path.with_name(f"{output_path.stem}.failed.csv")
+            )
+            if not args.quiet:
+                print(f"Failed files listed in: {quarantine_path}")
+
+    if args.profile:
+        if args.supervised:
+            print("Profile: not available in supervised mode", file=sys.stderr)
+        else:
+            print(engine.stats.format())
+
+    return 0
+
+
+def watch_command(args: argparse.Namespace) -> int:
+    """Handle the watch command."""
+    input_path = Path(args.input)
+    if not input_path.is_dir():
+        print(f"Error: Not a directory: {input_path}", file=sys.stderr)
+        return 1
+
+    config = _build_config(args)
+    engine = OCREngine(config)
+    engine.warmup()
+
+    watcher = FolderWatcher(
+        input_path,
+        recursive=args.recursive,
+        settle_time=args.settle,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.poll,
+        include_existing=not args.new_only,
+    )
+    writer = RollingWriter(
+        args.output,
+        format=args.format,
+        interval=args.roll_interval,
+        compress=args.compress,
+    )
+
+    if not args.quiet:
+        mode = "inotify" if watcher.uses_inotify else "polling"
+        print(f"Watching {input_path} ({mode}), press Ctrl+C to stop")
+
+    try:
+        with writer:
+            for batch in watcher.batches(
+                batch_size=args.batch_size, max_wait=args.max_wait
+            ):
+                results = engine.process_images(batch)
+                output_path = writer.write_batch(results)
+                if not args.quiet:
+                    print(
+                        f"Processed {len(results)}/{len(batch)} images"
+                        f"{_blank_note(results)} -> {output_path}"
+                    )
+    except KeyboardInterrupt:
+        watcher.stop()
         if not args.quiet:
-            print(f"Processed {len(results)} images")
-    else:
-        print(f"Error: Input not found: {input_path}", file=sys.stderr)
+            print("Stopped watching")
+
+    return 0
+
+
+def merge_command(args: argparse.Namespace) -> int:
+    """Handle the merge command."""
+    for input_file in args.inputs:
+        if not Path(input_file).is_file():
+            print(f"Error: Input not found: {input_file}", file=sys.stderr)
+            return 1
+        try:
+            check_mergeable(input_file)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    try:
+        output_format = args.format or detect_format(
+            compressed_path(args.output, args.compress)
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
         return 1
+    _warn_uncompressed(output_format, args.compress)
+    compress = effective_compression(output_format, args.compress)
+    output_path = compressed_path(args.output, compress)
 
-    # Export if output specified
-    if args.output:
-        output_path = engine.export_results(
-            results, output_path=args.output, format=args.format
+    writer = create_writer(output_format, output_path, compress=compress)
+    with writer:
+        writer.write_all(merge_results(args.inputs))
+
+    if not args.quiet:
+        print(f"Merged {writer.count} results into: {output_path}")
+    return 0
+
+
+def evaluate_command(args: argparse.Namespace) -> int:
+    """Handle the evaluate command."""
+    try:
+        corpus = load_corpus(args.corpus)
+    except (NotADirectoryError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    presets = {"chinese": OCRConfig.for_chinese, "english": OCRConfig.for_english}
+    preset = presets[args.preset]() if args.preset else None
+    engine = OCREngine(_build_config(args, preset))
+    report = evaluate(engine, corpus, root=args.corpus)
+
+    if not args.quiet:
+        for score in report.files:
+            print(
+                f"  {score.source_file}: CER {score.cer:.4f}  WER {score.wer:.4f}  "
+                f"{score.seconds:.2f}s"
+            )
+    print(
+        f"{len(report.files)} files: CER {report.cer:.4f}  WER {report.wer:.4f}  "
+        f"{report.images_per_second:.2f} img/s"
+    )
+
+    if args.save_baseline:
+        print(f"Baseline written to: {report.save(args.save_baseline)}")
+
+    if not args.baseline:
+        return 0
+
+    try:
+        baseline = EvaluationReport.load(args.baseline)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Against baseline: {format_tradeoff(report, baseline)}")
+    for source_file, before, after in worsened_files(
+        report, baseline, args.cer_tolerance
+    )[:10]:
+        print(f"  worse: {source_file}: CER {before:.4f} -> {after:.4f}")
+
+    regressions = compare(
+        report,
+        baseline,
+        cer_tolerance=args.cer_tolerance,
+        wer_tolerance=args.wer_tolerance,
+        speed_tolerance=args.speed_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def quantize_command(args: argparse.Namespace) -> int:
+    """Handle the quantize command."""
+    from .core.quantization import quantize_models
+
+    config = OCRConfig(
+        backend="onnxruntime", onnx_model_dir=args.model_dir, show_log=not args.quiet
+    )
+    try:
+        written = quantize_models(
+            config,
+            args.calibration,
+            max_images=args.max_images,
+            per_channel=args.per_channel,
         )
-        if not args.quiet:
-            print(f"Results exported to: {output_path}")
+    except (FileNotFoundError, NotADirectoryError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
+    if not args.quiet:
+        for path in written:
+            print(f"Wrote: {path}")
+    return 0
+
+
+def bundle_command(args: argparse.Namespace) -> int:
+    """Handle the bundle command."""
+    from .core.bundle import ModelBundle, fetch_bundle, pack_bundle
+
+    try:
+        if args.bundle_command == "fetch":
+            config = OCRConfig(lang=args.lang, show_log=not args.quiet)
+            bundle = fetch_bundle(config, args.output, args.bundle_version)
+        elif args.bundle_command == "pack":
+            bundle = pack_bundle(
+                args.source,
+                args.output,
+                args.bundle_version,
+                lang=args.lang,
+                external_data=not args.no_external_data,
+            )
+        elif args.bundle_command == "verify":
+            bundle = ModelBundle.load(args.path)
+            bundle.verify()
+        else:
+            print("Usage: smart-ocr bundle {fetch,pack,verify} ...", file=sys.stderr)
+            return 1
+    except (FileExistsError, FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.quiet:
+        return 0
+    if args.bundle_command == "verify":
+        print(f"Verified {len(bundle.files)} files in {bundle.path}")
+    else:
+        print(f"Wrote bundle: {bundle.path} ({len(bundle.files)} files)")
+    print(f"Backend: {bundle.backend}, lang: {bundle.lang}, version: {bundle.version}")
     return 0
 
 
@@ -155,6 +1033,16 @@ def main(argv: Optional[list] = None) -> int:
 
     if args.command == "process":
         return process_command(args)
+    elif args.command == "watch":
+        return watch_command(args)
+    elif args.command == "merge":
+        return merge_command(args)
+    elif args.command == "evaluate":
+        return evaluate_command(args)
+    elif args.command == "quantize":
+        return quantize_command(args)
+    elif args.command == "bundle":
+        return bundle_command(args)
     elif args.command == "config":
         return config_command(args)
     else:
@@ -0,0 +1,155 @@
+"""
+Micro-Batching Module
+
+Gathers concurrent single-image requests into small batches. Callers on
+many threads (or coroutines, via ``asyncio.wrap_future``) submit one image
+each; a background thread waits at most ``max_wait_ms`` after the first
+request for up to ``max_batch_size`` requests, runs them as one batched
+pass and hands every caller its own result or exception.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .profiling import EngineStats
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Batch concurrent requests for a single batch-processing function.
+
+    ``process_batch`` receives a list of items and must return one outcome
+    per item, in order: either the result or the exception to raise in
+    that item's caller. Items are only ever processed on the batcher
+    thread, so the batch function never runs concurrently with itself.
+
+    Example:
+        >>> batcher = MicroBatcher(engine._process_page_outcomes, 8, 5.0)
+        >>> future = batcher.submit("page1.png")
+        >>> result = future.result()
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        stats: Optional[EngineStats] = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Function processing a list of items.
+            max_batch_size: Largest number of items run in one batch.
+            max_wait_ms: Longest time the first request of a batch waits
+                        for batch-mates before the batch is run.
+            stats: Optional stats receiving batch counters.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = stats
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, item: Any) -> "Future[Any]":
+        """Queue an item and return a future for its outcome."""
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ocr-micro-batcher", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((item, future))
+        return future
+
+    def close(self) -> None:
+        """Finish the queued requests and stop the batcher thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Batcher thread: collect a batch, run it, repeat until stopped."""
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._dispatch(batch)
+            if stopping:
+                return
+
+    def _dispatch(self, batch: List[Tuple[Any, "Future[Any]"]]) -> None:
+        """Run one batch and resolve the futures of its callers."""
+        live = [(item, f) for item, f in batch if f.set_running_or_notify_cancel()]
+        if not live:
+            return
+        if self.stats is not None:
+            self.stats.increment("micro_batches")
+            self.stats.increment("micro_batch_items", len(live))
+
+        try:
+            outcomes = list(self.process_batch([item for item, _ in live]))
+            if len(outcomes) != len(live):
+                raise RuntimeError(
+                    f"Batch function returned {len(outcomes)} outcomes "
+                    f"for {len(live)} items"
+                )
+        except Exception as e:
+            logger.error(f"Micro-batch of {len(live)} failed: {e}")
+            for _, future in live:
+                future.set_exception(e)
+            return
+
+        for (_, future), outcome in zip(live, outcomes):
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
@@ -0,0 +1,79 @@
+"""
+Blank Page Detection Module
+
+A cheap NumPy check run on a decoded page before the OCR models. Scanned
+batches are full of blank separator sheets and empty backsides; spotting
+them from a few thousand pixels saves a full detection pass each.
+
+The page is sampled down to roughly ``sample_side`` pixels per side with
+min-pooling, so a thin pen stroke darkens its whole block instead of
+falling between sampled pixels. A page is blank when its grey levels are
+nearly uniform, or when the share of "ink" blocks, clearly darker than
+the paper, is below the ink threshold. Faint bleed-through from the other
+side of the sheet stays above the ink contrast and is not counted.
+"""
+
+from typing import Any, NamedTuple
+
+# Grey levels below the paper background that count as ink
+INK_CONTRAST = 64
+# Standard deviation (grey levels) below which a page is uniform
+UNIFORM_STD = 4.0
+
+
+class PageInk(NamedTuple):
+    """Ink statistics of a sampled page."""
+
+    coverage: float  # Share of sampled blocks that are ink
+    std: float  # Standard deviation of the sampled grey levels
+
+
+def measure_ink(image: Any, sample_side: int = 256) -> PageInk:
+    """
+    Measure ink coverage and grey-level spread of a page.
+
+    Args:
+        image: BGR or greyscale ``uint8`` array.
+        sample_side: Approximate longest side of the sampled page.
+
+    Returns:
+        PageInk with the coverage (0-1) and standard deviation.
+    """
+    import numpy as np
+
+    height, width = image.shape[:2]
+    block = max(1, max(height, width) // sample_side)
+    # Subsample rows/columns first (a view), so pooling touches few pixels
+    stride = max(1, block // 4)
+    if stride > 1:
+        image = image[::stride, ::stride]
+        block = max(1, block // stride)
+    if image.ndim == 3:
+        # Elementwise over channel views; min(axis=2) is far slower here
+        image = np.minimum.reduce([image[..., c] for c in range(image.shape[2])])
+
+    rows, cols = image.shape[0] // block, image.shape[1] // block
+    if rows and cols:
+        # Pool rows, then columns: two cheap reductions over contiguous axes
+        image = image[: rows * block, : cols * block]
+        image = image.reshape(rows, block, cols * block).min(axis=1)
+        image = image.reshape(rows, cols, block).min(axis=2)
+
+    grey = image.astype(np.int16)
+    # A high percentile, not the median: a page may be mostly ink
+    paper = int(np.percentile(grey, 90))
+    coverage = float(np.count_nonzero(grey < paper - INK_CONTRAST)) / grey.size
+    return PageInk(coverage, float(grey.std()))
+
+
+def is_blank(image: Any, threshold: float = 0.0005, sample_side: int = 256) -> bool:
+    """
+    Whether a page is blank or nearly so.
+
+    Args:
+        image: BGR or greyscale ``uint8`` array.
+        threshold: Pages whose ink coverage is below this share are blank.
+        sample_side: Approximate longest side of the sampled page.
+    """
+    ink = measure_ink(image, sample_side)
+    return ink.std < UNIFORM_STD or ink.coverage < threshold
@@ -0,0 +1,340 @@
+"""
+Model Bundle Module
+
+Pinned, checksummed model directories for offline deployment. A bundle is
+a versioned directory holding the detection, classification and
+recognition weights together with a ``manifest.json`` of SHA-256 sums.
+With ``OCRConfig.model_bundle`` set, the engine verifies the bundle and
+loads only from it, so PaddleOCR never tries to download models.
+
+Bundle layouts:
+    paddle       det/, rec/, cls/ inference model directories, keys.txt
+    onnxruntime  det.onnx, rec.onnx, cls.onnx (optional), keys.txt and
+                 any INT8 models; weights are stored as external data
+                 files (``*.onnx.data``) that ONNX Runtime can map
+                 instead of copying into every worker process
+"""
+
+import hashlib
+import json
+import logging
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    from .config import OCRConfig
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MANIFEST = "manifest.json"
+BUNDLE_FORMAT = 1
+
+# Model directories of a PaddleOCR bundle (cls is optional; without it
+# the engine turns angle classification off rather than download one)
+PADDLE_COMPONENTS = ("det", "rec", "cls")
+# Files of an ONNX bundle, besides their external data (see onnx_backend.py)
+ONNX_MODELS = ("det.onnx", "rec.onnx", "cls.onnx", "det.int8.onnx", "rec.int8.onnx")
+
+_VERSION_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelBundle:
+    """
+    A verified model bundle on disk.
+
+    Example:
+        >>> bundle = ModelBundle.load("models/2024.10")
+        >>> bundle.verify()
+        >>> print(bundle.backend, bundle.version)
+    """
+
+    def __init__(self, path: Path, manifest: Dict[str, Any]):
+        self.path = path
+        self.manifest = manifest
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ModelBundle":
+        """
+        Read a bundle's manifest.
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest.
+            ValueError: If the manifest is not a supported bundle format.
+        """
+        path = Path(path)
+        manifest_path = path / BUNDLE_MANIFEST
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Model bundle manifest not found: {manifest_path}")
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(
+                f"Unsupported model bundle format: {manifest.get('format')}"
+            )
+        return cls(path, manifest)
+
+    @property
+    def version(self) -> str:
+        return str(self.manifest.get("version", ""))
+
+    @property
+    def backend(self) -> str:
+        return str(self.manifest.get("backend", ""))
+
+    @property
+    def lang(self) -> str:
+        return str(self.manifest.get("lang", ""))
+
+    @property
+    def files(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.manifest.get("files", {}))
+
+    @property
+    def has_angle_classifier(self) -> bool:
+        """Whether the bundle holds a text direction classifier."""
+        if self.backend == "onnxruntime":
+            return (self.path / "cls.onnx").is_file()
+        return (self.path / "cls").is_dir()
+
+    def verify(self) -> None:
+        """
+        Check every file against the manifest's size and SHA-256 sum.
+
+        Raises:
+            FileNotFoundError: If a file listed in the manifest is missing.
+            ValueError: If a file's size or checksum does not match.
+        """
+        for name, entry in self.files.items():
+            path = self.path / name
+            if not path.is_file():
+                raise FileNotFoundError(f"Model bundle file missing: {path}")
+            if path.stat().st_size != entry["size"] or (
+                file_sha256(path) != entry["sha256"]
+            ):
+                raise ValueError(f"Model bundle checksum mismatch: {path}")
+
+    def paddle_kwargs(self) -> Dict[str, str]:
+        """PaddleOCR model arguments pointing into this bundle."""
+        kwargs = {}
+        for component in PADDLE_COMPONENTS:
+            if (self.path / component).is_dir():
+                kwargs[f"{component}_model_dir"] = str(self.path / component)
+        if (self.path / "keys.txt").exists():
+            kwargs["rec_char_dict_path"] = str(self.path / "keys.txt")
+        return kwargs
+
+
+def load_bundle(config: "OCRConfig") -> Optional[ModelBundle]:
+    """
+    Load and verify the bundle configured in ``config.model_bundle``.
+
+    Returns None when no bundle is configured.
+
+    Raises:
+        ValueError: If the bundle was packed for a different backend or
+                    language, or fails verification.
+    """
+    if config.model_bundle is None:
+        return None
+    bundle = ModelBundle.load(config.model_bundle)
+    if bundle.backend != config.backend:
+        raise ValueError(
+            f"Model bundle {bundle.path} is for the {bundle.backend} backend, "
+            f"not {config.backend}"
+        )
+    if bundle.lang != config.lang:
+        raise ValueError(
+            f"Model bundle {bundle.path} is for language {bundle.lang}, "
+            f"not {config.lang}"
+        )
+    bundle.verify()
+    logger.info(f"Verified model bundle {bundle.path} (version {bundle.version})")
+    return bundle
+
+
+def pack_bundle(
+    source: Union[str, Path],
+    output_root: Union[str, Path],
+    version: str,
+    lang: str = "ch",
+    external_data: bool = True,
+) -> ModelBundle:
+    """
+    Copy models into a new versioned bundle directory with checksums.
+
+    The source layout decides the backend: a directory with ``det.onnx``
+    is packed as an ONNX bundle, one with ``det/`` and ``rec/`` inference
+    model directories as a PaddleOCR bundle.
+
+    Args:
+        source: Directory with the models to pack.
+        output_root: Directory receiving ``<version>/``.
+        version: Bundle version, used as the directory name.
+        lang: Language of the recognition model.
+        external_data: Store ONNX weights as external data files so ONNX
+                       Runtime can map them (requires the onnx package;
+                       models are copied unchanged without it).
+
+    Returns:
+        The packed bundle.
+
+    Raises:
+        FileExistsError: If the bundle version already exists.
+        FileNotFoundError: If the source has no recognizable models.
+        ValueError: If the version is not a valid directory name.
+    """
+    source = Path(source)
+    if (source / "det.onnx").exists():
+        backend = "onnxruntime"
+    elif (source / "det").is_dir() and (source / "rec").is_dir():
+        backend = "paddle"
+    else:
+        raise FileNotFoundError(
+            f"No det.onnx or det/ and rec/ model directories in {source}"
+        )
+
+    def copy_models(staging: Path) -> None:
+        if backend == "onnxruntime":
+            _copy_onnx_models(source, staging, external_data)
+        else:
+            for component in PADDLE_COMPONENTS:
+                if (source / component).is_dir():
+                    _copy_files(source / component, staging / component)
+        if (source / "keys.txt").exists():
+            shutil.copy2(source / "keys.txt", staging / "keys.txt")
+
+    return _write_bundle(output_root, version, backend, lang, copy_models)
+
+
+def fetch_bundle(
+    config: "OCRConfig", output_root: Union[str, Path], version: str
+) -> ModelBundle:
+    """
+    Download PaddleOCR's models for ``config.lang`` and pack them.
+
+    Run this on a machine with network access, then copy the bundle
+    directory to the offline nodes.
+
+    Raises:
+        ImportError: If PaddleOCR is not installed.
+    """
+    try:
+        from paddleocr import PaddleOCR
+    except ImportError:
+        raise ImportError(
+            "PaddleOCR is required to fetch models. "
+            "Install it with: pip install paddlepaddle paddleocr"
+        )
+
+    # Constructing PaddleOCR downloads any models missing from its cache
+    ocr = PaddleOCR(use_angle_cls=True, lang=config.lang, show_log=config.show_log)
+    args = ocr.args
+
+    def copy_models(staging: Path) -> None:
+        for component in PADDLE_COMPONENTS:
+            model_dir = Path(getattr(args, f"{component}_model_dir"))
+            _copy_files(model_dir, staging / component)
+        shutil.copy2(args.rec_char_dict_path, staging / "keys.txt")
+
+    return _write_bundle(output_root, version, "paddle", config.lang, copy_models)
+
+
+def _write_bundle(
+    output_root: Union[str, Path],
+    version: str,
+    backend: str,
+    lang: str,
+    copy_models: Any,
+) -> ModelBundle:
+    """Fill a staging directory, write its manifest and move it into place."""
+    if not _VERSION_PATTERN.fullmatch(version):
+        raise ValueError(f"Invalid bundle version: {version!r}")
+    output_root = Path(output_root)
+    target = output_root / version
+    if target.exists():
+        raise FileExistsError(f"Model bundle already exists: {target}")
+
+    staging = output_root / f".{version}.partial"
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    try:
+        copy_models(staging)
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "version": version,
+            "backend": backend,
+            "lang": lang,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "files": {
+                path.relative_to(staging).as_posix(): {
+                    "sha256": file_sha256(path),
+                    "size": path.stat().st_size,
+                }
+                for path in sorted(staging.rglob("*"))
+                if path.is_file()
+            },
+        }
+        with open(staging / BUNDLE_MANIFEST, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        staging.rename(target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logger.info(f"Packed {backend} model bundle {target}")
+    return ModelBundle(target, manifest)
+
+
+def _copy_files(source: Path, target: Path) -> None:
+    """Copy the files (not subdirectories or archives) of a model directory."""
+    if not source.is_dir():
+        raise FileNotFoundError(f"Model directory not found: {source}")
+    target.mkdir(parents=True, exist_ok=True)
+    for path in sorted(source.iterdir()):
+        if path.is_file() and not path.name.endswith(".tar"):
+            shutil.copy2(path, target / path.name)
+
+
+def _copy_onnx_models(source: Path, target: Path, external_data: bool) -> None:
+    """Copy the ONNX models, moving their weights to external data files."""
+    onnx_module: Any = None
+    if external_data:
+        try:
+            import onnx
+        except ImportError:
+            logger.warning("onnx is not installed; copying models unchanged")
+        else:
+            onnx_module = onnx
+
+    for name in ONNX_MODELS:
+        path = source / name
+        if not path.exists():
+            continue
+        if onnx_module is None:
+            # A model saved with external data needs its weights file too
+            for file_path in (path, source / f"{name}.data"):
+                if file_path.exists():
+                    shutil.copy2(file_path, target / file_path.name)
+            continue
+        model = onnx_module.load(str(path))
+        onnx_module.save_model(
+            model,
+            str(target / name),
+            save_as_external_data=True,
+            all_tensors_to_one_file=True,
+            location=f"{name}.data",
+            size_threshold=1024,
+        )
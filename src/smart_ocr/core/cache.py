@@ -0,0 +1,118 @@
+"""
+Recognition Cache Module
+
+In-memory LRU cache for text-line recognition. Forms repeat the same printed
+labels, headers and footers on every page; caching recognition by a hash of
+the normalised crop lets those lines skip the recognition model entirely.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .profiling import EngineStats
+
+# Crops are normalised to this height before hashing
+KEY_HEIGHT = 32
+
+
+def crop_key(crop: Any) -> bytes:
+    """
+    Hash a text crop after normalising away incidental differences.
+
+    The crop is converted to grayscale, resized to ``KEY_HEIGHT`` pixels
+    high (keeping its aspect ratio), contrast-stretched and quantised to 16
+    grey levels, so the same label at a slightly different scale or
+    exposure hashes identically.
+
+    Args:
+        crop: BGR or grayscale crop array.
+
+    Returns:
+        A 16-byte BLAKE2b digest.
+    """
+    import cv2
+    import numpy as np
+
+    gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+    height, width = gray.shape[:2]
+    width = max(1, round(width * KEY_HEIGHT / max(height, 1)))
+    gray = cv2.resize(gray, (width, KEY_HEIGHT), interpolation=cv2.INTER_AREA)
+    gray = cv2.normalize(gray, np.empty_like(gray), 0, 255, cv2.NORM_MINMAX)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(width.to_bytes(4, "little"))
+    digest.update((gray >> 4).tobytes())
+    return digest.digest()
+
+
+class CropCache:
+    """
+    Thread-safe LRU mapping crop keys to (text, confidence).
+
+    Example:
+        >>> cache = CropCache(max_entries=4096)
+        >>> key = crop_key(crop)
+        >>> reading = cache.get(key)
+        >>> if reading is None:
+        ...     reading = recognize(crop)
+        ...     cache.put(key, reading)
+    """
+
+    def __init__(self, max_entries: int = 4096, stats: Optional[EngineStats] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Least recently used entries are evicted beyond this.
+            stats: Optional stats receiving the ``rec_cache_hits`` and
+                   ``rec_cache_misses`` counters, kept equal to ``hits``
+                   and ``misses``.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stats = stats
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Tuple[str, float]]:
+        """Return the cached reading for ``key``, or None on a miss."""
+        with self._lock:
+            reading = self._entries.get(key)
+            if reading is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if self.stats is not None:
+            hit = reading is not None
+            self.stats.increment("rec_cache_hits" if hit else "rec_cache_misses")
+        return reading
+
+    def put(self, key: bytes, reading: Tuple[str, float]) -> None:
+        """Store a reading, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = reading
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
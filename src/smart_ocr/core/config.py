@@ -7,7 +7,16 @@ Handles all configuration settings for the Smart OCR system.
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+# Export formats understood by the result writers
+SUPPORTED_EXPORT_FORMATS = ["txt", "json", "jsonl", "csv", "xlsx", "bin", "pdf"]
+
+# Inference backends (see core/onnx_backend.py)
+SUPPORTED_BACKENDS = ["paddle", "onnxruntime"]
+
+# Image decoders (see core/decoders.py)
+SUPPORTED_DECODERS = ["path", "opencv", "pillow"]
 
 
 @dataclass
@@ -19,6 +28,10 @@ class OCRConfig:
     use_angle_cls: bool = True  # Enable text angle classification
 
     # Performance settings
+    backend: str = "paddle"  # paddle or onnxruntime
+    onnx_model_dir: Optional[Path] = None  # det.onnx, rec.onnx, cls.onnx, keys.txt
+    quantized: bool = False  # Load det.int8.onnx / rec.int8.onnx (onnxruntime)
+    model_bundle: Optional[Path] = None  # Load only from this bundle (core/bundle.py)
     use_gpu: bool = False  # GPU acceleration
     gpu_mem: int = 500  # GPU memory limit (MB)
     cpu_threads: int = 10  # CPU thread count
@@ -33,10 +46,56 @@ class OCRConfig:
     rec_algorithm: str = "SVTR_LCNet"
     rec_batch_num: int = 6
     max_text_length: int = 25
+    drop_score: float = 0.5  # Discard lines below this confidence
+    rec_cache_size: int = 0  # LRU entries for repeated crops (0 = disabled)
+    rec_page_batch: int = 1  # Pool recognition across this many pages
+
+    # Micro-batching: gather concurrent process_image calls into one pooled
+    # pass of up to micro_batch_size images (0 = disabled), waiting at most
+    # micro_batch_wait_ms after the first request for the rest
+    micro_batch_size: int = 0
+    micro_batch_wait_ms: float = 5.0
+
+    # Threads sharing one engine: each model call checks out one of up to
+    # predictor_pool_size predictors, created on demand. Every predictor
+    # loads its own copy of the models (and cpu_threads threads)
+    predictor_pool_size: int = 1
+
+    # Image decoding
+    decoder: str = "path"  # path (PaddleOCR reads the file), opencv, pillow
+    decode_max_side: Optional[int] = None  # Decode directly to this size
+    mmap_min_mb: float = 16.0  # Memory-map uncompressed files this large
+
+    # Two-pass cascade: OCR a downscaled image, then re-recognize lines
+    # below cascade_threshold from the full-resolution image
+    cascade: bool = False
+    cascade_max_side: int = 960
+    cascade_threshold: float = 0.85
+
+    # Blank pages: skip OCR for pages whose ink coverage (share of the
+    # sampled page clearly darker than the paper) is below blank_threshold
+    skip_blank: bool = False
+    blank_threshold: float = 0.0005
+
+    # Domain lexicon (one term per line, see core/lexicon.py): recognized
+    # text within lexicon_max_distance edits of a term is corrected to it
+    lexicon: Optional[Path] = None
+    lexicon_max_distance: int = 1
+
+    # Text normalization (see core/normalize.py), applied before the
+    # lexicon: full-width digits, letters and spaces to half-width, and
+    # script conversion from an OpenCC-format dictionary file or directory
+    normalize_width: bool = False
+    conversion_dict: Optional[Path] = None
+
+    # Form template (JSON file of named regions, see core/template.py)
+    template: Optional[Path] = None
 
     # Output settings
     output_dir: Path = field(default_factory=lambda: Path("output"))
-    export_formats: List[str] = field(default_factory=lambda: ["txt", "json", "csv", "xlsx"])
+    export_formats: List[str] = field(
+        default_factory=lambda: list(SUPPORTED_EXPORT_FORMATS)
+    )
 
     # Logging
     enable_mkldnn: bool = False
@@ -46,9 +105,56 @@ class OCRConfig:
         """Validate and process configuration after initialization."""
         self.output_dir = Path(self.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.template is not None:
+            self.template = Path(self.template)
+        if self.onnx_model_dir is not None:
+            self.onnx_model_dir = Path(self.onnx_model_dir)
+        if self.model_bundle is not None:
+            self.model_bundle = Path(self.model_bundle)
+        if self.lexicon is not None:
+            self.lexicon = Path(self.lexicon)
+        if self.conversion_dict is not None:
+            self.conversion_dict = Path(self.conversion_dict)
+
+        if self.backend not in SUPPORTED_BACKENDS:
+            raise ValueError(
+                f"Invalid backend: {self.backend}. Valid: {SUPPORTED_BACKENDS}"
+            )
+        if self.backend == "onnxruntime" and (
+            self.onnx_model_dir is None and self.model_bundle is None
+        ):
+            raise ValueError(
+                "onnx_model_dir or model_bundle is required for the onnxruntime backend"
+            )
+        if self.quantized and self.backend != "onnxruntime":
+            raise ValueError("quantized models require the onnxruntime backend")
+
+        if self.decoder not in SUPPORTED_DECODERS:
+            raise ValueError(
+                f"Invalid decoder: {self.decoder}. Valid: {SUPPORTED_DECODERS}"
+            )
+
+        if self.rec_page_batch < 1:
+            raise ValueError("rec_page_batch must be at least 1")
+        if self.rec_cache_size < 0:
+            raise ValueError("rec_cache_size must not be negative")
+        if self.micro_batch_size < 0:
+            raise ValueError("micro_batch_size must not be negative")
+        if self.micro_batch_wait_ms < 0:
+            raise ValueError("micro_batch_wait_ms must not be negative")
+        if self.predictor_pool_size < 1:
+            raise ValueError("predictor_pool_size must be at least 1")
+        if self.cascade_max_side < 1:
+            raise ValueError("cascade_max_side must be positive")
+        if not 0.0 <= self.cascade_threshold <= 1.0:
+            raise ValueError("cascade_threshold must be between 0 and 1")
+        if self.lexicon_max_distance < 0:
+            raise ValueError("lexicon_max_distance must not be negative")
+        if not 0.0 <= self.blank_threshold <= 1.0:
+            raise ValueError("blank_threshold must be between 0 and 1")
 
         # Validate export formats
-        valid_formats = {"txt", "json", "csv", "xlsx"}
+        valid_formats = set(SUPPORTED_EXPORT_FORMATS)
         for fmt in self.export_formats:
             if fmt not in valid_formats:
                 raise ValueError(
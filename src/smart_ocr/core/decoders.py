@@ -0,0 +1,324 @@
+"""
+Image Decoders Module
+
+Pluggable image loading in front of the OCR engine. Besides handing the
+file path to PaddleOCR (the original behaviour), decoders can decode
+straight to a reduced size (JPEG draft mode / DCT scaling) and memory-map
+large uncompressed TIFF/BMP files instead of reading them in full.
+
+All decoders produce BGR ``uint8`` arrays, the layout PaddleOCR expects.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+# Pillow raw modes that can be viewed directly as an array, with channel count
+_RAW_CHANNELS = {
+    "L": 1,
+    "BGR": 3,
+    "RGB": 3,
+    "BGRX": 4,
+    "BGRA": 4,
+    "RGBX": 4,
+    "RGBA": 4,
+}
+
+
+@dataclass
+class DecodedImage:
+    """
+    A decoded image ready for the OCR engine.
+
+    Attributes:
+        data: BGR array, or the file path when PaddleOCR should read it.
+        scale: Decoded size divided by original size (1.0 = full size).
+        original_size: (width, height) of the source image, if known.
+    """
+
+    data: Any
+    scale: float = 1.0
+    original_size: Optional[Tuple[int, int]] = None
+
+    @property
+    def is_array(self) -> bool:
+        return not isinstance(self.data, str)
+
+
+def _target_scale(size: Tuple[int, int], max_side: Optional[int]) -> float:
+    """Scale factor that fits ``size`` within ``max_side`` (never upscales)."""
+    longest = max(size)
+    if not max_side or longest <= max_side:
+        return 1.0
+    return max_side / longest
+
+
+def _scaled_size(size: Tuple[int, int], scale: float) -> Tuple[int, int]:
+    """Apply a scale factor to a (width, height) size."""
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _resize_to(image: Any, size: Tuple[int, int]) -> Any:
+    """
+    Downscale a BGR array to (width, height).
+
+    Large reductions first take OpenCV's fast integer-factor INTER_AREA
+    path; the remaining (< 2x) step uses bilinear interpolation.
+    """
+    import cv2
+
+    height, width = image.shape[:2]
+    if (width, height) == size:
+        return image
+    factor = int(min(width / size[0], height / size[1]))
+    if factor >= 2:
+        image = cv2.resize(
+            image,
+            (width // factor, height // factor),
+            interpolation=cv2.INTER_AREA,
+        )
+        if (image.shape[1], image.shape[0]) == size:
+            return image
+    return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+
+
+class ImageDecoder:
+    """Base class for image decoders."""
+
+    name: str = ""
+
+    def __init__(self, max_side: Optional[int] = None, mmap_min_mb: float = 16.0):
+        """
+        Initialize the decoder.
+
+        Args:
+            max_side: Decode so the longest side is at most this many pixels.
+                     None keeps the full resolution.
+            mmap_min_mb: Memory-map uncompressed files at least this large.
+        """
+        self.max_side = max_side
+        self.mmap_min_bytes = int(mmap_min_mb * 1024 * 1024)
+
+    def decode(self, image_path: Path, as_array: bool = False) -> DecodedImage:
+        """
+        Decode an image file.
+
+        Args:
+            image_path: Path to the image file.
+            as_array: Always return pixel data, even for path-based decoding.
+
+        Raises:
+            ValueError: If the file cannot be decoded.
+        """
+        raise NotImplementedError
+
+
+class PathDecoder(ImageDecoder):
+    """
+    Let PaddleOCR read the file itself (the original behaviour).
+
+    Falls back to OpenCV decoding when pixels are needed or a reduced
+    decode size is configured.
+    """
+
+    name = "path"
+
+    def decode(self, image_path: Path, as_array: bool = False) -> DecodedImage:
+        if not as_array and not self.max_side:
+            return DecodedImage(str(image_path))
+        return OpenCVDecoder(self.max_side).decode(image_path)
+
+
+class OpenCVDecoder(ImageDecoder):
+    """
+    Decode with OpenCV.
+
+    When downscaling, uses the IMREAD_REDUCED_* flags, which decode JPEGs
+    directly at 1/2, 1/4 or 1/8 size through libjpeg DCT scaling.
+    """
+
+    name = "opencv"
+
+    def decode(self, image_path: Path, as_array: bool = False) -> DecodedImage:
+        import cv2
+        import numpy as np
+
+        size = _header_size(image_path)
+        scale = _target_scale(size, self.max_side) if size else 1.0
+        flag = cv2.IMREAD_COLOR
+        for factor, reduced in (
+            (8, cv2.IMREAD_REDUCED_COLOR_8),
+            (4, cv2.IMREAD_REDUCED_COLOR_4),
+            (2, cv2.IMREAD_REDUCED_COLOR_2),
+        ):
+            if scale <= 1.0 / factor:
+                flag = reduced
+                break
+
+        # np.fromfile + imdecode also handles non-ASCII paths on Windows
+        data = np.fromfile(str(image_path), dtype=np.uint8)
+        image = cv2.imdecode(data, flag)
+        if image is None:
+            raise ValueError(f"Cannot decode image: {image_path}")
+
+        original = size or (image.shape[1], image.shape[0])
+        if (image.shape[1] > image.shape[0]) != (original[0] > original[1]):
+            # imdecode applied an EXIF rotation that swapped the axes
+            original = (original[1], original[0])
+        image = _resize_to(image, _scaled_size(original, scale))
+        return DecodedImage(image, scale, original)
+
+
+class PillowDecoder(ImageDecoder):
+    """
+    Decode with Pillow.
+
+    JPEGs are decoded in draft mode (DCT scaling) close to the target size
+    before the final resize. Large uncompressed TIFF/BMP files are
+    memory-mapped copy-on-write, so pixel data is paged in on demand and
+    never duplicated into a separate read buffer.
+    """
+
+    name = "pillow"
+
+    def decode(self, image_path: Path, as_array: bool = False) -> DecodedImage:
+        try:
+            from PIL import Image, ImageOps
+        except ImportError:
+            raise ImportError(
+                "Pillow is required for the pillow decoder. "
+                "Install it with: pip install Pillow"
+            )
+        import cv2
+        import numpy as np
+
+        try:
+            img: Image.Image = Image.open(image_path)
+        except (OSError, SyntaxError) as e:
+            raise ValueError(f"Cannot decode image: {image_path}: {e}")
+
+        with img:
+            original = img.size
+            scale = _target_scale(original, self.max_side)
+            target = _scaled_size(original, scale)
+
+            if Path(image_path).stat().st_size >= self.mmap_min_bytes:
+                image = _map_raw(Path(image_path), img, target)
+                if image is not None:
+                    logger.debug(f"Memory-mapped {image_path}")
+                    return DecodedImage(image, scale, original)
+
+            if img.format == "JPEG" and scale < 1.0:
+                img.draft("RGB", target)
+            orientation = img.getexif().get(0x0112, 1)
+            if orientation != 1:
+                img = ImageOps.exif_transpose(img)
+            rgb = np.asarray(img if img.mode == "RGB" else img.convert("RGB"))
+
+        # EXIF orientations 5-8 swap width and height
+        if orientation in (5, 6, 7, 8):
+            original, target = (original[1], original[0]), (target[1], target[0])
+        image = _resize_to(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR), target)
+        return DecodedImage(image, scale, original)
+
+
+def _header_size(image_path: Path) -> Optional[Tuple[int, int]]:
+    """Read (width, height) from the file header without decoding pixels."""
+    try:
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            return img.size
+    except Exception:
+        return None
+
+
+def _map_raw(image_path: Path, img: Any, size: Tuple[int, int]) -> Optional[Any]:
+    """
+    Memory-map the pixel data of an uncompressed image and return it as a
+    BGR array of the given (width, height).
+
+    Resizing and colour conversion run on the mapped pages directly, so the
+    file is never copied into a separate read buffer. Returns None when the
+    file is not one contiguous raw buffer in a supported pixel layout.
+    """
+    import cv2
+    import numpy as np
+
+    tiles = sorted(img.tile, key=lambda t: (t[1][1], t[1][0]))
+    if not tiles or any(t[0] != "raw" for t in tiles):
+        return None
+
+    args = tuple(tiles[0][3]) + (0, 1)
+    rawmode, stride, orientation = args[0], args[1], args[2]
+    channels = _RAW_CHANNELS.get(rawmode)
+    if channels is None:
+        return None
+
+    width, height = img.size
+    stride = stride or width * channels
+    base = tiles[0][2]
+    for tile in tiles:
+        left, top, right, _bottom = tile[1]
+        if tile[3] != tiles[0][3] or left != 0 or right != width:
+            return None
+        if orientation > 0 and tile[2] != base + top * stride:
+            return None
+    if orientation < 0 and len(tiles) != 1:
+        return None
+
+    mapped = np.memmap(
+        image_path, dtype=np.uint8, mode="c", offset=base, shape=(height, stride)
+    )
+    pixels = mapped[:, : width * channels].reshape(height, width, channels)
+
+    image = _resize_to(pixels, size)
+    conversion = {
+        "L": cv2.COLOR_GRAY2BGR,
+        "RGB": cv2.COLOR_RGB2BGR,
+        "RGBX": cv2.COLOR_RGBA2BGR,
+        "RGBA": cv2.COLOR_RGBA2BGR,
+        "BGRX": cv2.COLOR_BGRA2BGR,
+        "BGRA": cv2.COLOR_BGRA2BGR,
+    }.get(rawmode)
+    if conversion is not None:
+        image = cv2.cvtColor(image, conversion)
+    if orientation < 0:
+        # Bottom-up rows (BMP): flip after the reduction, on the small image
+        image = image[::-1]
+    return np.ascontiguousarray(image)
+
+
+DECODERS: Dict[str, Type[ImageDecoder]] = {
+    "path": PathDecoder,
+    "opencv": OpenCVDecoder,
+    "pillow": PillowDecoder,
+}
+
+
+def create_decoder(
+    name: str = "path",
+    max_side: Optional[int] = None,
+    mmap_min_mb: float = 16.0,
+) -> ImageDecoder:
+    """
+    Create an image decoder by name ('path', 'opencv' or 'pillow').
+
+    Args:
+        name: Decoder name.
+        max_side: Decode so the longest side is at most this many pixels.
+        mmap_min_mb: Memory-map uncompressed files at least this large.
+    """
+    try:
+        decoder_class = DECODERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown decoder: {name}. Valid: {sorted(DECODERS)}")
+    return decoder_class(max_side=max_side, mmap_min_mb=mmap_min_mb)
+
+
+def load_image(image_path: Union[str, Path]) -> Any:
+    """Decode an image file into a full-resolution BGR array."""
+    return OpenCVDecoder().decode(Path(image_path)).data
@@ -0,0 +1,118 @@
+"""
+File Discovery Module
+
+Streaming discovery of input images. Directories are walked with
+``os.scandir``, whose ``DirEntry`` objects carry the file type from the
+directory listing itself, so no per-file ``stat`` call is needed and the
+first image reaches the engine as soon as its directory has been listed.
+Explicit file lists (``--files-from``) are read lazily, line by line.
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .sharding import shard_of
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTENSIONS = [".png", ".jpg", ".jpeg", ".bmp", ".tiff"]
+
+
+def normalize_extensions(extensions: Optional[Iterable[str]] = None) -> List[str]:
+    """Lower-case extensions with a leading dot (default: common images)."""
+    return [
+        ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+        for ext in (extensions or DEFAULT_EXTENSIONS)
+    ]
+
+
+def iter_images(
+    directory: Union[str, Path],
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = False,
+    shard: Optional[Tuple[int, int]] = None,
+    sort: bool = True,
+) -> Iterator[Path]:
+    """
+    Yield the image files in a directory as they are discovered.
+
+    With ``sort`` each directory's entries are sorted by name and
+    subdirectories are descended in place, which yields exactly the order
+    of ``sorted()`` over all paths while holding only one directory
+    listing per level in memory. Without it, files are yielded in
+    directory-listing order, so even a directory of millions of entries
+    starts producing immediately.
+
+    Args:
+        directory: Directory to search.
+        extensions: File extensions to include.
+        recursive: Whether to descend into subdirectories.
+        shard: Optional (index, count); keep only that shard's files.
+        sort: Yield paths in sorted order.
+
+    Raises:
+        NotADirectoryError: If ``directory`` is not a directory.
+    """
+    root = Path(directory)
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {root}")
+    suffixes = set(normalize_extensions(extensions))
+    root_str = str(root)
+
+    def walk(path: str) -> Iterator[Path]:
+        try:
+            with os.scandir(path) as it:
+                if not sort:
+                    yield from visit(it)
+                    return
+                # Listing closed before descending: one open handle at a time
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"Cannot scan {path}: {e}")
+            return
+        yield from visit(entries)
+
+    def visit(entries: Iterable["os.DirEntry[str]"]) -> Iterator[Path]:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from walk(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in suffixes:
+                continue
+            if shard is not None and (
+                shard_of(os.path.relpath(entry.path, root_str), shard[1]) != shard[0]
+            ):
+                continue
+            yield Path(entry.path)
+
+    return walk(root_str)
+
+
+def read_file_list(source: Union[str, Path, IO[str]]) -> Iterator[Path]:
+    """
+    Yield the paths listed in a file, one per line.
+
+    Args:
+        source: Path of the list file, ``-`` for standard input, or an
+                open text stream. Blank lines are skipped; surrounding
+                whitespace is kept, as it may be part of a file name.
+    """
+    if isinstance(source, (str, Path)) and str(source) == "-":
+        source = sys.stdin
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from read_file_list(f)
+        return
+    for line in source:
+        line = line.rstrip("\r\n")
+        if line:
+            yield Path(line)
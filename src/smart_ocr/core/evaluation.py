@@ -0,0 +1,353 @@
+"""
+Evaluation Module
+
+Golden-corpus regression harness. Runs a labelled corpus (images with
+ground-truth text) through the engine, scores character and word error
+rates alongside throughput, and compares the run against a stored baseline
+so accuracy and speed regressions are caught together.
+
+Corpus layout: each image has a UTF-8 ground-truth file next to it with
+the same stem and a ``.gt.txt`` suffix, e.g. ``form_001.png`` and
+``form_001.gt.txt``.
+
+Words for WER are whitespace-separated runs, except that every CJK
+character counts as a word of its own: Chinese and Japanese are written
+without spaces, so an unspaced line would otherwise be a single word.
+"""
+
+import json
+import logging
+import platform
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+GROUND_TRUTH_SUFFIX = ".gt.txt"
+
+# Han ideographs (with extension A and compatibility forms) and kana
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_WORD = re.compile(f"[{_CJK}]|[^\\s{_CJK}]+")
+
+
+def edit_distance(reference: Sequence[Any], hypothesis: Sequence[Any]) -> int:
+    """Levenshtein distance between two sequences (characters or words)."""
+    if len(reference) < len(hypothesis):
+        reference, hypothesis = hypothesis, reference
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_item in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_item in enumerate(hypothesis, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_item != hyp_item),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def normalize_text(text: str) -> str:
+    """Collapse all whitespace (including line breaks) to single spaces."""
+    return " ".join(text.split())
+
+
+def tokenize_words(text: str) -> List[str]:
+    """
+    Split text into words for WER.
+
+    Example:
+        >>> tokenize_words("存款帳號 NT$1,200 total")
+        ['存', '款', '帳', '號', 'NT$1,200', 'total']
+    """
+    return _WORD.findall(text)
+
+
+def character_errors(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """(character edits, reference characters) after normalizing whitespace."""
+    reference, hypothesis = normalize_text(reference), normalize_text(hypothesis)
+    return edit_distance(reference, hypothesis), len(reference)
+
+
+def word_errors(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """(word edits, reference words), with words from ``tokenize_words``."""
+    ref_words = tokenize_words(reference)
+    return edit_distance(ref_words, tokenize_words(hypothesis)), len(ref_words)
+
+
+def character_error_rate(reference: str, hypothesis: str) -> float:
+    """CER: character edits divided by reference length."""
+    errors, chars = character_errors(reference, hypothesis)
+    if not chars:
+        return 0.0 if not errors else 1.0
+    return errors / chars
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """WER: word edits divided by the number of reference words."""
+    errors, words = word_errors(reference, hypothesis)
+    if not words:
+        return 0.0 if not errors else 1.0
+    return errors / words
+
+
+@dataclass
+class FileScore:
+    """Accuracy and timing for one corpus file."""
+
+    source_file: str
+    char_errors: int
+    chars: int
+    word_errors: int
+    words: int
+    seconds: float
+
+    @property
+    def cer(self) -> float:
+        return self.char_errors / self.chars if self.chars else 0.0
+
+    @property
+    def wer(self) -> float:
+        return self.word_errors / self.words if self.words else 0.0
+
+
+@dataclass
+class EvaluationReport:
+    """Scores for a whole corpus run; also the stored baseline format."""
+
+    files: List[FileScore] = field(default_factory=list)
+    seconds: float = 0.0
+    environment: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def cer(self) -> float:
+        """Overall CER: total character edits over total reference characters."""
+        chars = sum(f.chars for f in self.files)
+        return sum(f.char_errors for f in self.files) / chars if chars else 0.0
+
+    @property
+    def wer(self) -> float:
+        """Overall WER: total word edits over total reference words."""
+        words = sum(f.words for f in self.files)
+        return sum(f.word_errors for f in self.files) / words if words else 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return len(self.files) / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "summary": {
+                "files": len(self.files),
+                "cer": self.cer,
+                "wer": self.wer,
+                "seconds": self.seconds,
+                "images_per_second": self.images_per_second,
+            },
+            "environment": dict(self.environment),
+            "files": [asdict(f) for f in self.files],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvaluationReport":
+        """Create a report from its dictionary form (see ``to_dict``)."""
+        return cls(
+            files=[FileScore(**item) for item in data.get("files", [])],
+            seconds=float(data.get("summary", {}).get("seconds", 0.0)),
+            environment=dict(data.get("environment", {})),
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the report as a JSON baseline."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EvaluationReport":
+        """Load a JSON baseline written by ``save``."""
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Baseline not found: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_corpus(
+    directory: Union[str, Path], extensions: Optional[List[str]] = None
+) -> List[Tuple[Path, str]]:
+    """
+    Collect (image path, ground truth) pairs from a corpus directory.
+
+    Images without a ``.gt.txt`` file are skipped with a warning.
+
+    Raises:
+        NotADirectoryError: If the corpus directory does not exist.
+        ValueError: If no labelled images are found.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory}")
+
+    extensions = extensions or [".png", ".jpg", ".jpeg", ".bmp", ".tiff"]
+    corpus = []
+    for image_path in sorted(directory.rglob("*")):
+        if not image_path.is_file() or image_path.suffix.lower() not in extensions:
+            continue
+        truth_path = image_path.with_name(image_path.stem + GROUND_TRUTH_SUFFIX)
+        if not truth_path.exists():
+            logger.warning(f"No ground truth for {image_path}, skipping")
+            continue
+        corpus.append((image_path, truth_path.read_text(encoding="utf-8")))
+
+    if not corpus:
+        raise ValueError(f"No labelled images found in {directory}")
+    return corpus
+
+
+def evaluate(
+    engine: Any,
+    corpus: List[Tuple[Path, str]],
+    root: Optional[Union[str, Path]] = None,
+    record_host: bool = False,
+) -> EvaluationReport:
+    """
+    Run every corpus image through ``engine`` and score the output.
+
+    Models are loaded before timing starts, so throughput reflects steady
+    state processing. A file that fails to process scores as fully wrong.
+
+    Args:
+        engine: OCREngine (or compatible) to evaluate.
+        corpus: (image path, ground truth) pairs from ``load_corpus``.
+        root: Corpus directory; file names in the report are stored
+              relative to it so baselines are portable across machines.
+        record_host: Also store the host name in the report environment.
+                     Off by default, as baselines are often shared.
+    """
+    if root is not None:
+        root = Path(root)
+    engine.warmup()
+    environment = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+    if record_host:
+        environment["node"] = platform.node()
+    report = EvaluationReport(environment=environment)
+
+    start = time.perf_counter()
+    for image_path, truth in corpus:
+        file_start = time.perf_counter()
+        try:
+            text = engine.process_image(image_path).text
+        except Exception as e:
+            logger.error(f"Failed to process {image_path}: {e}")
+            text = ""
+        elapsed = time.perf_counter() - file_start
+
+        char_edits, chars = character_errors(truth, text)
+        word_edits, words = word_errors(truth, text)
+        report.files.append(
+            FileScore(
+                source_file=(
+                    image_path.relative_to(root).as_posix()
+                    if root is not None
+                    else str(image_path)
+                ),
+                char_errors=char_edits,
+                chars=chars,
+                word_errors=word_edits,
+                words=words,
+                seconds=elapsed,
+            )
+        )
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def compare(
+    report: EvaluationReport,
+    baseline: EvaluationReport,
+    cer_tolerance: float = 0.005,
+    wer_tolerance: float = 0.01,
+    speed_tolerance: float = 0.10,
+) -> List[str]:
+    """
+    Compare a run against a baseline.
+
+    Args:
+        report: The current run.
+        baseline: The stored baseline run.
+        cer_tolerance: Allowed absolute CER increase (0.005 = 0.5 points).
+        wer_tolerance: Allowed absolute WER increase.
+        speed_tolerance: Allowed relative throughput drop (0.10 = 10%).
+
+    Returns:
+        Human-readable regressions; empty when the run is within tolerance.
+    """
+    regressions = []
+    if report.cer > baseline.cer + cer_tolerance:
+        regressions.append(
+            f"CER {report.cer:.4f} exceeds baseline {baseline.cer:.4f} "
+            f"+ {cer_tolerance:g}"
+        )
+    if report.wer > baseline.wer + wer_tolerance:
+        regressions.append(
+            f"WER {report.wer:.4f} exceeds baseline {baseline.wer:.4f} "
+            f"+ {wer_tolerance:g}"
+        )
+    minimum_speed = baseline.images_per_second * (1.0 - speed_tolerance)
+    if report.images_per_second < minimum_speed:
+        regressions.append(
+            f"Throughput {report.images_per_second:.2f} img/s is below baseline "
+            f"{baseline.images_per_second:.2f} img/s - {speed_tolerance:.0%}"
+        )
+    return regressions
+
+
+def format_tradeoff(report: EvaluationReport, baseline: EvaluationReport) -> str:
+    """
+    Summarise the accuracy/speed trade-off of a run against a baseline,
+    e.g. an INT8 model run against the FP32 baseline.
+    """
+    speedup = (
+        report.images_per_second / baseline.images_per_second
+        if baseline.images_per_second
+        else 0.0
+    )
+    cer_delta = report.cer - baseline.cer
+    wer_delta = report.wer - baseline.wer
+    return (
+        f"CER {baseline.cer:.4f} -> {report.cer:.4f} ({cer_delta:+.4f}), "
+        f"WER {baseline.wer:.4f} -> {report.wer:.4f} ({wer_delta:+.4f}), "
+        f"throughput {baseline.images_per_second:.2f} -> "
+        f"{report.images_per_second:.2f} img/s ({speedup:.2f}x)"
+    )
+
+
+def worsened_files(
+    report: EvaluationReport, baseline: EvaluationReport, tolerance: float = 0.0
+) -> List[Tuple[str, float, float]]:
+    """
+    List files whose CER rose by more than ``tolerance`` since the baseline.
+
+    Returns:
+        (source file, baseline CER, current CER), worst increase first.
+    """
+    previous = {f.source_file: f.cer for f in baseline.files}
+    worse = [
+        (f.source_file, previous[f.source_file], f.cer)
+        for f in report.files
+        if f.source_file in previous and f.cer > previous[f.source_file] + tolerance
+    ]
+    return sorted(worse, key=lambda item: item[1] - item[2])
@@ -0,0 +1,142 @@
+"""
+Shared Image Ring Module
+
+A ring of fixed-size ``multiprocessing.shared_memory`` slots for handing
+decoded images to worker processes. The parent copies each decoded image
+into a free slot and sends only a small ``ImageHandle`` (slot, shape,
+dtype); the worker maps the slot as a NumPy array without copying, so
+large scans are never pickled through a pipe.
+"""
+
+import logging
+import math
+from collections import deque
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Deque, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ImageHandle(NamedTuple):
+    """Location of an image in a SharedImageRing."""
+
+    slot: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class SharedImageRing:
+    """
+    Fixed-size image slots in one shared memory block.
+
+    The creating process owns the block: it hands out slots with
+    ``acquire``/``release`` and unlinks the block when done. Other
+    processes ``attach`` by name and only read slots.
+
+    Example:
+        >>> ring = SharedImageRing(slots=4, slot_bytes=64 << 20)
+        >>> slot = ring.acquire()
+        >>> handle = ring.write(slot, image)
+        >>> # in the worker:
+        >>> worker_ring = SharedImageRing.attach(ring.name, 4, 64 << 20)
+        >>> image = worker_ring.view(handle)
+    """
+
+    def __init__(self, slots: int, slot_bytes: int, name: Optional[str] = None):
+        """
+        Create a ring, or attach to an existing one when ``name`` is given.
+
+        Args:
+            slots: Number of image slots.
+            slot_bytes: Capacity of each slot in bytes.
+            name: Name of an existing ring's shared memory block.
+        """
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        if slot_bytes < 1:
+            raise ValueError("slot_bytes must be positive")
+
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.owner = name is None
+        if self.owner:
+            self._shm = SharedMemory(create=True, size=slots * slot_bytes)
+        else:
+            self._shm = SharedMemory(name=name)
+        self._free: Deque[int] = deque(range(slots) if self.owner else ())
+        self._linked = self.owner
+
+    @classmethod
+    def attach(cls, name: str, slots: int, slot_bytes: int) -> "SharedImageRing":
+        """Attach to a ring created by another process."""
+        return cls(slots, slot_bytes, name=name)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def acquire(self) -> Optional[int]:
+        """Take a free slot, or return None if every slot is in use."""
+        return self._free.popleft() if self._free else None
+
+    def release(self, slot: int) -> None:
+        """Return a slot to the free list."""
+        self._free.append(slot)
+
+    def fits(self, array: Any) -> bool:
+        """Whether an array fits in one slot."""
+        return int(array.nbytes) <= self.slot_bytes
+
+    def write(self, slot: int, array: Any) -> ImageHandle:
+        """
+        Copy an array into a slot.
+
+        Raises:
+            ValueError: If the array is larger than a slot.
+        """
+        import numpy as np
+
+        if not self.fits(array):
+            raise ValueError(
+                f"Image of {array.nbytes} bytes exceeds the {self.slot_bytes} "
+                f"byte shared memory slot"
+            )
+        handle = ImageHandle(slot, tuple(array.shape), array.dtype.str)
+        np.copyto(self.view(handle), array, casting="no")
+        return handle
+
+    def view(self, handle: ImageHandle) -> Any:
+        """
+        Map a slot as an array, without copying.
+
+        The array holds a buffer export on the block, so the block stays
+        mapped for as long as the array is alive (see ``close``).
+        """
+        import numpy as np
+
+        buffer = self._shm.buf
+        if buffer is None:
+            raise ValueError("Shared image ring is closed")
+        return np.frombuffer(
+            buffer,
+            dtype=np.dtype(handle.dtype),
+            count=math.prod(handle.shape),
+            offset=handle.slot * self.slot_bytes,
+        ).reshape(handle.shape)
+
+    def close(self) -> None:
+        """
+        Detach from the block; the owner also unlinks it.
+
+        Arrays returned by ``view`` should be released first. While one is
+        alive the block cannot be unmapped: it stays mapped, with a
+        warning, until ``close`` is called again after the arrays are
+        gone. The owner unlinks the block either way.
+        """
+        try:
+            self._shm.close()
+        except BufferError:
+            logger.warning(f"Shared image ring {self.name} still has live views")
+        if self._linked:
+            self._linked = False
+            self._shm.unlink()
@@ -0,0 +1,204 @@
+"""
+Layout Module
+
+Reading order for the text lines of a page. Box bounds are held as NumPy
+arrays and split with a recursive XY-cut: a region is first cut into
+columns at vertical gutters (x ranges no box covers), and a region
+without a gutter is cut into blocks at wide horizontal gaps. Each cut is
+one sort and a cumulative maximum over the region's boxes, so a page is
+ordered in O(n log n) per cut level, without comparing boxes pairwise.
+
+A gutter only separates columns when every side holds several rows and
+the rows of neighbouring sides do not line up. Rows that line up across
+a gutter are a form or table (labels and values, cells), read row by row.
+
+Inside a block, boxes whose vertical centres lie within half a line
+height of the previous box form a row, read left to right.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence
+
+Box = Sequence[Sequence[float]]
+
+
+@dataclass
+class PageLayout:
+    """
+    Reading order of a page's text lines, as indices into its lines.
+
+    Attributes:
+        columns: Regions separated by vertical gutters, in reading order.
+                 Each column is a list of paragraphs, each paragraph a
+                 list of rows and each row a list of line indices. A
+                 block spanning several columns (e.g. a title) forms a
+                 column of its own.
+    """
+
+    columns: List[List[List[List[int]]]] = field(default_factory=list)
+
+    @property
+    def paragraphs(self) -> List[List[int]]:
+        """Line indices of each paragraph, in reading order."""
+        return [
+            [index for row in paragraph for index in row]
+            for column in self.columns
+            for paragraph in column
+        ]
+
+    @property
+    def rows(self) -> List[List[int]]:
+        """Line indices of each row, left to right."""
+        return [
+            row for column in self.columns for paragraph in column for row in paragraph
+        ]
+
+    @property
+    def order(self) -> List[int]:
+        """All line indices in reading order."""
+        return [index for row in self.rows for index in row]
+
+
+def analyze_layout(
+    boxes: Sequence[Box],
+    column_gap: float = 1.5,
+    paragraph_gap: float = 0.8,
+    row_tolerance: float = 0.5,
+) -> PageLayout:
+    """
+    Group text boxes into rows, paragraphs and columns in reading order.
+
+    Gaps are measured in median box heights, so the same thresholds work
+    at any resolution.
+
+    Args:
+        boxes: Four (x, y) corners of each text line.
+        column_gap: Narrowest vertical gutter that separates columns.
+        paragraph_gap: Narrowest horizontal gap that separates blocks.
+        row_tolerance: Largest centre offset between boxes of one row.
+
+    Returns:
+        PageLayout indexing into ``boxes``.
+    """
+    import numpy as np
+
+    if not len(boxes):
+        return PageLayout()
+
+    try:
+        points = np.asarray(boxes, dtype=np.float64).reshape(len(boxes), -1, 2)
+        low, high = points.min(axis=1), points.max(axis=1)
+    except ValueError:
+        # Boxes with differing point counts: take each one's bounds
+        bounds = [np.asarray(box, dtype=np.float64).reshape(-1, 2) for box in boxes]
+        low = np.array([box.min(axis=0) for box in bounds])
+        high = np.array([box.max(axis=0) for box in bounds])
+    x0, y0, x1, y1 = low[:, 0], low[:, 1], high[:, 0], high[:, 1]
+    height = max(float(np.median(y1 - y0)), 1.0)
+
+    cutter = _Cutter(
+        x0,
+        x1,
+        y0,
+        y1,
+        column_gap=column_gap * height,
+        paragraph_gap=paragraph_gap * height,
+        row_tolerance=row_tolerance * height,
+    )
+    return PageLayout(cutter.cut(np.arange(len(boxes))))
+
+
+class _Cutter:
+    """Recursive XY-cut over the bounds of one page's boxes."""
+
+    def __init__(
+        self,
+        x0: Any,
+        x1: Any,
+        y0: Any,
+        y1: Any,
+        column_gap: float,
+        paragraph_gap: float,
+        row_tolerance: float,
+    ):
+        self.x0, self.x1, self.y0, self.y1 = x0, x1, y0, y1
+        self.center = (y0 + y1) / 2
+        self.column_gap = column_gap
+        self.paragraph_gap = paragraph_gap
+        self.row_tolerance = row_tolerance
+
+    def cut(self, index: Any) -> List[List[List[List[int]]]]:
+        """Columns of paragraphs of rows for the boxes in ``index``."""
+        parts = _split(index, self.x0, self.x1, self.column_gap)
+        if len(parts) > 1 and self._are_columns(parts):
+            return [column for part in parts for column in self.cut(part)]
+
+        parts = _split(index, self.y0, self.y1, self.paragraph_gap)
+        if len(parts) == 1:
+            return [[self._rows(index)]]
+
+        # Consecutive single-column blocks continue the same column
+        columns: List[List[List[List[int]]]] = []
+        extend = False
+        for part in parts:
+            sub = self.cut(part)
+            if len(sub) == 1 and extend:
+                columns[-1].extend(sub[0])
+            else:
+                columns.extend(sub)
+            extend = len(sub) == 1
+        return columns
+
+    def _are_columns(self, parts: List[Any], aligned: float = 0.8) -> bool:
+        """
+        Whether the sides of vertical gutters are columns of text.
+
+        A side of a single row is a label or a note, not a column, and
+        neighbouring sides whose rows mostly line up (``aligned`` of the
+        shorter side) are the cells of a form or table.
+        """
+        import numpy as np
+
+        centers = []
+        for part in parts:
+            rows = self._rows(part)
+            if len(rows) < 2:
+                return False
+            centers.append(np.array([self.center[row].mean() for row in rows]))
+
+        for left, right in zip(centers, centers[1:]):
+            short, long = sorted((left, right), key=len)
+            long = np.sort(long)
+            # Distance from each row of the short side to the nearest row
+            # of the long side
+            at = np.clip(np.searchsorted(long, short), 1, len(long) - 1)
+            nearest = np.minimum(abs(short - long[at - 1]), abs(short - long[at]))
+            if np.mean(nearest <= self.row_tolerance) >= aligned:
+                return False
+        return True
+
+    def _rows(self, index: Any) -> List[List[int]]:
+        """Split a block into rows, each sorted left to right."""
+        import numpy as np
+
+        order = index[np.argsort(self.center[index], kind="stable")]
+        row = np.concatenate(
+            ([0], np.cumsum(np.diff(self.center[order]) > self.row_tolerance))
+        )
+        ranked = np.lexsort((self.x0[order], row))
+        order, row = order[ranked], row[ranked]
+        breaks = np.flatnonzero(np.diff(row)) + 1
+        return [part.tolist() for part in np.split(order, breaks)]
+
+
+def _split(index: Any, low: Any, high: Any, min_gap: float) -> List[Any]:
+    """
+    Split boxes along one axis wherever a gap wider than ``min_gap`` is
+    covered by none of them.
+    """
+    import numpy as np
+
+    order = index[np.argsort(low[index], kind="stable")]
+    reach = np.maximum.accumulate(high[order])
+    breaks = np.flatnonzero(low[order][1:] - reach[:-1] > min_gap) + 1
+    return np.split(order, breaks) if len(breaks) else [index]
@@ -0,0 +1,283 @@
+"""
+Lexicon Correction Module
+
+Corrects near-miss recognitions of known terms, such as bank names,
+utility names and address terms, against a user lexicon.
+
+A term that is read with at most ``k`` edits still contains one of its
+``k + 1`` disjoint pieces unchanged (pigeonhole principle). Every piece of
+every term is compiled into one Aho–Corasick automaton, so a single scan
+of a line finds all seed hits, however large the lexicon. Each hit is
+then verified with an edit distance bounded to ``k`` and computed only in
+a band of diagonals around the position the seed implies. A page costs
+one automaton pass plus a small, fixed amount of work per seed hit.
+
+Corrections are kept conservative, since a wrong rewrite is worse than a
+missed one: a term gets an edit only per ``chars_per_edit`` characters
+(7 by default), so a 4-character street name or a 6-character company
+name that differs from a real, different one by a single character is
+never rewritten. A span that is a near miss of two different terms is
+ambiguous and left as read, even if one of them is closer.
+
+Lexicon file format: UTF-8 text, one term per line. Blank lines and lines
+starting with ``#`` are ignored.
+"""
+
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class LexiconMatch(NamedTuple):
+    """A span of text within edit distance of a lexicon term."""
+
+    start: int
+    end: int
+    term: str
+    distance: int
+
+
+class Lexicon:
+    """
+    Compiled lexicon of known terms.
+
+    Example:
+        >>> lexicon = Lexicon(["台北富邦商業銀行", "台灣電力股份有限公司"])
+        >>> lexicon.correct("轉帳至台北富邦商業很行帳戶")
+        ('轉帳至台北富邦商業銀行帳戶', 1)
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        max_distance: int = 1,
+        min_seed: int = 2,
+        chars_per_edit: int = 7,
+    ):
+        """
+        Compile the lexicon.
+
+        Args:
+            terms: Correctly spelled terms.
+            max_distance: Most edits (insertions, deletions, substitutions)
+                          corrected per term.
+            min_seed: Shortest seed piece. A term gets ``k`` allowed edits
+                      only if it splits into ``k + 1`` pieces this long,
+                      so short terms are never rewritten.
+            chars_per_edit: Term characters needed per allowed edit. A
+                            term gets ``k`` edits only if it is at least
+                            ``k * chars_per_edit`` characters long.
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        if min_seed < 1:
+            raise ValueError("min_seed must be at least 1")
+        if chars_per_edit < 1:
+            raise ValueError("chars_per_edit must be at least 1")
+
+        self.terms: List[str] = []
+        self._distance: List[int] = []
+        # Seed pieces: (term index, offset in term, length)
+        self._seeds: List[Tuple[int, int, int]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for term in dict.fromkeys(term.strip() for term in terms):
+            distance = min(
+                max_distance,
+                len(term) // min_seed - 1,
+                len(term) // chars_per_edit,
+            )
+            # Terms without edits are still kept: an exact occurrence
+            # protects its span from being rewritten into another term
+            if not term or distance < 0:
+                continue
+            self.terms.append(term)
+            self._distance.append(distance)
+            self._add_seeds(len(self.terms) - 1, term, distance + 1)
+        self._link()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], max_distance: int = 1) -> "Lexicon":
+        """Load a lexicon file (one term per line, ``#`` comments)."""
+        with open(path, "r", encoding="utf-8") as f:
+            terms = [
+                line.strip()
+                for line in f
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+        lexicon = cls(terms, max_distance=max_distance)
+        logger.info(f"Loaded {len(lexicon)} lexicon terms from {path}")
+        return lexicon
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def matches(self, text: str) -> List[LexiconMatch]:
+        """
+        Find non-overlapping spans of ``text`` that match lexicon terms.
+
+        Exact occurrences are included (distance 0) so that a correct term
+        is never rewritten into a similar one. Near misses that overlap a
+        near miss of a different term are ambiguous and dropped. Where the
+        remaining candidates overlap, the closest match wins, then the
+        longest.
+        """
+        candidates: Dict[Tuple[int, int, int], LexiconMatch] = {}
+        checked = set()
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for seed in self._out[state]:
+                term_index, offset, length = self._seeds[seed]
+                start = position + 1 - length - offset
+                if (term_index, start) in checked:
+                    continue
+                checked.add((term_index, start))
+                match = self._verify(text, term_index, start)
+                if match is not None:
+                    candidates[(match.start, match.end, term_index)] = match
+
+        near = [match for match in candidates.values() if match.distance]
+        ambiguous = {
+            match
+            for match in near
+            for other in near
+            if other.term != match.term
+            and other.start < match.end
+            and match.start < other.end
+        }
+
+        chosen: List[LexiconMatch] = []
+        taken = [False] * len(text)
+        ranked = sorted(
+            (match for match in candidates.values() if match not in ambiguous),
+            key=lambda m: (m.distance, m.start - m.end, m.start),
+        )
+        for match in ranked:
+            if any(taken[match.start : match.end]):
+                continue
+            taken[match.start : match.end] = [True] * (match.end - match.start)
+            chosen.append(match)
+        return sorted(chosen)
+
+    def correct(self, text: str) -> Tuple[str, int]:
+        """
+        Replace near-miss spans with their lexicon terms.
+
+        Returns:
+            The corrected text and the number of spans changed.
+        """
+        if not self.terms or not text:
+            return text, 0
+        pieces = []
+        last = 0
+        changed = 0
+        for match in self.matches(text):
+            if match.distance == 0:
+                continue
+            pieces.append(text[last : match.start])
+            pieces.append(match.term)
+            last = match.end
+            changed += 1
+        if not changed:
+            return text, 0
+        pieces.append(text[last:])
+        return "".join(pieces), changed
+
+    def _add_seeds(self, term_index: int, term: str, count: int) -> None:
+        """Split a term into ``count`` near-equal pieces and insert them."""
+        size, extra = divmod(len(term), count)
+        offset = 0
+        for piece in range(count):
+            length = size + (piece < extra)
+            node = 0
+            for char in term[offset : offset + length]:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            self._out[node].append(len(self._seeds))
+            self._seeds.append((term_index, offset, length))
+            offset += length
+
+    def _link(self) -> None:
+        """Compute failure links breadth first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _verify(self, text: str, term_index: int, start: int) -> Optional[LexiconMatch]:
+        """
+        Best alignment of a term to the text around ``start``.
+
+        A semi-global edit distance (free start and end in the text) over
+        a window of ``k`` extra characters on each side, computed only on
+        the diagonals an alignment with at most ``k`` edits can use, and
+        abandoned as soon as a whole row exceeds ``k``.
+        """
+        term = self.terms[term_index]
+        limit = self._distance[term_index]
+        offset = max(0, start - limit)
+        window = text[offset : start + len(term) + limit]
+        width = len(window)
+        infinity = limit + 1
+        lead = start - offset  # where the seed places the term's start
+
+        # (cost, start column) for the empty term prefix: free start
+        previous = [
+            (0, column) if abs(column - lead) <= limit else (infinity, column)
+            for column in range(width + 1)
+        ]
+        for row, char in enumerate(term, 1):
+            low = max(0, row + lead - 2 * limit)
+            high = min(width, row + lead + 2 * limit)
+            current = [(infinity, 0)] * (width + 1)
+            best = infinity
+            for column in range(low, high + 1):
+                cost, origin = previous[column]
+                cell = (cost + 1, origin)  # term char missing from the text
+                if column:
+                    cost, origin = previous[column - 1]
+                    cost += window[column - 1] != char
+                    if cost < cell[0]:
+                        cell = (cost, origin)
+                    cost, origin = current[column - 1]
+                    if cost + 1 < cell[0]:  # extra char in the text
+                        cell = (cost + 1, origin)
+                current[column] = cell
+                best = min(best, cell[0])
+            if best > limit:
+                return None
+            previous = current
+
+        found = None
+        for column, (cost, origin) in enumerate(previous):
+            if cost > limit:
+                continue
+            # Ties go to the longer span: it absorbs a spurious extra char
+            rank = (cost, origin - column, origin)
+            if found is None or rank < found[0]:
+                found = (rank, origin, column)
+        if found is None:
+            return None
+        (cost, _, _), origin, column = found
+        return LexiconMatch(offset + origin, offset + column, term, cost)
@@ -0,0 +1,161 @@
+"""
+Text Normalization Module
+
+Optional clean-up of recognized text: full-width digits, letters and
+spaces to half-width, and Simplified/Traditional Chinese conversion from a
+dictionary.
+
+Single characters are mapped with one precompiled ``str.translate``
+table, which runs in C. Phrases (multi-character entries, e.g. 头发 →
+頭髮 where the character map alone would give 頭發) are converted first
+by longest match: a regular expression jumps to the characters that can
+start a phrase, and only there are dictionary lookups made. A page's
+lines are normalized together in one pass.
+
+Conversion dictionaries use the OpenCC text format, so OpenCC's
+``STCharacters.txt`` and ``STPhrases.txt`` (Simplified to Traditional) or
+``TSCharacters.txt`` and ``TSPhrases.txt`` can be used directly:
+
+    源<TAB>目標 [其他候選 ...]
+
+Only the first candidate is used. Blank lines and ``#`` comments are
+ignored. A directory loads every ``*.txt`` file in it.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Full-width ASCII digits and letters, and the ideographic space
+FULLWIDTH_ALNUM = {
+    **{code: chr(code - 0xFEE0) for code in range(ord("０"), ord("９") + 1)},
+    **{code: chr(code - 0xFEE0) for code in range(ord("Ａ"), ord("Ｚ") + 1)},
+    **{code: chr(code - 0xFEE0) for code in range(ord("ａ"), ord("ｚ") + 1)},
+    ord("\u3000"): " ",
+}
+
+
+def load_conversion(path: Union[str, Path]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Read OpenCC-format conversion dictionaries.
+
+    Args:
+        path: A dictionary file, or a directory of ``*.txt`` dictionaries.
+
+    Returns:
+        (characters, phrases): single-character and multi-character maps.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Conversion dictionary not found: {path}")
+    files = sorted(path.glob("*.txt")) if path.is_dir() else [path]
+
+    characters: Dict[str, str] = {}
+    phrases: Dict[str, str] = {}
+    for file in files:
+        with open(file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                source, _, targets = line.rstrip("\r\n").partition("\t")
+                target = targets.split(" ")[0]
+                if not source or not target or source == target:
+                    continue
+                (characters if len(source) == 1 else phrases)[source] = target
+    logger.info(
+        f"Loaded {len(characters)} character and {len(phrases)} phrase "
+        f"conversions from {path}"
+    )
+    return characters, phrases
+
+
+class TextNormalizer:
+    """
+    Width normalization and dictionary conversion of text.
+
+    Example:
+        >>> normalizer = TextNormalizer(width=True, phrases={"头发": "頭髮"})
+        >>> normalizer.normalize("ＡＢ１２３ 头发")
+        'AB123 頭髮'
+    """
+
+    def __init__(
+        self,
+        width: bool = False,
+        characters: Optional[Dict[str, str]] = None,
+        phrases: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Compile the translation table and phrase matcher.
+
+        Args:
+            width: Convert full-width digits, letters and spaces to
+                   half-width.
+            characters: Single-character conversions.
+            phrases: Multi-character conversions, applied before the
+                     character map by longest match.
+        """
+        table: Dict[int, str] = dict(FULLWIDTH_ALNUM) if width else {}
+        for source, target in (characters or {}).items():
+            table[ord(source)] = target
+        self._table = table
+
+        self._phrases = dict(phrases or {})
+        self._lengths = sorted({len(p) for p in self._phrases}, reverse=True)
+        self._starts = (
+            re.compile(
+                "[" + "".join(sorted({re.escape(p[0]) for p in self._phrases})) + "]"
+            )
+            if self._phrases
+            else None
+        )
+
+    @classmethod
+    def from_dictionary(
+        cls, path: Union[str, Path], width: bool = False
+    ) -> "TextNormalizer":
+        """Create a normalizer from an OpenCC-format dictionary path."""
+        characters, phrases = load_conversion(path)
+        return cls(width=width, characters=characters, phrases=phrases)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether normalization changes anything at all."""
+        return bool(self._table or self._phrases)
+
+    def normalize(self, text: str) -> str:
+        """Normalize a string."""
+        if self._starts is None:
+            return text.translate(self._table)
+
+        pieces = []
+        last = 0
+        for found in self._starts.finditer(text):
+            start = found.start()
+            if start < last:
+                continue
+            for length in self._lengths:
+                target = self._phrases.get(text[start : start + length])
+                if target is not None:
+                    pieces.append(text[last:start].translate(self._table))
+                    pieces.append(target)
+                    last = start + length
+                    break
+        pieces.append(text[last:].translate(self._table))
+        return "".join(pieces)
+
+    def normalize_lines(self, texts: List[str]) -> List[str]:
+        """
+        Normalize several lines in one pass over their joined text.
+
+        Phrases never contain a newline, so none spans two lines.
+        """
+        if any("\n" in text for text in texts):
+            return [self.normalize(text) for text in texts]
+        return self.normalize("\n".join(texts)).split("\n") if texts else []
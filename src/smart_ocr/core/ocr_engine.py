@@ -4,15 +4,63 @@ OCR Engine Module
 Core OCR processing engine using PaddleOCR for text recognition.
 """
 
+import asyncio
 import logging
 import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import replace
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .batching import MicroBatcher
+from .blank import is_blank
+from .bundle import load_bundle
+from .cache import CropCache, crop_key
 from .config import OCRConfig
+from .crops import crop_box, scale_box, sort_boxes
+from .decoders import DecodedImage, create_decoder
+from .discovery import iter_images
+from .layout import PageLayout, analyze_layout
+from .lexicon import Lexicon
+from .normalize import TextNormalizer
+from .packing import pack_result, unpack_result
+from .predictors import PredictorPool
+from .profiling import EngineStats
+from .spatial import Rect, SpatialIndex
+from .template import FormTemplate
+from .writers import (
+    MultiWriter,
+    compressed_path,
+    create_multi_writer,
+    create_writer,
+    effective_compression,
+    parse_formats,
+    uncompressible_formats,
+)
 
 logger = logging.getLogger(__name__)
 
+# Called with each page's result and its full-resolution pixels (or None)
+PageCallback = Callable[["OCRResult", Any], None]
+
+T = TypeVar("T")
+
 
 def _setup_cuda_environment() -> None:
     """Setup CUDA/cuDNN environment variables for Windows."""
@@ -63,15 +111,104 @@ class OCREngine:
         self.config = config or OCRConfig.for_chinese()
         self._ocr = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+        self._bundle: Any = None
+        self._predictors: Optional[PredictorPool] = None
+        self._template = (
+            FormTemplate.load(self.config.template) if self.config.template else None
+        )
+        self._lexicon = (
+            Lexicon.load(self.config.lexicon, self.config.lexicon_max_distance)
+            if self.config.lexicon
+            else None
+        )
+        if self.config.conversion_dict:
+            normalizer = TextNormalizer.from_dictionary(
+                self.config.conversion_dict, width=self.config.normalize_width
+            )
+        else:
+            normalizer = TextNormalizer(width=self.config.normalize_width)
+        self._normalizer = normalizer if normalizer.enabled else None
+        self._decoder = create_decoder(
+            self.config.decoder,
+            max_side=self.config.decode_max_side,
+            mmap_min_mb=self.config.mmap_min_mb,
+        )
+        self._cascade_decoder = create_decoder(
+            self.config.decoder,
+            max_side=min(
+                self.config.cascade_max_side,
+                self.config.decode_max_side or self.config.cascade_max_side,
+            ),
+            mmap_min_mb=self.config.mmap_min_mb,
+        )
+        self.stats = EngineStats()
+        self._rec_cache = (
+            CropCache(self.config.rec_cache_size, stats=self.stats)
+            if self.config.rec_cache_size
+            else None
+        )
+        self._batcher = (
+            MicroBatcher(
+                self._process_page_outcomes,
+                max_batch_size=self.config.micro_batch_size,
+                max_wait_ms=self.config.micro_batch_wait_ms,
+                stats=self.stats,
+            )
+            if self.config.micro_batch_size
+            else None
+        )
 
     def _ensure_initialized(self) -> None:
-        """Lazily initialize PaddleOCR engine."""
+        """
+        Lazily initialize the OCR backend (PaddleOCR or ONNX Runtime).
+
+        Safe to call from several threads: the models are loaded once.
+        """
         if self._initialized:
             return
+        with self._init_lock:
+            if self._initialized:
+                return
+
+            # Setup CUDA environment for GPU mode
+            if self.config.use_gpu:
+                _setup_cuda_environment()
+
+            bundle = load_bundle(self.config)
+            if (
+                bundle is not None
+                and self.config.use_angle_cls
+                and not bundle.has_angle_classifier
+            ):
+                # PaddleOCR would download its default classifier instead
+                logger.warning(
+                    f"Model bundle {bundle.path} has no angle classifier, "
+                    "angle classification is disabled"
+                )
+                self.config = replace(self.config, use_angle_cls=False)
+            self._bundle = bundle
+            self._ocr = self._create_predictor()
+            self._initialized = True
 
-        # Setup CUDA environment for GPU mode
-        if self.config.use_gpu:
-            _setup_cuda_environment()
+    def _create_predictor(self) -> Any:
+        """Load one instance of the configured backend's models."""
+        bundle = self._bundle
+
+        if self.config.backend == "onnxruntime":
+            from .onnx_backend import OnnxOCR
+
+            config = self.config
+            if bundle is not None:
+                config = replace(config, onnx_model_dir=bundle.path)
+            logger.info(
+                f"Initializing ONNX Runtime backend "
+                f"(models: {config.onnx_model_dir}, "
+                f"threads: {config.cpu_threads})"
+            )
+            predictor = OnnxOCR(config)
+            logger.info("ONNX Runtime engine initialized successfully")
+            return predictor
 
         try:
             from paddleocr import PaddleOCR
@@ -82,14 +219,16 @@ class OCREngine:
             )
 
             # PaddleOCR 2.x API
-            self._ocr = PaddleOCR(
+            predictor = PaddleOCR(
                 use_angle_cls=self.config.use_angle_cls,
                 lang=self.config.lang,
                 use_gpu=self.config.use_gpu,
+                rec_batch_num=self.config.rec_batch_num,
                 show_log=self.config.show_log,
+                **(bundle.paddle_kwargs() if bundle is not None else {}),
             )
-            self._initialized = True
             logger.info("PaddleOCR engine initialized successfully")
+            return predictor
 
         except ImportError:
             raise ImportError(
@@ -97,6 +236,43 @@ class OCREngine:
                 "Please install it with: pip install paddlepaddle paddleocr"
             )
 
+    def _predictor_pool(self) -> PredictorPool:
+        """The pool of predictors around ``self._ocr``, built on first use."""
+        pool = self._predictors
+        if pool is None or pool.primary is not self._ocr:
+            with self._init_lock:
+                pool = self._predictors
+                if pool is None or pool.primary is not self._ocr:
+                    assert self._ocr is not None, "OCR engine not initialized"
+                    pool = PredictorPool(
+                        self._ocr,
+                        self._create_predictor,
+                        self.config.predictor_pool_size,
+                    )
+                    self._predictors = pool
+        return pool
+
+    def _predict(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run one ``ocr()`` call on a predictor checked out of the pool, so
+        threads sharing this engine never use a predictor concurrently.
+        """
+        with self._predictor_pool().checkout() as predictor:
+            return predictor.ocr(*args, **kwargs)
+
+    def warmup(self) -> None:
+        """
+        Load the OCR models now instead of on the first image, including
+        every predictor of the pool (``predictor_pool_size``).
+        """
+        self._ensure_initialized()
+        self._predictor_pool().fill()
+
+    def close(self) -> None:
+        """Stop the micro-batching thread, finishing queued requests."""
+        if self._batcher is not None:
+            self._batcher.close()
+
     def process_image(self, image_path: Union[str, Path]) -> "OCRResult":
         """
         Process a single image and extract text.
@@ -111,6 +287,42 @@ class OCREngine:
             FileNotFoundError: If image file doesn't exist.
             OCRError: If OCR processing fails.
         """
+        if self._batcher is not None:
+            result: "OCRResult" = self._batcher.submit(image_path).result()
+            return result
+        return self._process_image(image_path)
+
+    async def process_image_async(self, image_path: Union[str, Path]) -> "OCRResult":
+        """
+        Process a single image from a coroutine.
+
+        With micro-batching enabled the request joins the shared batch
+        queue without blocking the event loop; otherwise the image is
+        processed in the loop's default executor.
+        """
+        if self._batcher is not None:
+            return await asyncio.wrap_future(self._batcher.submit(image_path))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._process_image, image_path)
+
+    def _process_image(self, image_path: Union[str, Path]) -> "OCRResult":
+        """Process one image on the calling thread (see ``process_image``)."""
+        return self._process_page(image_path)[0]
+
+    def _process_page(
+        self, image_path: Union[str, Path], keep_image: bool = False
+    ) -> Tuple["OCRResult", Any]:
+        """
+        Process one image, also returning its decoded pixels.
+
+        Args:
+            image_path: Path to the image file.
+            keep_image: Decode to an array and return it. The pixels are
+                        only returned at full resolution, else None.
+
+        Returns:
+            The result and the full-resolution BGR array, or None.
+        """
         self._ensure_initialized()
 
         image_path = Path(image_path)
@@ -119,181 +331,627 @@ class OCREngine:
 
         logger.info(f"Processing image: {image_path}")
 
-        # PaddleOCR 2.x API
-        assert self._ocr is not None, "OCR engine not initialized"
-        result = self._ocr.ocr(str(image_path), cls=self.config.use_angle_cls)
+        image = None
+        if self.config.cascade and self._template is None:
+            result = self._process_cascade(image_path)
+        else:
+            with self.stats.timer("decode"):
+                decoded = self._decoder.decode(
+                    image_path,
+                    as_array=keep_image
+                    or self._template is not None
+                    or self._rec_cache is not None
+                    or self.config.skip_blank,
+                )
+            result = self._process_decoded(image_path, decoded)
+            if keep_image and decoded.scale == 1.0:
+                image = decoded.data
+
+        self._postprocess(result)
+        self.stats.increment("images")
+        self.stats.increment("lines", len(result.lines))
+        return result, image
+
+    def process_decoded(
+        self, image_path: Union[str, Path], decoded: DecodedImage
+    ) -> "OCRResult":
+        """
+        Process an image that has already been decoded, e.g. by the parent
+        process of a supervised run (see core/image_ring.py).
+
+        The cascade is not applied, as it needs to decode the file itself.
+
+        Args:
+            image_path: Source file, recorded in the result.
+            decoded: Decoded BGR array with its decode scale.
+
+        Returns:
+            OCRResult with bboxes in original image coordinates.
+        """
+        self._ensure_initialized()
+        result = self._process_decoded(Path(image_path), decoded)
+        self._postprocess(result)
+        self.stats.increment("images")
+        self.stats.increment("lines", len(result.lines))
+        return result
+
+    def _process_decoded(self, image_path: Path, decoded: DecodedImage) -> "OCRResult":
+        """Run the template or full-page pipeline on a decoded image."""
+        if self._template is not None:
+            result = self._process_template(image_path, decoded, self._template)
+        else:
+            blank = self._blank_page(image_path, decoded.data)
+            if blank is not None:
+                return blank
+            result = self._ocr_page(decoded.data, image_path)
+
+        if decoded.scale != 1.0:
+            _rescale_lines(result.lines, 1.0 / decoded.scale)
+        return result
+
+    def _process_cascade(self, image_path: Path) -> "OCRResult":
+        """
+        Two-pass OCR: detect and recognize on a downscaled image, then
+        re-recognize lines below ``cascade_threshold`` from full resolution.
+
+        The first pass keeps every reading, however weak: those are the
+        lines most worth re-reading. Each escalated line keeps whichever
+        reading scored higher, and ``drop_score`` applies to the outcome.
+        """
+        with self.stats.timer("decode"):
+            low = self._cascade_decoder.decode(image_path, as_array=True)
+        blank = self._blank_page(image_path, low.data)
+        if blank is not None:
+            return blank
+
+        # Detection and recognition as separate calls: the whole-page
+        # pipeline drops lines below drop_score before we could escalate them
+        boxes = self._detect(low.data)
+        crops = [crop_box(low.data, box) for box in boxes]
+        lines = self._build_lines(boxes, self._recognize(crops), drop_score=0.0)
+        result = OCRResult(image_path, lines)
+        if low.scale != 1.0:
+            _rescale_lines(result.lines, 1.0 / low.scale)
+
+        weak = [
+            line
+            for line in result.lines
+            if line.confidence < self.config.cascade_threshold and line.bbox
+        ]
+        # Not when the first pass already ran at full size
+        if weak and low.scale < 1.0:
+            self._escalate(image_path, weak, low.scale, len(result.lines))
+
+        result.lines = [
+            line for line in result.lines if line.confidence >= self.config.drop_score
+        ]
+        return result
+
+    def _escalate(
+        self, image_path: Path, weak: List["OCRLine"], low_scale: float, total: int
+    ) -> None:
+        """Re-recognize weak lines from the full-resolution image, in place."""
+        with self.stats.timer("decode"):
+            full = self._decoder.decode(image_path, as_array=True)
+        if full.scale <= low_scale:
+            return
+
+        crops = [crop_box(full.data, scale_box(line.bbox, full.scale)) for line in weak]
+        improved = 0
+        # Bypass the cache: it is scale-invariant and would return the
+        # low-resolution reading for the same line
+        for line, (text, confidence) in zip(weak, self._recognize_batch(crops)):
+            if confidence > line.confidence:
+                line.text, line.confidence = text, confidence
+                improved += 1
+
+        self.stats.increment("cascade_escalated", len(weak))
+        self.stats.increment("cascade_improved", improved)
+        logger.debug(
+            f"Cascade: escalated {len(weak)}/{total} lines, {improved} improved"
+        )
+
+    def _postprocess(self, result: "OCRResult") -> "OCRResult":
+        """Apply the text correction stages to a finished result, in place."""
+        if self._normalizer is not None:
+            with self.stats.timer("normalize"):
+                changed = result.normalize(self._normalizer)
+            self.stats.increment("normalized_lines", changed)
+        if self._lexicon is not None:
+            with self.stats.timer("lexicon"):
+                corrected = 0
+                for line in result.lines:
+                    line.text, changed = self._lexicon.correct(line.text)
+                    corrected += changed
+                if result.fields is not None:
+                    for name, text in result.fields.items():
+                        result.fields[name], changed = self._lexicon.correct(text)
+                        corrected += changed
+            self.stats.increment("lexicon_corrections", corrected)
+        return result
+
+    def _blank_page(self, image_path: Path, image: Any) -> Optional["OCRResult"]:
+        """
+        Return an empty result marked blank if ``skip_blank`` is set and the
+        page has (almost) no ink, so the models never run on it.
+
+        Template pages are not checked: their regions are read regardless.
+        """
+        if not self.config.skip_blank or isinstance(image, str):
+            return None
+        with self.stats.timer("blank_check"):
+            blank = is_blank(image, self.config.blank_threshold)
+        if not blank:
+            return None
+        logger.info(f"Blank page, skipping OCR: {image_path}")
+        self.stats.increment("blank_pages")
+        return OCRResult(image_path, [], blank=True)
+
+    def _ocr_page(self, image: Any, image_path: Path) -> "OCRResult":
+        """
+        Detect and recognize all text on a page.
+
+        With the recognition cache enabled, detection, cropping and
+        recognition run as separate steps so repeated crops can be served
+        from the cache; otherwise PaddleOCR runs the whole pipeline.
+        """
+        if self._rec_cache is None:
+            # PaddleOCR 2.x API
+            with self.stats.timer("ocr"):
+                raw = self._predict(image, cls=self.config.use_angle_cls)
+            return OCRResult.from_paddle_result(raw, image_path)
+
+        boxes = self._detect(image)
+        crops = [crop_box(image, box) for box in boxes]
+        return OCRResult(image_path, self._build_lines(boxes, self._recognize(crops)))
+
+    def _build_lines(
+        self,
+        boxes: List[List[List[float]]],
+        recognized: List[Tuple[str, float]],
+        drop_score: Optional[float] = None,
+    ) -> List["OCRLine"]:
+        """
+        Pair boxes with readings, dropping lines below ``drop_score``
+        (the configured one unless given).
+        """
+        if drop_score is None:
+            drop_score = self.config.drop_score
+        return [
+            OCRLine(text, confidence, [list(point) for point in box])
+            for box, (text, confidence) in zip(boxes, recognized)
+            if confidence >= drop_score
+        ]
+
+    def _detect(self, image: Any) -> List[List[List[float]]]:
+        """Run text detection only; return boxes in reading order."""
+        # PaddleOCR 2.x API: rec=False returns [[box, ...]] per page
+        with self.stats.timer("det"):
+            result = self._predict(image, rec=False, cls=False)
+        boxes = result[0] if result and result[0] else []
+        return sort_boxes([[list(map(float, p)) for p in box] for box in boxes])
+
+    def _process_template(
+        self, image_path: Path, decoded: DecodedImage, template: FormTemplate
+    ) -> "OCRResult":
+        """Recognize only the template regions, skipping text detection."""
+        image = decoded.data
+        height, width = image.shape[:2]
+
+        boxes = [region.to_pixels(width, height) for region in template.regions]
+        crops = [image[top:bottom, left:right] for left, top, right, bottom in boxes]
+        recognized = self._recognize(crops)
+
+        lines = []
+        fields = {}
+        for region, box, (text, confidence) in zip(template.regions, boxes, recognized):
+            fields[region.name] = text
+            if text:
+                left, top, right, bottom = box
+                bbox: List[List[float]] = [
+                    [left, top],
+                    [right, top],
+                    [right, bottom],
+                    [left, bottom],
+                ]
+                lines.append(OCRLine(text, confidence, bbox))
+
+        return OCRResult(image_path, lines, fields=fields)
+
+    def _recognize(self, crops: List[Any]) -> List[Tuple[str, float]]:
+        """
+        Run recognition (without detection) on a batch of image crops.
 
-        return OCRResult.from_paddle_result(result, image_path)
+        Crops already in the recognition cache are answered from it; only
+        the misses reach the model.
+
+        Returns:
+            One (text, confidence) pair per crop, in input order.
+        """
+        if not crops:
+            return []
+
+        if self._rec_cache is None:
+            return self._recognize_batch(crops)
+
+        keys = [crop_key(crop) for crop in crops]
+        recognized: List[Optional[Tuple[str, float]]] = [
+            self._rec_cache.get(key) for key in keys
+        ]
+        # Unique missing keys, so repeats within one batch are recognized once
+        misses: Dict[bytes, int] = {}
+        for i, reading in enumerate(recognized):
+            if reading is None:
+                misses.setdefault(keys[i], i)
+
+        fresh = self._recognize_batch([crops[i] for i in misses.values()])
+        readings = dict(zip(misses, fresh))
+        for key, reading in readings.items():
+            self._rec_cache.put(key, reading)
+        return [reading or readings[key] for key, reading in zip(keys, recognized)]
+
+    def _recognize_batch(self, crops: List[Any]) -> List[Tuple[str, float]]:
+        """Send crops to the recognition model in a single call."""
+        if not crops:
+            return []
+
+        # PaddleOCR 2.x API: det=False recognizes a list of crops in one call
+        # Both backends sort the crops by aspect ratio and recognize them in
+        # rec_batch_num batches, so each batch pads to a similar width
+        self.stats.increment("rec_crops", len(crops))
+        with self.stats.timer("rec"):
+            result = self._predict(crops, det=False, cls=self.config.use_angle_cls)
+
+        recognized: List[Tuple[str, float]] = []
+        items = result[0] if result and result[0] else []
+        for item in items:
+            if isinstance(item, (list, tuple)) and len(item) >= 2:
+                recognized.append((str(item[0]), float(item[1])))
+            else:
+                recognized.append(("", 0.0))
+        recognized.extend([("", 0.0)] * (len(crops) - len(recognized)))
+        return recognized
 
     def process_directory(
         self,
         directory: Union[str, Path],
         extensions: Optional[List[str]] = None,
         recursive: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
+        sort: bool = True,
+        on_page: Optional[PageCallback] = None,
     ) -> List["OCRResult"]:
         """
         Process all images in a directory.
 
+        Images are streamed to the engine while the directory is still
+        being listed (see ``core/discovery.py``).
+
         Args:
             directory: Path to the directory containing images.
             extensions: List of file extensions to process.
                        Default: ['.png', '.jpg', '.jpeg', '.bmp', '.tiff']
             recursive: Whether to search subdirectories.
+            shard: Optional (index, count) to process only one shard of the
+                   directory, e.g. (0, 4) for the first of four nodes.
+            sort: Process files in sorted path order. Without it files are
+                  taken in directory-listing order, which starts sooner on
+                  huge directories.
+            on_page: Called with each result as it is produced (see
+                     ``process_images``).
 
         Returns:
             List of OCRResult objects.
         """
-        directory = Path(directory)
-        if not directory.is_dir():
-            raise NotADirectoryError(f"Not a directory: {directory}")
+        image_files = iter_images(directory, extensions, recursive, shard, sort)
 
-        extensions = extensions or [".png", ".jpg", ".jpeg", ".bmp", ".tiff"]
-        extensions = [
-            ext.lower() if ext.startswith(".") else f".{ext.lower()}"
-            for ext in extensions
-        ]
+        logger.info(f"Processing images in {directory}")
+        results = self.process_images(image_files, on_page=on_page)
+        logger.info(f"Processed {len(results)} images from {directory}")
+        return results
 
-        pattern = "**/*" if recursive else "*"
-        image_files = [
-            f
-            for f in directory.glob(pattern)
-            if f.is_file() and f.suffix.lower() in extensions
-        ]
+    def find_images(
+        self,
+        directory: Union[str, Path],
+        extensions: Optional[List[str]] = None,
+        recursive: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
+    ) -> List[Path]:
+        """
+        List the image files in a directory, sorted by path.
+
+        Args:
+            directory: Path to the directory containing images.
+            extensions: List of file extensions to include.
+                       Default: ['.png', '.jpg', '.jpeg', '.bmp', '.tiff']
+            recursive: Whether to search subdirectories.
+            shard: Optional (index, count); keep only that shard's files,
+                   chosen by a stable hash of the path relative to directory.
+
+        Returns:
+            Sorted list of image paths.
+        """
+        return list(iter_images(directory, extensions, recursive, shard))
+
+    def process_images(
+        self,
+        image_paths: Iterable[Union[str, Path]],
+        on_page: Optional[PageCallback] = None,
+    ) -> List["OCRResult"]:
+        """
+        Process a batch of images with this engine.
 
-        logger.info(f"Found {len(image_files)} images to process")
+        Images that fail are logged and skipped so one bad file does not
+        abort the batch. With ``rec_page_batch > 1`` the text crops of that
+        many pages are pooled into one recognition pass (see
+        ``_process_page_group``). With micro-batching enabled the images
+        join the shared batch queue instead.
 
+        ``on_page`` lets a caller export each page as soon as it is done,
+        e.g. ``writer.write`` of a PdfWriter, which then embeds the pixels
+        already decoded here instead of decoding the file again. It gets
+        the full-resolution array when the engine decoded one, else None
+        (cascade, micro-batching or a reduced decode size). Errors it
+        raises are not caught.
+
+        Args:
+            image_paths: Paths of the images to process.
+            on_page: Called with each result and its decoded image.
+
+        Returns:
+            List of OCRResult objects for the images that succeeded.
+        """
+        if self._batcher is not None:
+            # Submit as paths arrive, keeping a couple of batches in flight,
+            # so a long discovery stream starts feeding the batcher at once
+            window = 2 * self._batcher.max_batch_size
+            pending: Deque[Tuple[Union[str, Path], "Future[OCRResult]"]] = deque()
+            results: List["OCRResult"] = []
+            for image_path in image_paths:
+                pending.append((image_path, self._batcher.submit(image_path)))
+                if len(pending) >= window:
+                    self._collect(*pending.popleft(), results, on_page)
+            while pending:
+                self._collect(*pending.popleft(), results, on_page)
+            return results
+
+        if (
+            self.config.rec_page_batch > 1
+            and self._template is None
+            and not self.config.cascade
+        ):
+            results = []
+            paths = iter(image_paths)
+            while True:
+                group = list(islice(paths, self.config.rec_page_batch))
+                if not group:
+                    break
+                results.extend(self._process_page_group(group, on_page))
+            return results
+
+        return self._process_pages(image_paths, on_page)
+
+    @staticmethod
+    def _collect(
+        image_path: Union[str, Path],
+        future: "Future[OCRResult]",
+        results: List["OCRResult"],
+        on_page: Optional[PageCallback] = None,
+    ) -> None:
+        """Wait for a submitted page, logging and skipping it on failure."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Failed to process {image_path}: {e}")
+            return
+        results.append(result)
+        if on_page is not None:
+            on_page(result, None)
+
+    def _process_page_group(
+        self,
+        image_paths: List[Union[str, Path]],
+        on_page: Optional[PageCallback] = None,
+    ) -> List["OCRResult"]:
+        """
+        Detect text on every page of a group, then recognize all of their
+        crops in one call, logging and skipping pages that fail.
+
+        Pooling crops across pages gives the aspect-ratio sort far more
+        lines to choose batch-mates from, so short labels are batched with
+        other short labels instead of padded to the widest line on their
+        own page.
+        """
         results = []
-        for image_path in sorted(image_files):
+        images: Optional[List[Any]] = [] if on_page is not None else None
+        outcomes = self._process_page_outcomes(image_paths, images)
+        for index, (image_path, outcome) in enumerate(zip(image_paths, outcomes)):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to process {image_path}: {outcome}")
+                continue
+            results.append(outcome)
+            if images is not None and on_page is not None:
+                on_page(outcome, images[index])
+        return results
+
+    def _process_page_outcomes(
+        self,
+        image_paths: List[Union[str, Path]],
+        images: Optional[List[Any]] = None,
+    ) -> List[Union["OCRResult", Exception]]:
+        """
+        Process a group of pages with pooled recognition.
+
+        Returns one outcome per page, in order: its OCRResult or the
+        exception it failed with. Template and cascade pages are processed
+        one at a time, as pooling does not apply to them.
+
+        Args:
+            image_paths: Pages of the group.
+            images: If given, filled with each page's full-resolution
+                    pixels, or None where they were not decoded at full
+                    size. They are held until the whole group is done.
+        """
+        if images is not None:
+            images.extend([None] * len(image_paths))
+        if self._template is not None or self.config.cascade:
+            return [self._page_outcome(path) for path in image_paths]
+
+        self._ensure_initialized()
+
+        outcomes: List[Any] = [None] * len(image_paths)
+        pages = []
+        crops: List[Any] = []
+        for index, image_path in enumerate(image_paths):
+            image_path = Path(image_path)
             try:
-                result = self.process_image(image_path)
-                results.append(result)
+                if not image_path.exists():
+                    raise FileNotFoundError(f"Image not found: {image_path}")
+                logger.info(f"Processing image: {image_path}")
+                with self.stats.timer("decode"):
+                    decoded = self._decoder.decode(image_path, as_array=True)
+                if images is not None and decoded.scale == 1.0:
+                    images[index] = decoded.data
+                blank = self._blank_page(image_path, decoded.data)
+                if blank is not None:
+                    self.stats.increment("images")
+                    outcomes[index] = blank
+                    continue
+                boxes = self._detect(decoded.data)
+                page_crops = [crop_box(decoded.data, box) for box in boxes]
             except Exception as e:
-                logger.error(f"Failed to process {image_path}: {e}")
+                outcomes[index] = e
+                continue
+            pages.append((index, image_path, decoded.scale, boxes, len(crops)))
+            crops.extend(page_crops)
+
+        try:
+            recognized = self._recognize(crops)
+        except Exception as e:
+            logger.error(f"Pooled recognition failed, retrying page by page: {e}")
+            for index, image_path, *_ in pages:
+                outcomes[index] = self._page_outcome(image_path)
+            return outcomes
+
+        for index, image_path, scale, boxes, start in pages:
+            lines = self._build_lines(boxes, recognized[start : start + len(boxes)])
+            if scale != 1.0:
+                _rescale_lines(lines, 1.0 / scale)
+            self.stats.increment("images")
+            self.stats.increment("lines", len(lines))
+            outcomes[index] = self._postprocess(OCRResult(image_path, lines))
+        return outcomes
+
+    def _page_outcome(
+        self, image_path: Union[str, Path]
+    ) -> Union["OCRResult", Exception]:
+        """Process one image, returning the exception instead of raising it."""
+        try:
+            return self._process_image(image_path)
+        except Exception as e:
+            return e
 
+    def _process_pages(
+        self,
+        image_paths: Iterable[Union[str, Path]],
+        on_page: Optional[PageCallback] = None,
+    ) -> List["OCRResult"]:
+        """Process images one at a time, logging and skipping failures."""
+        results = []
+        for image_path in image_paths:
+            try:
+                result, image = self._process_page(
+                    image_path, keep_image=on_page is not None
+                )
+            except Exception as e:
+                logger.error(f"Failed to process {image_path}: {e}")
+                continue
+            results.append(result)
+            if on_page is not None:
+                on_page(result, image)
         return results
 
     def export_results(
         self,
-        results: List["OCRResult"],
+        results: Iterable["OCRResult"],
         output_path: Optional[Union[str, Path]] = None,
-        format: str = "json",
-    ) -> Path:
+        format: Union[str, List[str]] = "json",
+        compress: Optional[str] = None,
+    ) -> Union[Path, List[Path]]:
         """
         Export OCR results to file.
 
+        Several formats (``"json,csv,xlsx"`` or a list) are written in one
+        pass over the results, each next to the others with its own suffix.
+
         Args:
-            results: List of OCRResult objects.
+            results: OCRResult objects (any iterable, consumed once).
             output_path: Output file path. If None, auto-generates.
-            format: Export format ('txt', 'json', 'csv').
+            format: Export format ('txt', 'json', 'jsonl', 'csv', 'xlsx',
+                   'bin', 'pdf'), or several of them.
+            compress: Stream the export through 'gzip' or 'zstd'. The
+                     matching suffix (.gz / .zst) is appended to the path.
+                     xlsx, bin and pdf cannot be compressed and are
+                     written uncompressed, with a warning.
 
         Returns:
-            Path to the exported file.
+            Path to the exported file, or a list of paths (in format order)
+            when several formats were requested.
         """
-        if format not in self.config.export_formats:
-            raise ValueError(f"Format {format} not enabled in config")
+        with self.create_export_writer(output_path, format, compress) as writers:
+            writers.write_all(results)
+        for path in writers.paths:
+            logger.info(f"Results exported to: {path}")
+        return writers.paths if len(writers.paths) > 1 else writers.paths[0]
 
-        output_path = output_path or self.config.output_dir / f"ocr_results.{format}"
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if format == "json":
-            self._export_json(results, output_path)
-        elif format == "csv":
-            self._export_csv(results, output_path)
-        elif format == "xlsx":
-            self._export_xlsx(results, output_path)
-        else:
-            self._export_txt(results, output_path)
-
-        logger.info(f"Results exported to: {output_path}")
-        return output_path
-
-    def _export_json(self, results: List["OCRResult"], path: Path) -> None:
-        """Export results as JSON."""
-        import json
-
-        data = [r.to_dict() for r in results]
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    def _export_csv(self, results: List["OCRResult"], path: Path) -> None:
-        """Export results as CSV."""
-        import csv
-
-        with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["file", "text", "confidence", "bbox"])
-            for r in results:
-                for line in r.lines:
-                    writer.writerow(
-                        [r.source_file, line.text, line.confidence, line.bbox]
-                    )
+    def create_export_writer(
+        self,
+        output_path: Optional[Union[str, Path]] = None,
+        format: Union[str, List[str]] = "json",
+        compress: Optional[str] = None,
+    ) -> MultiWriter:
+        """
+        Create the writers ``export_results`` would use, to stream results
+        into them while processing.
 
-    def _export_txt(self, results: List["OCRResult"], path: Path) -> None:
-        """Export results as plain text."""
-        with open(path, "w", encoding="utf-8") as f:
-            for r in results:
-                f.write(f"=== {r.source_file} ===\n")
-                f.write(r.text)
-                f.write("\n\n")
+        Passing its ``write`` as ``on_page`` to ``process_images`` exports
+        each page as soon as it is done, and lets the pdf writer reuse the
+        decoded image:
 
-    def _export_xlsx(self, results: List["OCRResult"], path: Path) -> None:
-        """Export results as Excel file (UTF-8 encoded)."""
-        try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-        except ImportError:
-            raise ImportError(
-                "openpyxl is required for Excel export. "
-                "Install it with: pip install openpyxl"
-            )
+        Example:
+            >>> with engine.create_export_writer("scans.pdf", "pdf") as writer:
+            ...     engine.process_images(paths, on_page=writer.write)
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "OCR Results"
-
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin")
-        )
+        Args:
+            output_path: Output file path. If None, auto-generates.
+            format: Export format or formats, as for ``export_results``.
+            compress: Compression for the text formats.
+
+        Returns:
+            An unopened MultiWriter, with one writer per format.
+        """
+        formats = parse_formats(format)
+        for fmt in formats:
+            if fmt not in self.config.export_formats:
+                raise ValueError(f"Format {fmt} not enabled in config")
+        for fmt in uncompressible_formats(formats, compress):
+            logger.warning(f"Format {fmt} cannot be compressed, writing it as is")
+
+        if len(formats) > 1:
+            base = output_path or self.config.output_dir / "ocr_results"
+            return create_multi_writer(formats, base, compress=compress)
+
+        format = formats[0]
+        compress = effective_compression(format, compress)
+        output_path = output_path or self.config.output_dir / f"ocr_results.{format}"
+        output_path = compressed_path(output_path, compress)
+        return MultiWriter([create_writer(format, output_path, compress=compress)])
 
-        # Write headers
-        headers = ["檔案", "行號", "文字內容", "信心分數", "座標"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # Write data
-        row_num = 2
-        for r in results:
-            for line_idx, line in enumerate(r.lines, 1):
-                ws.cell(row=row_num, column=1, value=str(r.source_file)).border = thin_border
-                ws.cell(row=row_num, column=2, value=line_idx).border = thin_border
-                ws.cell(row=row_num, column=3, value=line.text).border = thin_border
-                ws.cell(row=row_num, column=4, value=f"{line.confidence:.2%}").border = thin_border
-                ws.cell(row=row_num, column=5, value=str(line.bbox)).border = thin_border
-                row_num += 1
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 30  # 檔案
-        ws.column_dimensions["B"].width = 8   # 行號
-        ws.column_dimensions["C"].width = 60  # 文字內容
-        ws.column_dimensions["D"].width = 12  # 信心分數
-        ws.column_dimensions["E"].width = 40  # 座標
-
-        # Freeze header row
-        ws.freeze_panes = "A2"
-
-        wb.save(path)
+
+def _rescale_lines(lines: List["OCRLine"], factor: float) -> None:
+    """Scale line bboxes in place, e.g. back to original image coordinates."""
+    for line in lines:
+        line.bbox = [[x * factor, y * factor] for x, y in line.bbox]
 
 
 class OCRLine:
@@ -307,18 +965,167 @@ class OCRLine:
     def to_dict(self) -> Dict:
         return {"text": self.text, "confidence": self.confidence, "bbox": self.bbox}
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "OCRLine":
+        return cls(
+            str(data.get("text", "")),
+            float(data.get("confidence", 0.0)),
+            data.get("bbox") or [],
+        )
+
 
 class OCRResult:
     """Container for OCR processing results."""
 
-    def __init__(self, source_file: Path, lines: List[OCRLine]):
+    def __init__(
+        self,
+        source_file: Path,
+        lines: List[OCRLine],
+        fields: Optional[Dict[str, str]] = None,
+        blank: bool = False,
+    ):
         self.source_file = source_file
         self.lines = lines
+        self.fields = fields
+        self.blank = blank  # Skipped by blank page detection
+        # Layout and spatial index, built on first use for these lines
+        self._derived: Dict[str, Any] = {}
+        self._derived_key: Optional[Tuple[Any, ...]] = None
+
+    def _cached(self, name: str, build: Callable[[], T]) -> T:
+        """
+        Return ``build()``, cached until the lines change.
+
+        The cache key is a snapshot of the lines and their boxes, so
+        appending, replacing, removing or reordering lines and assigning a
+        new ``bbox`` (as rescaling does) all rebuild. Editing coordinates
+        inside an existing ``bbox`` list in place is not detected.
+        """
+        key = (
+            self.fields is None,
+            tuple(self.lines),
+            tuple(map(attrgetter("bbox"), self.lines)),
+        )
+        if self._derived_key != key:
+            self._derived_key = key
+            self._derived = {}
+        if name not in self._derived:
+            self._derived[name] = build()
+        return cast(T, self._derived[name])
+
+    @property
+    def layout(self) -> Optional[PageLayout]:
+        """
+        Rows, paragraphs and columns of the lines (see core/layout.py).
+
+        None when reading order cannot be derived: a line has no box, or
+        the lines are template regions, which keep the template's order.
+        """
+
+        def build() -> Optional[PageLayout]:
+            if self.fields is None and all(len(line.bbox) for line in self.lines):
+                return analyze_layout([line.bbox for line in self.lines])
+            return None
+
+        return self._cached("layout", build)
+
+    @property
+    def ordered_lines(self) -> List[OCRLine]:
+        """Lines in reading order (detector order without a layout)."""
+        layout = self.layout
+        if layout is None:
+            return list(self.lines)
+        return [self.lines[index] for index in layout.order]
+
+    @property
+    def paragraphs(self) -> List[List[OCRLine]]:
+        """Lines of each paragraph, in reading order."""
+        layout = self.layout
+        if layout is None:
+            return [list(self.lines)] if self.lines else []
+        return [[self.lines[i] for i in paragraph] for paragraph in layout.paragraphs]
+
+    @property
+    def columns(self) -> List[List[OCRLine]]:
+        """Lines of each column, in reading order."""
+        layout = self.layout
+        if layout is None:
+            return [list(self.lines)] if self.lines else []
+        return [
+            [self.lines[i] for paragraph in column for row in paragraph for i in row]
+            for column in layout.columns
+        ]
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """R-tree over the boxes of the lines that have one."""
+        return self._spatial()[0]
+
+    def _spatial(self) -> Tuple[SpatialIndex, List[OCRLine], Dict[int, int]]:
+        """The spatial index, its lines and their positions by ``id``."""
+
+        def build() -> Tuple[SpatialIndex, List[OCRLine], Dict[int, int]]:
+            boxed = [line for line in self.lines if len(line.bbox)]
+            positions = {id(line): i for i, line in enumerate(boxed)}
+            return SpatialIndex([line.bbox for line in boxed]), boxed, positions
+
+        return self._cached("spatial", build)
+
+    def lines_in(self, rect: Rect, contained: bool = True) -> List[OCRLine]:
+        """
+        Lines inside a rectangle, in detector order.
+
+        Args:
+            rect: (x0, y0, x1, y1) in page pixels.
+            contained: Only lines entirely inside; otherwise every line
+                       whose box intersects the rectangle.
+        """
+        index, boxed, _ = self._spatial()
+        return [boxed[i] for i in index.within(rect, contained)]
+
+    def nearest(self, point: Tuple[float, float]) -> Optional[OCRLine]:
+        """The line whose box is closest to an (x, y) point."""
+        index, boxed, _ = self._spatial()
+        found = index.nearest(point)
+        return None if found is None else boxed[found]
+
+    def right_of(self, line: OCRLine) -> Optional[OCRLine]:
+        """
+        The next line to the right on the same row, e.g. the value of a
+        form key. None if there is none or ``line`` has no box.
+        """
+        index, boxed, positions = self._spatial()
+        position = positions.get(id(line))
+        if position is None:
+            return None
+        found = index.right_of(position)
+        return None if found is None else boxed[found]
+
+    def normalize(self, normalizer: TextNormalizer) -> int:
+        """
+        Normalize the text of all lines and fields in place, in one pass.
+
+        Returns:
+            The number of lines and fields whose text changed.
+        """
+        texts = [line.text for line in self.lines]
+        names = list(self.fields or {})
+        if self.fields is not None:
+            texts.extend(self.fields[name] for name in names)
+        normalized = normalizer.normalize_lines(texts)
+
+        changed = sum(old != new for old, new in zip(texts, normalized))
+        for line, text in zip(self.lines, normalized):
+            line.text = text
+        if self.fields is not None:
+            for name, text in zip(names, normalized[len(self.lines) :]):
+                self.fields[name] = text
+        return changed
 
     @property
     def text(self) -> str:
-        """Get full text as a single string."""
-        return "\n".join(line.text for line in self.lines)
+        """Get full text as a single string, in reading order."""
+        return "\n".join(line.text for line in self.ordered_lines)
 
     @property
     def average_confidence(self) -> float:
@@ -351,11 +1158,49 @@ class OCRResult:
                         lines.append(OCRLine(text, confidence, bbox))
         return cls(source_file, lines)
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "OCRResult":
+        """Create OCRResult from its dictionary form (see ``to_dict``)."""
+        lines = [OCRLine.from_dict(item) for item in data.get("lines", [])]
+        return cls(
+            Path(data["source_file"]),
+            lines,
+            fields=data.get("fields"),
+            blank=bool(data.get("blank", False)),
+        )
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return {
+        data = {
             "source_file": str(self.source_file),
             "text": self.text,
             "average_confidence": self.average_confidence,
             "lines": [line.to_dict() for line in self.lines],
         }
+        if self.fields is not None:
+            data["fields"] = dict(self.fields)
+        if self.blank:
+            data["blank"] = True
+        return data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OCRResult":
+        """Create OCRResult from its binary form (see ``to_bytes``)."""
+        packed = unpack_result(data)
+        lines = [
+            OCRLine(text, confidence, bbox)
+            for text, confidence, bbox in zip(
+                packed.texts, packed.confidences, packed.bboxes
+            )
+        ]
+        return cls(
+            Path(packed.source_file), lines, fields=packed.fields, blank=packed.blank
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Convert to the compact binary form (see core/packing.py).
+
+        Boxes are stored as float32; text, confidences and fields exactly.
+        """
+        return pack_result(self)
@@ -0,0 +1,378 @@
+"""
+ONNX Runtime Backend Module
+
+CPU-friendly inference for the PP-OCR detection, direction classification
+and recognition models exported to ONNX (for example with paddle2onnx).
+``OnnxOCR`` mirrors the PaddleOCR 2.x ``ocr()`` call and result layout, so
+``OCREngine`` produces the same ``OCRResult`` with either backend and
+paddlepaddle never has to be imported.
+
+Model directory layout:
+
+    det.onnx    text detection (DB)
+    rec.onnx    text recognition (CTC)
+    cls.onnx    text direction classifier (optional)
+    keys.txt    recognition character dictionary, one character per line
+
+With ``OCRConfig.quantized`` the INT8 models ``det.int8.onnx`` and
+``rec.int8.onnx`` (see core/quantization.py) are loaded instead.
+"""
+
+import logging
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
+
+from .crops import crop_box, sort_boxes
+from .decoders import load_image
+
+if TYPE_CHECKING:
+    from .config import OCRConfig
+
+logger = logging.getLogger(__name__)
+
+# PP-OCR preprocessing constants (det uses ImageNet statistics on BGR input)
+DET_LIMIT_SIDE_LEN = 960
+DET_MEAN = (0.485, 0.456, 0.406)
+DET_STD = (0.229, 0.224, 0.225)
+CLS_IMAGE_SHAPE = (3, 48, 192)
+CLS_THRESH = 0.9
+CLS_BATCH_NUM = 6
+REC_IMAGE_SHAPE = (3, 48, 320)
+
+
+def _create_session(model_path: Path, config: "OCRConfig") -> Any:
+    """Create an ONNX Runtime session tuned for batch CPU inference."""
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        raise ImportError(
+            "onnxruntime is required for the onnxruntime backend. "
+            "Install it with: pip install onnxruntime"
+        )
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = config.cpu_threads
+    options.inter_op_num_threads = 1
+    options.enable_cpu_mem_arena = True
+    options.enable_mem_pattern = True
+    options.log_severity_level = 2 if config.show_log else 3
+
+    providers = ["CPUExecutionProvider"]
+    if config.use_gpu:
+        providers.insert(0, "CUDAExecutionProvider")
+    return ort.InferenceSession(
+        str(model_path), sess_options=options, providers=providers
+    )
+
+
+def _run(session: Any, blob: Any) -> Any:
+    """Run a single-input, single-output session."""
+    return session.run(None, {session.get_inputs()[0].name: blob})[0]
+
+
+def det_preprocess(image: Any, limit_side_len: int = DET_LIMIT_SIDE_LEN) -> Any:
+    """
+    Resize a BGR page so its longest side is at most ``limit_side_len`` and
+    both sides are multiples of 32, then normalise to an NCHW float blob.
+    """
+    import cv2
+    import numpy as np
+
+    height, width = image.shape[:2]
+    ratio = min(1.0, limit_side_len / max(height, width))
+    resized_h = max(32, int(round(height * ratio / 32)) * 32)
+    resized_w = max(32, int(round(width * ratio / 32)) * 32)
+    resized = cv2.resize(image, (resized_w, resized_h))
+
+    blob = resized.astype(np.float32) / 255.0
+    blob -= np.array(DET_MEAN, dtype=np.float32)
+    blob /= np.array(DET_STD, dtype=np.float32)
+    return blob.transpose(2, 0, 1)[np.newaxis]
+
+
+def _mini_box(points: Any) -> Tuple[Any, float]:
+    """Minimum-area rectangle as (tl, tr, br, bl) corners and its short side."""
+    import cv2
+    import numpy as np
+
+    rect = cv2.minAreaRect(points)
+    corners = sorted(cv2.boxPoints(rect).tolist(), key=lambda p: p[0])
+    top_left, bottom_left = sorted(corners[:2], key=lambda p: p[1])
+    top_right, bottom_right = sorted(corners[2:], key=lambda p: p[1])
+    box = np.array([top_left, top_right, bottom_right, bottom_left], np.float32)
+    return box, min(rect[1])
+
+
+def _box_score(pred: Any, box: Any) -> float:
+    """Mean probability inside a box (PaddleOCR's ``box_score_fast``)."""
+    import cv2
+    import numpy as np
+
+    height, width = pred.shape
+    xmin = int(np.clip(np.floor(box[:, 0].min()), 0, width - 1))
+    xmax = int(np.clip(np.ceil(box[:, 0].max()), 0, width - 1))
+    ymin = int(np.clip(np.floor(box[:, 1].min()), 0, height - 1))
+    ymax = int(np.clip(np.ceil(box[:, 1].max()), 0, height - 1))
+
+    mask = np.zeros((ymax - ymin + 1, xmax - xmin + 1), dtype=np.uint8)
+    shifted = box - np.array([xmin, ymin], dtype=np.float32)
+    cv2.fillPoly(mask, shifted.reshape(1, -1, 2).astype(np.int32), 1)
+    return cv2.mean(pred[ymin : ymax + 1, xmin : xmax + 1], mask)[0]
+
+
+def _unclip(box: Any, unclip_ratio: float) -> Tuple[Any, float]:
+    """
+    Expand a text kernel box by ``area * ratio / perimeter``.
+
+    For the rectangles DB produces, a rounded polygon offset followed by a
+    minimum-area rectangle (PaddleOCR's pyclipper path) is exactly the
+    rectangle grown by the offset on every side, so no clipper is needed.
+    """
+    import cv2
+
+    distance = cv2.contourArea(box) * unclip_ratio / cv2.arcLength(box, True)
+    center, (width, height), angle = cv2.minAreaRect(box)
+    grown = (center, (width + 2 * distance, height + 2 * distance), angle)
+    return _mini_box(cv2.boxPoints(grown))
+
+
+def db_postprocess(
+    pred: Any,
+    image_size: Tuple[int, int],
+    thresh: float = 0.3,
+    box_thresh: float = 0.6,
+    unclip_ratio: float = 1.5,
+    max_candidates: int = 1000,
+    min_size: int = 3,
+) -> List[Any]:
+    """
+    Turn a DB probability map into text boxes in source image coordinates.
+
+    Args:
+        pred: (H, W) probability map for the resized image.
+        image_size: (height, width) of the source image.
+        thresh: Binarisation threshold for the probability map.
+        box_thresh: Minimum mean probability inside a box.
+        unclip_ratio: How far to grow shrunken text kernels.
+
+    Returns:
+        Float32 (4, 2) corner arrays, clockwise from top-left.
+    """
+    import cv2
+    import numpy as np
+
+    src_height, src_width = image_size
+    height, width = pred.shape
+    bitmap = (pred > thresh).astype(np.uint8)
+    contours, _ = cv2.findContours(bitmap, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+    boxes = []
+    for contour in contours[:max_candidates]:
+        box, short_side = _mini_box(contour)
+        if short_side < min_size:
+            continue
+        if _box_score(pred, box) < box_thresh:
+            continue
+        box, short_side = _unclip(box, unclip_ratio)
+        if short_side < min_size + 2:
+            continue
+
+        box[:, 0] = np.clip(np.round(box[:, 0] / width * src_width), 0, src_width)
+        box[:, 1] = np.clip(np.round(box[:, 1] / height * src_height), 0, src_height)
+        box_width = int(np.linalg.norm(box[0] - box[1]))
+        box_height = int(np.linalg.norm(box[0] - box[3]))
+        if box_width <= 3 or box_height <= 3:
+            continue
+        boxes.append(box)
+    return boxes
+
+
+def _resize_norm(crop: Any, height: int, width: int) -> Any:
+    """
+    Resize a crop to ``height`` keeping its aspect ratio (at most ``width``
+    wide), normalise to [-1, 1] and right-pad to a (3, height, width) array.
+    """
+    import cv2
+    import numpy as np
+
+    crop_height, crop_width = crop.shape[:2]
+    resized_w = min(width, int(math.ceil(height * crop_width / crop_height)))
+    resized = cv2.resize(crop, (max(resized_w, 1), height)).astype(np.float32)
+    resized = (resized / 255.0 - 0.5) / 0.5
+
+    padded = np.zeros((3, height, width), dtype=np.float32)
+    padded[:, :, : resized.shape[1]] = resized.transpose(2, 0, 1)
+    return padded
+
+
+def rec_preprocess(crops: Sequence[Any]) -> Any:
+    """
+    Build a recognition batch blob.
+
+    The batch width follows the widest crop (at least the model's default
+    320 px), as PaddleOCR does, so long lines are not squashed.
+    """
+    import numpy as np
+
+    _, height, default_width = REC_IMAGE_SHAPE
+    max_ratio = max([default_width / height] + [c.shape[1] / c.shape[0] for c in crops])
+    width = int(height * max_ratio)
+    return np.stack([_resize_norm(c, height, width) for c in crops])
+
+
+def ctc_decode(probs: Any, characters: Sequence[str]) -> List[Tuple[str, float]]:
+    """
+    Greedy CTC decoding: merge repeats, drop blanks (index 0).
+
+    Args:
+        probs: (N, T, C) per-timestep class probabilities.
+        characters: Class index to character, with the blank at index 0.
+
+    Returns:
+        (text, mean probability of the kept characters) per sequence.
+    """
+    import numpy as np
+
+    indices = probs.argmax(axis=2)
+    scores = probs.max(axis=2)
+    decoded = []
+    for index_row, score_row in zip(indices, scores):
+        keep = index_row != 0
+        keep[1:] &= index_row[1:] != index_row[:-1]
+        text = "".join(characters[i] for i in index_row[keep])
+        decoded.append((text, float(np.mean(score_row[keep])) if keep.any() else 0.0))
+    return decoded
+
+
+def load_characters(keys_path: Path) -> List[str]:
+    """Read a PP-OCR character dictionary; adds the blank and space classes."""
+    with open(keys_path, "r", encoding="utf-8") as f:
+        keys = [line.rstrip("\r\n") for line in f]
+    return [""] + keys + [" "]
+
+
+class OnnxOCR:
+    """
+    PP-OCR pipeline on ONNX Runtime with a PaddleOCR 2.x compatible API.
+
+    Example:
+        >>> ocr = OnnxOCR(OCRConfig(backend="onnxruntime", onnx_model_dir="m"))
+        >>> result = ocr.ocr("page.png", cls=True)
+        >>> for box, (text, score) in result[0]:
+        ...     print(text, score)
+    """
+
+    def __init__(self, config: "OCRConfig"):
+        """
+        Load the ONNX models from ``config.onnx_model_dir``.
+
+        Raises:
+            FileNotFoundError: If a det/rec model or keys.txt is missing.
+            ImportError: If onnxruntime is not installed.
+        """
+        self.config = config
+        model_dir = Path(config.onnx_model_dir or "")
+        suffix = ".int8.onnx" if config.quantized else ".onnx"
+        det_path, rec_path = model_dir / f"det{suffix}", model_dir / f"rec{suffix}"
+        for path in (det_path, rec_path, model_dir / "keys.txt"):
+            if not path.exists():
+                raise FileNotFoundError(f"Model file not found: {path}")
+
+        self._det = _create_session(det_path, config)
+        self._rec = _create_session(rec_path, config)
+        cls_path = model_dir / "cls.onnx"
+        self._cls = _create_session(cls_path, config) if cls_path.exists() else None
+        self._characters = load_characters(model_dir / "keys.txt")
+        precision = "INT8" if config.quantized else "FP32"
+        logger.info(f"Loaded {precision} ONNX models from {model_dir}")
+
+    def ocr(
+        self,
+        img: Union[str, Path, Any, List[Any]],
+        det: bool = True,
+        rec: bool = True,
+        cls: bool = True,
+    ) -> List[Any]:
+        """
+        Run OCR with the same arguments and result layout as PaddleOCR 2.x.
+
+        Returns:
+            ``[[[box, (text, score)], ...]]`` for det+rec, ``[[box, ...]]``
+            for det only, and ``[[(text, score), ...]]`` when ``det=False``
+            (``img`` may then be a list of crops).
+        """
+        if not det:
+            crops = img if isinstance(img, list) else [img]
+            crops = [self._load(crop) for crop in crops]
+            if cls:
+                crops = self._classify(crops)
+            return [self._recognize(crops)]
+
+        image = self._load(img)
+        # Detected boxes are arrays; sort_boxes keeps them as they are
+        boxes: List[Any] = sort_boxes(self._detect(image))
+        if not rec:
+            return [[box.tolist() for box in boxes]]
+
+        crops = [crop_box(image, box) for box in boxes]
+        if cls:
+            crops = self._classify(crops)
+        lines = [
+            [box.tolist(), (text, score)]
+            for box, (text, score) in zip(boxes, self._recognize(crops))
+            if score >= self.config.drop_score
+        ]
+        return [lines]
+
+    @staticmethod
+    def _load(img: Any) -> Any:
+        return load_image(img) if isinstance(img, (str, Path)) else img
+
+    def _detect(self, image: Any) -> List[Any]:
+        pred = _run(self._det, det_preprocess(image))
+        return db_postprocess(
+            pred[0, 0],
+            image.shape[:2],
+            thresh=self.config.det_db_thresh,
+            box_thresh=self.config.det_db_box_thresh,
+            unclip_ratio=self.config.det_db_unclip_ratio,
+        )
+
+    def _classify(self, crops: List[Any]) -> List[Any]:
+        """Rotate crops the direction classifier reads as upside down."""
+        import cv2
+        import numpy as np
+
+        if self._cls is None or not crops:
+            return crops
+
+        _, height, width = CLS_IMAGE_SHAPE
+        crops = list(crops)
+        for start in range(0, len(crops), CLS_BATCH_NUM):
+            batch = crops[start : start + CLS_BATCH_NUM]
+            blob = np.stack([_resize_norm(c, height, width) for c in batch])
+            probs = _run(self._cls, blob)
+            for offset, row in enumerate(probs):
+                if row.argmax() == 1 and row[1] > CLS_THRESH:
+                    crops[start + offset] = cv2.rotate(
+                        crops[start + offset], cv2.ROTATE_180
+                    )
+        return crops
+
+    def _recognize(self, crops: List[Any]) -> List[Tuple[str, float]]:
+        """Recognize crops in batches of similar width, in input order."""
+        recognized: List[Optional[Tuple[str, float]]] = [None] * len(crops)
+        # Sorting by aspect ratio keeps padding small within each batch
+        order = sorted(
+            range(len(crops)), key=lambda i: crops[i].shape[1] / crops[i].shape[0]
+        )
+        batch_size = max(1, self.config.rec_batch_num)
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            probs = _run(self._rec, rec_preprocess([crops[i] for i in indices]))
+            for i, reading in zip(indices, ctc_decode(probs, self._characters)):
+                recognized[i] = reading
+        return [reading or ("", 0.0) for reading in recognized]
@@ -0,0 +1,170 @@
+"""
+Binary Result Format Module
+
+A compact, versioned binary layout for OCRResult, for passing results
+between processes, caching them and the ``bin`` export. Encoding and
+decoding are a handful of ``struct`` calls over whole columns (all
+confidences, all box coordinates, all string lengths) and a single UTF-8
+encode/decode of all text, instead of one JSON object per line.
+
+Record layout (little-endian)::
+
+    header   magic b"SOCR", version (u16), body length (u32)
+    flags    u8: 1 = blank page, 2 = has template fields
+    counts   lines n (u32), strings m (u32)
+    lengths  m x u32: code points of each string
+    scores   n x f64: line confidences
+    points   n x u16: box points of each line (0 = no box)
+    coords   2 x sum(points) x f32: box x, y coordinates
+    text     UTF-8 of all strings, concatenated
+
+Strings are the source file, the n line texts, then the names and values
+of the template fields. Coordinates are stored as float32, which is exact
+for integer pixel positions. A file of results is a plain concatenation
+of records, so it can be appended to and read as a stream.
+"""
+
+import struct
+from itertools import accumulate
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .ocr_engine import OCRResult
+
+MAGIC = b"SOCR"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")  # magic, version, body length
+_COUNTS = struct.Struct("<BII")  # flags, lines, strings
+
+_BLANK = 1
+_FIELDS = 2
+
+
+class PackedResult(NamedTuple):
+    """A decoded record as columns, ready to build an OCRResult from."""
+
+    source_file: str
+    texts: List[str]
+    confidences: Tuple[float, ...]
+    bboxes: List[List[List[float]]]
+    fields: Optional[Dict[str, str]]
+    blank: bool
+
+
+def pack_result(result: "OCRResult") -> bytes:
+    """Encode a result as one binary record (header included)."""
+    lines = result.lines
+    count = len(lines)
+    strings = [str(result.source_file)]
+    strings.extend(line.text for line in lines)
+    flags = _BLANK if result.blank else 0
+    if result.fields is not None:
+        flags |= _FIELDS
+        for name, value in result.fields.items():
+            strings.append(name)
+            strings.append(value)
+
+    points = [len(line.bbox) for line in lines]
+    coords = [value for line in lines for point in line.bbox for value in point[:2]]
+    body = b"".join(
+        (
+            _COUNTS.pack(flags, count, len(strings)),
+            struct.pack(f"<{len(strings)}I", *map(len, strings)),
+            struct.pack(f"<{count}d", *(line.confidence for line in lines)),
+            struct.pack(f"<{count}H", *points),
+            struct.pack(f"<{len(coords)}f", *coords),
+            "".join(strings).encode("utf-8"),
+        )
+    )
+    return HEADER.pack(MAGIC, VERSION, len(body)) + body
+
+
+def unpack_result(data: bytes) -> PackedResult:
+    """
+    Decode one binary record.
+
+    Raises:
+        ValueError: If the data is not a record, is truncated, or was
+                    written by a newer format version.
+    """
+    view = memoryview(data)
+    length = _check_header(view[: HEADER.size])
+    if len(view) < HEADER.size + length:
+        raise ValueError("Truncated binary result")
+
+    offset = HEADER.size
+    flags, count, string_count = _COUNTS.unpack_from(view, offset)
+    offset += _COUNTS.size
+    lengths = struct.unpack_from(f"<{string_count}I", view, offset)
+    offset += 4 * string_count
+    confidences = struct.unpack_from(f"<{count}d", view, offset)
+    offset += 8 * count
+    points = struct.unpack_from(f"<{count}H", view, offset)
+    offset += 2 * count
+    total = 2 * sum(points)
+    coords = struct.unpack_from(f"<{total}f", view, offset)
+    offset += 4 * total
+    text = bytes(view[offset : HEADER.size + length]).decode("utf-8")
+
+    ends = list(accumulate(lengths))
+    strings = [text[end - size : end] for size, end in zip(lengths, ends)]
+
+    # Pair all coordinates at once, then slice each line's points
+    values = iter(coords)
+    pairs = list(map(list, zip(values, values)))
+    starts = accumulate(points, initial=0)
+    bboxes = [pairs[start : start + size] for start, size in zip(starts, points)]
+
+    fields = None
+    if flags & _FIELDS:
+        extra = strings[1 + count :]
+        fields = dict(zip(extra[0::2], extra[1::2]))
+    return PackedResult(
+        strings[0],
+        strings[1 : 1 + count],
+        confidences,
+        bboxes,
+        fields,
+        bool(flags & _BLANK),
+    )
+
+
+def iter_records(f: IO[bytes]) -> Iterator[bytes]:
+    """
+    Stream the records of a binary results file, one record at a time.
+
+    Raises:
+        ValueError: On a corrupt, truncated or newer-version record.
+    """
+    while True:
+        header = f.read(HEADER.size)
+        if not header:
+            return
+        if len(header) < HEADER.size:
+            raise ValueError("Truncated binary result")
+        body = f.read(_check_header(header))
+        yield header + body
+
+
+def _check_header(header: Union[bytes, memoryview]) -> int:
+    """Validate a record header and return the body length."""
+    if len(header) < HEADER.size:
+        raise ValueError("Truncated binary result")
+    magic, version, length = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a binary OCR result")
+    if version > VERSION:
+        raise ValueError(
+            f"Binary result version {version} is newer than supported ({VERSION})"
+        )
+    return int(length)
@@ -0,0 +1,376 @@
+"""
+Searchable PDF Module
+
+Streams image PDFs with an invisible text layer, one page at a time. Each
+page is written to the file as soon as it is added (image, content stream
+and page object), so memory holds only the page being written plus the
+byte offsets of the objects for the cross-reference table. The shared
+font, page tree and catalog are written when the document is finished.
+
+JPEG sources are embedded as they are (DCTDecode), without decoding or
+re-encoding a pixel. Other images are decoded and stored losslessly with
+Flate compression, unless the caller passes the pixels it already holds.
+
+Text is drawn in render mode 3 (invisible) with a Type0 font using the
+Identity-H encoding. Character codes are assigned per document as new
+characters appear, and a ToUnicode map written at the end turns them
+back into text for search, selection and copying. The font is not
+embedded: invisible text never draws a glyph. Each line is scaled and
+rotated onto its box, so selections line up with the scanned text.
+"""
+
+import logging
+import math
+import zlib
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .ocr_engine import OCRLine, OCRResult
+
+logger = logging.getLogger(__name__)
+
+# Resolution assumed for images that do not record a plausible one
+DEFAULT_DPI = 300
+# Page size (pixels at DEFAULT_DPI) when the source image is missing: A4
+_FALLBACK_SIZE = (2480, 3508)
+# Advance width of every character, in 1/1000 of the font size
+_CHAR_WIDTH = 500
+
+# Objects written by finish(); pages are numbered after them
+_CATALOG, _PAGES, _FONT, _CID_FONT, _DESCRIPTOR, _TO_UNICODE = range(1, 7)
+_FIRST_PAGE_OBJECT = 7
+
+
+class SearchablePdf:
+    """
+    Streaming writer of image PDFs with an invisible text layer.
+
+    Example:
+        >>> with open("archive.pdf", "wb") as f:
+        ...     pdf = SearchablePdf(f)
+        ...     for result in results:
+        ...         pdf.add_page(result)
+        ...     pdf.finish()
+    """
+
+    def __init__(self, file: IO[bytes]):
+        """
+        Start a document and write the PDF header.
+
+        Args:
+            file: Binary file opened for writing.
+        """
+        self._file = file
+        self._position = 0
+        self._offsets: Dict[int, int] = {}
+        self._next_object = _FIRST_PAGE_OBJECT
+        self._pages: List[int] = []
+        # Character code of each character used so far (0 is unused)
+        self._codes: Dict[str, int] = {}
+        self._write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def add_page(self, result: "OCRResult", image: Any = None) -> None:
+        """
+        Write one page: the source image with the result's text over it.
+
+        Args:
+            result: OCR result; line boxes are in source image pixels.
+            image: The source image as a decoded BGR or greyscale array at
+                   full resolution, if the caller has it. JPEG sources are
+                   embedded from the file even so, as that is smaller.
+        """
+        source = Path(result.source_file)
+        embedded = _load_image(source, image)
+        if embedded is None:
+            logger.warning(f"Source image not found, writing text only: {source}")
+            width, height = _text_extent(result.lines)
+            dpi: Tuple[float, float] = (DEFAULT_DPI, DEFAULT_DPI)
+        else:
+            width, height, dpi = embedded.width, embedded.height, embedded.dpi
+
+        # Points per pixel; PDF y runs up from the bottom of the page
+        sx, sy = 72.0 / dpi[0], 72.0 / dpi[1]
+        page_width, page_height = width * sx, height * sy
+
+        resources = [f"/Font << /F1 {_FONT} 0 R >>"]
+        commands = []
+        if embedded is not None:
+            image_object = self._add_object(embedded.dictionary(), embedded.data)
+            resources.append(f"/XObject << /Im0 {image_object} 0 R >>")
+            commands.append(
+                f"q {page_width:.2f} 0 0 {page_height:.2f} 0 0 cm /Im0 Do Q"
+            )
+
+        text = [
+            self._line_commands(line, sx, sy, page_height)
+            for line in result.lines
+            if line.text and len(line.bbox) >= 2
+        ]
+        if text:
+            commands.append("BT 3 Tr")
+            commands.extend(command for command in text if command)
+            commands.append("ET")
+
+        content = zlib.compress("\n".join(commands).encode("ascii"))
+        content_object = self._add_object(
+            f"/Length {len(content)} /Filter /FlateDecode", content
+        )
+        page_object = self._add_object(
+            f"/Type /Page /Parent {_PAGES} 0 R "
+            f"/MediaBox [0 0 {page_width:.2f} {page_height:.2f}] "
+            f"/Resources << {' '.join(resources)} >> "
+            f"/Contents {content_object} 0 R"
+        )
+        self._pages.append(page_object)
+        self._file.flush()
+
+    def finish(self) -> None:
+        """Write the font, page tree, catalog and cross-reference table."""
+        self._write_to_unicode()
+        self._write_object(
+            _DESCRIPTOR,
+            "/Type /FontDescriptor /FontName /GlyphLessFont /Flags 5 "
+            f"/FontBBox [0 0 {_CHAR_WIDTH} 1000] /ItalicAngle 0 "
+            "/Ascent 1000 /Descent 0 /CapHeight 1000 /StemV 80",
+        )
+        self._write_object(
+            _CID_FONT,
+            "/Type /Font /Subtype /CIDFontType2 /BaseFont /GlyphLessFont "
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) "
+            f"/Supplement 0 >> /FontDescriptor {_DESCRIPTOR} 0 R "
+            f"/DW {_CHAR_WIDTH} /CIDToGIDMap /Identity",
+        )
+        self._write_object(
+            _FONT,
+            "/Type /Font /Subtype /Type0 /BaseFont /GlyphLessFont "
+            f"/Encoding /Identity-H /DescendantFonts [{_CID_FONT} 0 R] "
+            f"/ToUnicode {_TO_UNICODE} 0 R",
+        )
+        kids = " ".join(f"{page} 0 R" for page in self._pages)
+        self._write_object(
+            _PAGES, f"/Type /Pages /Kids [{kids}] /Count {len(self._pages)}"
+        )
+        self._write_object(_CATALOG, f"/Type /Catalog /Pages {_PAGES} 0 R")
+
+        start = self._position
+        size = self._next_object
+        rows = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        rows.extend(
+            f"{self._offsets[number]:010d} 00000 n \n" for number in range(1, size)
+        )
+        rows.append(f"trailer\n<< /Size {size} /Root {_CATALOG} 0 R >>\n")
+        rows.append(f"startxref\n{start}\n%%EOF\n")
+        self._write("".join(rows).encode("ascii"))
+
+    def _line_commands(
+        self, line: "OCRLine", sx: float, sy: float, page_height: float
+    ) -> str:
+        """Text operators placing one line invisibly over its box."""
+        points = [
+            (float(point[0]) * sx, page_height - float(point[1]) * sy)
+            for point in line.bbox
+        ]
+        if len(points) == 4:
+            # Detector order: top-left, top-right, bottom-right, bottom-left
+            (left, top), _, (right, bottom), origin = points
+            dx, dy = right - origin[0], bottom - origin[1]
+            length = math.hypot(dx, dy)
+            size = math.hypot(left - origin[0], top - origin[1])
+        else:
+            xs, ys = [p[0] for p in points], [p[1] for p in points]
+            dx, dy = max(xs) - min(xs), 0.0
+            length, size = dx, max(ys) - min(ys)
+            origin = (min(xs), min(ys))
+        if length <= 0 or size <= 0:
+            return ""
+
+        cos, sin = dx / length, dy / length
+        scale = 100.0 * length / (len(line.text) * size * _CHAR_WIDTH / 1000)
+        codes = "".join(f"{self._code(char):04X}" for char in line.text)
+        return (
+            f"/F1 {size:.2f} Tf {scale:.2f} Tz "
+            f"{cos:.4f} {sin:.4f} {-sin:.4f} {cos:.4f} "
+            f"{origin[0]:.2f} {origin[1]:.2f} Tm <{codes}> Tj"
+        )
+
+    def _code(self, char: str) -> int:
+        """Two-byte character code of a character, assigned on first use."""
+        code = self._codes.get(char)
+        if code is None:
+            code = len(self._codes) + 1
+            if code > 0xFFFF:
+                raise ValueError("More distinct characters than a PDF font holds")
+            self._codes[char] = code
+        return code
+
+    def _write_to_unicode(self) -> None:
+        """Write the map from character codes back to Unicode text."""
+        entries = [
+            f"<{code:04X}> <{char.encode('utf-16-be').hex().upper()}>"
+            for char, code in self._codes.items()
+        ]
+        blocks = []
+        # At most 100 entries per bfchar block
+        for start in range(0, len(entries), 100):
+            chunk = entries[start : start + 100]
+            blocks.append(
+                f"{len(chunk)} beginbfchar\n" + "\n".join(chunk) + "\nendbfchar"
+            )
+        cmap = "\n".join(
+            [
+                "/CIDInit /ProcSet findresource begin",
+                "12 dict begin",
+                "begincmap",
+                "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) "
+                "/Supplement 0 >> def",
+                "/CMapName /Adobe-Identity-UCS def",
+                "/CMapType 2 def",
+                "1 begincodespacerange",
+                "<0000> <FFFF>",
+                "endcodespacerange",
+                *blocks,
+                "endcmap",
+                "CMapName currentdict /CMap defineresource pop",
+                "end",
+                "end",
+            ]
+        ).encode("ascii")
+        data = zlib.compress(cmap)
+        self._write_object(
+            _TO_UNICODE, f"/Length {len(data)} /Filter /FlateDecode", data
+        )
+
+    def _add_object(self, dictionary: str, stream: Optional[bytes] = None) -> int:
+        """Write a new object with the next free number and return it."""
+        number = self._next_object
+        self._next_object += 1
+        self._write_object(number, dictionary, stream)
+        return number
+
+    def _write_object(
+        self, number: int, dictionary: str, stream: Optional[bytes] = None
+    ) -> None:
+        self._offsets[number] = self._position
+        self._write(f"{number} 0 obj\n<< {dictionary} >>\n".encode("ascii"))
+        if stream is not None:
+            self._write(b"stream\n")
+            self._write(stream)
+            self._write(b"\nendstream\n")
+        self._write(b"endobj\n")
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._position += len(data)
+
+
+class _PageImage:
+    """An image ready to embed: encoded data and its dictionary entries."""
+
+    def __init__(
+        self,
+        data: bytes,
+        size: Tuple[int, int],
+        colors: int,
+        encoding: str,
+        dpi: Tuple[float, float],
+    ):
+        self.data = data
+        self.width, self.height = size
+        self.colors = colors
+        self.encoding = encoding
+        self.dpi = dpi
+
+    def dictionary(self) -> str:
+        space = "/DeviceGray" if self.colors == 1 else "/DeviceRGB"
+        return (
+            f"/Type /XObject /Subtype /Image /Width {self.width} "
+            f"/Height {self.height} /ColorSpace {space} /BitsPerComponent 8 "
+            f"/Filter /{self.encoding} /Length {len(self.data)}"
+        )
+
+
+def _load_image(path: Path, image: Any) -> Optional[_PageImage]:
+    """
+    The page image to embed: the JPEG file itself when it can be used as
+    is, else the given array, else the file decoded. None if neither the
+    file nor an array is available.
+    """
+    info = _image_info(path)
+    if info is not None:
+        format, mode, size, dpi, orientation = info
+        # EXIF-rotated JPEGs are decoded: boxes refer to the upright image
+        if format == "JPEG" and mode in ("L", "RGB") and orientation == 1:
+            colors = 1 if mode == "L" else 3
+            return _PageImage(path.read_bytes(), size, colors, "DCTDecode", dpi)
+        grey = mode in ("1", "L")
+    elif image is None:
+        return None
+    else:
+        dpi, grey = (DEFAULT_DPI, DEFAULT_DPI), False
+
+    if image is None:
+        image = _decode(path, grey)
+    return _flate_image(image, dpi)
+
+
+def _image_info(path: Path) -> Optional[Tuple[str, str, Tuple[int, int], Any, int]]:
+    """(format, mode, size, dpi, EXIF orientation) from the file header."""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as img:
+            dpi = img.info.get("dpi") or (0, 0)
+            dpi = tuple(float(value) for value in dpi[:2])
+            if min(dpi) < 50:
+                # Missing or placeholder (e.g. 1x1 aspect-only JFIF) density
+                dpi = (DEFAULT_DPI, DEFAULT_DPI)
+            orientation = 1
+            if img.format == "JPEG":
+                orientation = img.getexif().get(0x0112, 1)
+            return img.format or "", img.mode, img.size, dpi, orientation
+    except (OSError, ValueError):
+        return None
+
+
+def _decode(path: Path, grey: bool) -> Any:
+    """Decode an image file to a BGR or greyscale array."""
+    import cv2
+    import numpy as np
+
+    from .decoders import load_image
+
+    if not grey:
+        return load_image(path)
+    image = cv2.imdecode(np.fromfile(str(path), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        raise ValueError(f"Cannot decode image: {path}")
+    return image
+
+
+def _flate_image(image: Any, dpi: Tuple[float, float]) -> _PageImage:
+    """Losslessly compress a BGR or greyscale array for embedding."""
+    import cv2
+    import numpy as np
+
+    if image.ndim == 3 and image.shape[2] == 1:
+        image = image[:, :, 0]
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    data = zlib.compress(np.ascontiguousarray(image, dtype=np.uint8).tobytes(), 6)
+    height, width = image.shape[:2]
+    colors = 1 if image.ndim == 2 else 3
+    return _PageImage(data, (width, height), colors, "FlateDecode", dpi)
+
+
+def _text_extent(lines: List["OCRLine"]) -> Tuple[int, int]:
+    """Page size covering all boxes, when there is no image to size it."""
+    xs = [float(p[0]) for line in lines for p in line.bbox]
+    ys = [float(p[1]) for line in lines for p in line.bbox]
+    if not xs:
+        return _FALLBACK_SIZE
+    return max(1, math.ceil(max(xs))), max(1, math.ceil(max(ys)))
@@ -0,0 +1,104 @@
+"""
+Predictor Pool Module
+
+A bounded pool of OCR predictors for an engine shared by many threads.
+PaddleOCR and ONNX Runtime pipelines keep per-call state and are not
+reentrant, so each model call checks out a predictor of its own and
+returns it afterwards. Predictors are created on demand, up to the pool
+size; a caller that finds all of them busy waits for the next one free.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+
+class PredictorPool:
+    """
+    Bounded pool of predictors, checked out one call at a time.
+
+    Example:
+        >>> pool = PredictorPool(first, factory=create_predictor, size=4)
+        >>> with pool.checkout() as predictor:
+        ...     result = predictor.ocr(image)
+    """
+
+    def __init__(self, primary: Any, factory: Callable[[], Any], size: int = 1):
+        """
+        Initialize the pool.
+
+        Args:
+            primary: The first, already created predictor.
+            factory: Creates a further predictor.
+            size: Most predictors ever created, ``primary`` included.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.primary = primary
+        self.size = size
+        self._factory = factory
+        # Idle predictors, most recently returned last: reusing a warm one
+        # first keeps rarely needed extras from being created at all
+        self._idle: List[Any] = [primary]
+        self._created = 1
+        self._condition = threading.Condition()
+
+    @property
+    def created(self) -> int:
+        """Number of predictors created so far."""
+        with self._condition:
+            return self._created
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Borrow a predictor for the enclosed block."""
+        predictor = self._acquire()
+        try:
+            yield predictor
+        finally:
+            self._release(predictor)
+
+    def fill(self) -> None:
+        """Create the remaining predictors now, e.g. during warmup."""
+        while self._reserve():
+            self._release(self._create())
+
+    def _acquire(self) -> Any:
+        """Take an idle predictor, create one, or wait for one."""
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        # Created outside the lock: loading models takes seconds
+        return self._create()
+
+    def _reserve(self) -> bool:
+        """Claim a slot for a new predictor, if the pool is not full."""
+        with self._condition:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _create(self) -> Any:
+        """Create a predictor for a reserved slot, freeing it on failure."""
+        try:
+            predictor = self._factory()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        logger.debug(f"Created predictor {self.created}/{self.size}")
+        return predictor
+
+    def _release(self, predictor: Any) -> None:
+        """Return a predictor and wake one waiting caller."""
+        with self._condition:
+            self._idle.append(predictor)
+            self._condition.notify()
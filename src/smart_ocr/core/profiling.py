@@ -0,0 +1,83 @@
+"""
+Profiling Module
+
+Lightweight counters and stage timers collected by the OCR engine, used
+for the ``--profile`` run summary.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class EngineStats:
+    """
+    Thread-safe counters and cumulative stage timings.
+
+    Example:
+        >>> stats = EngineStats()
+        >>> with stats.timer("ocr"):
+        ...     run_model()
+        >>> stats.increment("images")
+        >>> print(stats.format())
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, float] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add elapsed seconds to a stage."""
+        with self._lock:
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block and add it to ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def get(self, name: str) -> int:
+        """Return a counter value (0 if never incremented)."""
+        return self.counters.get(name, 0)
+
+    def reset(self) -> None:
+        """Clear all counters and timings."""
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Convert to dictionary for serialization."""
+        with self._lock:
+            return {"counters": dict(self.counters), "timings": dict(self.timings)}
+
+    def format(self) -> str:
+        """Render a human-readable summary table."""
+        data = self.to_dict()
+        lines = ["Profile:"]
+        counters = data["counters"]
+        for name, value in sorted(counters.items()):
+            lines.append(f"  {name:<24} {value:>10}")
+        lookups = counters.get("rec_cache_hits", 0) + counters.get(
+            "rec_cache_misses", 0
+        )
+        if lookups:
+            hit_rate = counters.get("rec_cache_hits", 0) / lookups
+            lines.append(f"  {'rec_cache_hit_rate':<24} {hit_rate:>10.1%}")
+        if counters.get("micro_batches"):
+            mean = counters.get("micro_batch_items", 0) / counters["micro_batches"]
+            lines.append(f"  {'micro_batch_mean_size':<24} {mean:>10.2f}")
+        for stage, seconds in sorted(data["timings"].items()):
+            lines.append(f"  {stage + ' time':<24} {seconds:>9.3f}s")
+        return "\n".join(lines)
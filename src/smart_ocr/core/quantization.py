@@ -0,0 +1,132 @@
+"""
+Model Quantization Module
+
+Static INT8 quantization of the ONNX detection and recognition models
+against a calibration directory of representative scans. The quantized
+models are written next to the originals as ``det.int8.onnx`` and
+``rec.int8.onnx`` and are loaded with ``OCRConfig(quantized=True)``.
+"""
+
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+
+from .crops import crop_box
+from .decoders import load_image
+from .onnx_backend import det_preprocess, rec_preprocess
+
+if TYPE_CHECKING:
+    from .config import OCRConfig
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_MODELS = {"det.onnx": "det.int8.onnx", "rec.onnx": "rec.int8.onnx"}
+
+
+class _CalibrationReader:
+    """
+    Feeds preprocessed blobs to ``onnxruntime.quantization``.
+
+    Implements the CalibrationDataReader protocol (``get_next`` / ``rewind``)
+    and builds blobs lazily, so large calibration sets never sit in memory.
+    """
+
+    def __init__(self, input_name: str, make_blobs: Any):
+        self.input_name = input_name
+        self._make_blobs = make_blobs
+        self._blobs: Iterator[Any] = iter(())
+        self.rewind()
+
+    def get_next(self) -> Optional[Dict[str, Any]]:
+        blob = next(self._blobs, None)
+        return None if blob is None else {self.input_name: blob}
+
+    def rewind(self) -> None:
+        self._blobs = iter(self._make_blobs())
+
+
+def find_calibration_images(
+    directory: Union[str, Path], max_images: int = 50
+) -> List[Path]:
+    """List up to ``max_images`` images from a calibration directory."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory}")
+    extensions = {".png", ".jpg", ".jpeg", ".bmp", ".tiff"}
+    images = sorted(
+        p
+        for p in directory.rglob("*")
+        if p.is_file() and p.suffix.lower() in extensions
+    )
+    if not images:
+        raise ValueError(f"No calibration images found in {directory}")
+    return images[:max_images]
+
+
+def quantize_models(
+    config: "OCRConfig",
+    calibration_dir: Union[str, Path],
+    max_images: int = 50,
+    per_channel: bool = False,
+) -> List[Path]:
+    """
+    Quantize the detection and recognition models to INT8.
+
+    Detection is calibrated on the preprocessed calibration pages;
+    recognition on the text crops the FP32 detector finds in them.
+
+    Args:
+        config: Configuration whose ``onnx_model_dir`` holds the FP32 models.
+        calibration_dir: Directory of representative document images.
+        max_images: Number of calibration images to use.
+        per_channel: Quantize weights per output channel (slower to
+                     calibrate, usually more accurate).
+
+    Returns:
+        Paths of the written INT8 models.
+    """
+    try:
+        from onnxruntime.quantization import QuantFormat, QuantType, quantize_static
+    except ImportError:
+        raise ImportError(
+            "onnxruntime and onnx are required for quantization. "
+            "Install them with: pip install onnxruntime onnx"
+        )
+    from .onnx_backend import OnnxOCR
+
+    images = find_calibration_images(calibration_dir, max_images)
+    model_dir = Path(config.onnx_model_dir or "")
+    # Crops for rec calibration come from the unquantized detector
+    detector = OnnxOCR(replace(config, quantized=False))
+
+    def det_blobs() -> Iterator[Any]:
+        for image_path in images:
+            yield det_preprocess(load_image(image_path))
+
+    def rec_blobs() -> Iterator[Any]:
+        for image_path in images:
+            image = load_image(image_path)
+            crops = [crop_box(image, box) for box in detector._detect(image)]
+            for start in range(0, len(crops), config.rec_batch_num):
+                yield rec_preprocess(crops[start : start + config.rec_batch_num])
+
+    written = []
+    for source, session, blobs in (
+        ("det.onnx", detector._det, det_blobs),
+        ("rec.onnx", detector._rec, rec_blobs),
+    ):
+        source_path = model_dir / source
+        target_path = model_dir / QUANTIZED_MODELS[source]
+        logger.info(f"Quantizing {source_path} on {len(images)} images")
+        quantize_static(
+            str(source_path),
+            str(target_path),
+            _CalibrationReader(session.get_inputs()[0].name, blobs),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+        )
+        written.append(target_path)
+    return written
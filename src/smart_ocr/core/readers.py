@@ -0,0 +1,294 @@
+"""
+Result Readers Module
+
+Load exported OCR results back into OCRResult objects. Readers stream one
+result at a time so large exports (and shard outputs being merged) never
+have to fit in memory.
+"""
+
+import ast
+import csv
+import gzip
+import heapq
+import io
+import json
+import logging
+import re
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Union
+
+from .ocr_engine import OCRLine, OCRResult
+from .packing import iter_records
+from .writers import COMPRESSION_SUFFIXES, _zstandard
+
+logger = logging.getLogger(__name__)
+
+_TXT_HEADER = re.compile(r"^=== (.*) ===$")
+
+# Formats that keep everything in an OCRResult. txt, csv and xlsx drop
+# confidences, results without lines, blank flags or template fields.
+LOSSLESS_FORMATS = ("json", "jsonl", "bin")
+
+
+def detect_compression(path: Union[str, Path]) -> Union[str, None]:
+    """Return 'gzip' or 'zstd' for compressed exports, None otherwise."""
+    suffix = Path(path).suffix.lower()
+    for compress, compress_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compress_suffix:
+            return compress
+    return None
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Infer the export format of a file from its suffix (e.g. .json.gz)."""
+    path = Path(path)
+    if detect_compression(path):
+        path = path.with_suffix("")
+    fmt = path.suffix.lower().lstrip(".")
+    if fmt not in READERS:
+        raise ValueError(f"Cannot read results from {path}: unknown format")
+    return fmt
+
+
+def open_text(path: Union[str, Path]) -> IO[str]:
+    """
+    Open an export for streaming text reads, decompressing on the fly.
+
+    Concatenated gzip members and zstd frames (written by appending) are
+    read as one continuous stream.
+    """
+    path = Path(path)
+    compress = detect_compression(path)
+    if compress == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if compress == "zstd":
+        raw = open(path, "rb")
+        stream: Any = (
+            _zstandard()
+            .ZstdDecompressor()
+            .stream_reader(raw, read_across_frames=True, closefd=True)
+        )
+        return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def read_results(path: Union[str, Path], format: str = "") -> Iterator[OCRResult]:
+    """
+    Stream the results stored in an export file.
+
+    Args:
+        path: Export file path.
+        format: Export format. Inferred from the suffix when empty.
+
+    Yields:
+        OCRResult objects in file order.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Results file not found: {path}")
+    return READERS[format or detect_format(path)](path)
+
+
+def check_mergeable(path: Union[str, Path]) -> str:
+    """
+    Return the format of a merge input, refusing lossy formats.
+
+    Raises:
+        ValueError: If the format is unknown or not one of
+                    ``LOSSLESS_FORMATS``.
+    """
+    fmt = detect_format(path)
+    if fmt not in LOSSLESS_FORMATS:
+        raise ValueError(
+            f"Cannot merge {path}: {fmt} exports lose results or confidences; "
+            f"write shards as {', '.join(LOSSLESS_FORMATS)}"
+        )
+    return fmt
+
+
+def merge_results(paths: Iterable[Union[str, Path]]) -> Iterator[OCRResult]:
+    """
+    Merge several exports into a single stream ordered by source file.
+
+    The inputs are combined with a streaming k-way merge, reading each
+    once. This relies on each input being sorted by source file, as
+    written by ``process_directory``. An input that turns out not to be
+    (``--no-sort``, ``--files-from``, watch or supervised output) is
+    reported with a warning when the merge reaches it. Every result is
+    still emitted, but the output is then not fully in source-file order.
+
+    Args:
+        paths: Export files in lossless formats (json, jsonl, bin); these
+               may be mixed.
+
+    Yields:
+        OCRResult objects in source-file order.
+
+    Raises:
+        ValueError: If an input is in a lossy or unknown format.
+    """
+    paths = list(paths)
+    formats = [check_mergeable(path) for path in paths]
+    streams = [
+        _check_order(path, read_results(path, fmt)) for path, fmt in zip(paths, formats)
+    ]
+    return heapq.merge(*streams, key=lambda r: Path(r.source_file))
+
+
+def _check_order(
+    path: Union[str, Path], results: Iterator[OCRResult]
+) -> Iterator[OCRResult]:
+    """Pass a result stream through, warning once if it is out of order."""
+    previous = None
+    for result in results:
+        key = Path(result.source_file)
+        if previous is not None and key < previous:
+            logger.warning(
+                f"Not sorted by source file: {path}; "
+                "the merged output is not in source-file order"
+            )
+            yield result
+            yield from results
+            return
+        previous = key
+        yield result
+
+
+def _read_json(path: Path) -> Iterator[OCRResult]:
+    with open_text(path) as f:
+        for item in _iter_json_array(f):
+            yield OCRResult.from_dict(item)
+
+
+def _iter_json_array(f: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Incrementally decode the items of a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array")
+    pos = 1
+    eof = False
+
+    while True:
+        # Skip whitespace and separators between items
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        try:
+            if pos >= len(buffer):
+                raise json.JSONDecodeError("Need more data", buffer, pos)
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError("Truncated JSON array")
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
+
+
+def _read_jsonl(path: Path) -> Iterator[OCRResult]:
+    with open_text(path) as f:
+        for line in f:
+            if line.strip():
+                yield OCRResult.from_dict(json.loads(line))
+
+
+def _parse_bbox(value: str) -> List[List[float]]:
+    try:
+        bbox = ast.literal_eval(value) if value else []
+    except (ValueError, SyntaxError):
+        return []
+    return bbox if isinstance(bbox, list) else []
+
+
+def _read_csv(path: Path) -> Iterator[OCRResult]:
+    with open_text(path) as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        current = None
+        for row in reader:
+            if len(row) < 4:
+                continue
+            source_file, text, confidence, bbox = row[:4]
+            if current is None or str(current.source_file) != source_file:
+                if current is not None:
+                    yield current
+                current = OCRResult(Path(source_file), [])
+            current.lines.append(OCRLine(text, float(confidence), _parse_bbox(bbox)))
+        if current is not None:
+            yield current
+
+
+def _read_txt(path: Path) -> Iterator[OCRResult]:
+    with open_text(path) as f:
+        source_file = None
+        texts: List[str] = []
+        for raw in f:
+            line = raw.rstrip("\n")
+            match = _TXT_HEADER.match(line)
+            if match:
+                if source_file is not None:
+                    yield _txt_result(source_file, texts)
+                source_file, texts = match.group(1), []
+            elif source_file is not None:
+                texts.append(line)
+        if source_file is not None:
+            yield _txt_result(source_file, texts)
+
+
+def _txt_result(source_file: str, texts: List[str]) -> OCRResult:
+    # Each block ends with the blank separator line written by TxtWriter
+    while texts and texts[-1] == "":
+        texts.pop()
+    lines = [OCRLine(text, 0.0, []) for text in texts]
+    return OCRResult(Path(source_file), lines)
+
+
+def _read_xlsx(path: Path) -> Iterator[OCRResult]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError(
+            "openpyxl is required for Excel import. "
+            "Install it with: pip install openpyxl"
+        )
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        current = None
+        for row in wb.active.iter_rows(min_row=2, values_only=True):
+            if not row or row[0] is None:
+                continue
+            padded = list(row) + [None] * 5
+            source_file, _line_no, text, confidence, bbox = padded[:5]
+            if current is None or str(current.source_file) != str(source_file):
+                if current is not None:
+                    yield current
+                current = OCRResult(Path(str(source_file)), [])
+            score = float(str(confidence).rstrip("%")) / 100 if confidence else 0.0
+            current.lines.append(
+                OCRLine(str(text or ""), score, _parse_bbox(str(bbox or "")))
+            )
+        if current is not None:
+            yield current
+    finally:
+        wb.close()
+
+
+def _read_bin(path: Path) -> Iterator[OCRResult]:
+    with open(path, "rb") as f:
+        for record in iter_records(f):
+            yield OCRResult.from_bytes(record)
+
+
+READERS: Dict[str, Callable[[Path], Iterator[OCRResult]]] = {
+    "txt": _read_txt,
+    "json": _read_json,
+    "jsonl": _read_jsonl,
+    "csv": _read_csv,
+    "xlsx": _read_xlsx,
+    "bin": _read_bin,
+}
@@ -0,0 +1,64 @@
+"""
+Sharding Module
+
+Deterministic partitioning of an input corpus across machines. Every file
+is assigned to a shard by a stable hash of its path relative to the input
+root, so each node can select its share independently and the shares are
+disjoint and complete.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification of the form ``i/N``.
+
+    Shard indexes are zero-based, so a four-node run uses ``0/4`` to ``3/4``.
+
+    Returns:
+        Tuple of (index, count).
+
+    Raises:
+        ValueError: If the specification is malformed or out of range.
+    """
+    try:
+        index_str, count_str = spec.split("/")
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 0/4)")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}': need 0 <= i < N")
+    return index, count
+
+
+def shard_of(relative_path: Union[str, Path], count: int) -> int:
+    """
+    Return the shard a file belongs to.
+
+    The path is hashed in POSIX form, so Windows and Linux nodes agree.
+    """
+    key = Path(relative_path).as_posix().encode("utf-8")
+    digest = hashlib.sha1(key).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def select_shard(
+    paths: Iterable[Path], root: Union[str, Path], index: int, count: int
+) -> List[Path]:
+    """
+    Keep only the paths that belong to shard ``index`` of ``count``.
+
+    Args:
+        paths: Candidate file paths under ``root``.
+        root: Input root the relative paths are computed from.
+        index: Zero-based shard index.
+        count: Total number of shards.
+
+    Returns:
+        The selected paths, in their original order.
+    """
+    root = Path(root)
+    return [p for p in paths if shard_of(p.relative_to(root), count) == index]
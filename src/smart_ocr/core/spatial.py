@@ -0,0 +1,191 @@
+"""
+Spatial Index Module
+
+A static R-tree over text box bounds for region queries on a page. The
+tree is bulk-loaded with Sort-Tile-Recursive (STR) packing: boxes are
+sorted into vertical slabs by x, each slab by y, and packed into leaves
+of ``fanout`` boxes; upper levels group consecutive nodes the same way.
+Children of node ``j`` are nodes ``j * fanout`` to ``(j + 1) * fanout - 1``
+of the level below, so every level is a plain NumPy array of bounds and
+each query step tests all children of the surviving nodes at once.
+
+Queries visit O(log n) levels plus the matches (rectangle queries), or
+expand nodes best-first by distance (nearest and right-of queries).
+"""
+
+import heapq
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+Box = Sequence[Sequence[float]]
+Rect = Tuple[float, float, float, float]  # x0, y0, x1, y1
+
+
+class SpatialIndex:
+    """
+    Packed R-tree over axis-aligned box bounds.
+
+    Example:
+        >>> index = SpatialIndex([line.bbox for line in result.lines])
+        >>> index.within((0, 0, 400, 200))
+        [0, 3]
+        >>> index.nearest((120, 80))
+        0
+    """
+
+    def __init__(self, boxes: Sequence[Box], fanout: int = 16):
+        """
+        Build the index.
+
+        Args:
+            boxes: Corner points of each box; any number of (x, y) points.
+            fanout: Children per tree node.
+        """
+        import numpy as np
+
+        if fanout < 2:
+            raise ValueError("fanout must be at least 2")
+        self.fanout = fanout
+        self.bounds = np.array(
+            [_bounds(box) for box in boxes], dtype=np.float64
+        ).reshape(-1, 4)
+
+        # STR order: sqrt(leaves) vertical slabs by x centre, each by y centre
+        count = len(self.bounds)
+        centers = (self.bounds[:, :2] + self.bounds[:, 2:]) / 2
+        slabs = max(1, math.ceil(math.sqrt(math.ceil(count / fanout))))
+        per_slab = max(1, math.ceil(count / slabs))
+        by_x = np.argsort(centers[:, 0], kind="stable")
+        slab = np.empty(count, dtype=np.int64)
+        slab[by_x] = np.arange(count) // per_slab
+        self.order = np.lexsort((centers[:, 1], slab))
+
+        # levels[0] holds the boxes in STR order; the last level is the root
+        self.levels = [self.bounds[self.order]]
+        while len(self.levels[-1]) > 1:
+            self.levels.append(_pack(self.levels[-1], fanout))
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def within(self, rect: Rect, contained: bool = True) -> List[int]:
+        """
+        Indices of the boxes inside a rectangle, in input order.
+
+        Args:
+            rect: (x0, y0, x1, y1) query rectangle.
+            contained: Only boxes entirely inside; otherwise every box
+                       that intersects the rectangle.
+        """
+        import numpy as np
+
+        if not len(self):
+            return []
+        x0, y0, x1, y1 = rect
+        nodes = np.arange(1)
+        for depth in range(len(self.levels) - 1, -1, -1):
+            if depth < len(self.levels) - 1:
+                nodes = self._children(nodes, depth)
+            b = self.levels[depth][nodes]
+            hit = (b[:, 0] <= x1) & (b[:, 2] >= x0)
+            nodes = nodes[hit & (b[:, 1] <= y1) & (b[:, 3] >= y0)]
+        if contained:
+            b = self.levels[0][nodes]
+            inside = (b[:, 0] >= x0) & (b[:, 2] <= x1)
+            nodes = nodes[inside & (b[:, 1] >= y0) & (b[:, 3] <= y1)]
+        return sorted(self.order[nodes].tolist())
+
+    def nearest(self, point: Tuple[float, float]) -> Optional[int]:
+        """Index of the box closest to a point (0 distance if inside)."""
+        import numpy as np
+
+        x, y = point
+
+        def distance(b: Any) -> Any:
+            dx = np.maximum(np.maximum(b[:, 0] - x, x - b[:, 2]), 0.0)
+            dy = np.maximum(np.maximum(b[:, 1] - y, y - b[:, 3]), 0.0)
+            return np.hypot(dx, dy)
+
+        return self._best_first(distance)
+
+    def right_of(self, index: int) -> Optional[int]:
+        """
+        The closest box to the right of box ``index`` on the same row.
+
+        A box is on the row when it overlaps the reference box vertically
+        by at least half the smaller height, and to its right when its
+        horizontal centre lies past the reference box's right edge.
+        """
+        import numpy as np
+
+        _, y0, x1, y1 = self.bounds[index]
+        height = y1 - y0
+
+        def distance(b: Any, leaf: bool) -> Any:
+            gap = np.maximum(b[:, 0] - x1, 0.0)
+            overlap = np.minimum(b[:, 3], y1) - np.maximum(b[:, 1], y0)
+            if leaf:
+                need = np.minimum(b[:, 3] - b[:, 1], height) / 2
+                valid = (overlap >= need) & ((b[:, 0] + b[:, 2]) / 2 > x1)
+            else:
+                valid = (overlap >= 0) & (b[:, 2] > x1)
+            return np.where(valid, gap, np.inf)
+
+        return self._best_first(distance, leaf_aware=True)
+
+    def _children(self, nodes: Any, depth: int) -> Any:
+        """Indices at level ``depth`` of the children of ``nodes``."""
+        import numpy as np
+
+        children = (nodes[:, None] * self.fanout + np.arange(self.fanout)).ravel()
+        return children[children < len(self.levels[depth])]
+
+    def _best_first(self, distance: Any, leaf_aware: bool = False) -> Optional[int]:
+        """
+        Expand nodes in order of their lower-bound distance and return the
+        first box popped, i.e. the one with the smallest distance.
+        """
+        import numpy as np
+
+        if not len(self):
+            return None
+
+        def push(nodes: Any, depth: int) -> None:
+            bounds = self.levels[depth][nodes]
+            dists = distance(bounds, depth == 0) if leaf_aware else distance(bounds)
+            for node, node_dist in zip(nodes.tolist(), dists.tolist()):
+                if node_dist != math.inf:
+                    heapq.heappush(heap, (node_dist, depth, node))
+
+        # The root is filtered like any node: with a single box it is a leaf
+        heap: List[Tuple[float, int, int]] = []
+        push(np.arange(1), len(self.levels) - 1)
+        while heap:
+            dist, depth, node = heapq.heappop(heap)
+            if depth == 0:
+                return int(self.order[node])
+            push(self._children(np.array([node]), depth - 1), depth - 1)
+        return None
+
+
+def _bounds(box: Box) -> Rect:
+    """Axis-aligned bounds of a box's points."""
+    xs = [float(point[0]) for point in box]
+    ys = [float(point[1]) for point in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _pack(bounds: Any, fanout: int) -> Any:
+    """Bounds of the parents of consecutive groups of ``fanout`` nodes."""
+    import numpy as np
+
+    count = len(bounds)
+    padded = math.ceil(count / fanout) * fanout
+    nodes = np.empty((padded, 4), dtype=np.float64)
+    nodes[:count] = bounds
+    # Pad with the last node, which does not change its group's bounds
+    nodes[count:] = bounds[-1]
+    groups = nodes.reshape(-1, fanout, 4)
+    return np.concatenate(
+        (groups[:, :, :2].min(axis=1), groups[:, :, 2:].max(axis=1)), axis=1
+    )
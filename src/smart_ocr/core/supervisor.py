@@ -0,0 +1,485 @@
+"""
+Supervised Execution Module
+
+Runs OCR in isolated worker processes so that a hung or crashing image
+cannot take down a long batch run. Each image gets a wall-clock timeout,
+dead or hung workers are killed and replaced, and workers are recycled
+after a number of images or once their memory use passes a threshold.
+
+Optionally the parent decodes each image into a shared memory slot
+(see core/image_ring.py) and workers read it in place, instead of every
+worker decoding from disk or images being pickled through the pipe.
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .config import OCRConfig
+from .decoders import DecodedImage, create_decoder
+from .image_ring import ImageHandle, SharedImageRing
+from .ocr_engine import OCREngine, OCRResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProcessingFailure:
+    """An image that could not be processed, for the quarantine list."""
+
+    source_file: Path
+    reason: str
+    attempts: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source_file": str(self.source_file),
+            "reason": self.reason,
+            "attempts": self.attempts,
+        }
+
+
+def _current_rss_mb() -> float:
+    """Resident set size of the current process in MB."""
+    try:
+        import psutil
+
+        rss: float = psutil.Process().memory_info().rss
+        return rss / (1024 * 1024)
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+
+        # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        return 0.0
+
+
+def _worker_main(
+    config: OCRConfig,
+    conn: Connection,
+    engine_factory: Callable[[OCRConfig], Any],
+    ring_spec: Optional[Tuple[str, int, int]] = None,
+) -> None:
+    """
+    Worker process loop: load the engine once, then OCR images on request.
+
+    A request is either an image path or, with a shared image ring, a
+    ``(path, handle, scale, original_size)`` tuple for an image the parent
+    has already decoded into a ring slot.
+    """
+    try:
+        engine = engine_factory(config)
+        engine.warmup()
+        ring = SharedImageRing.attach(*ring_spec) if ring_spec else None
+    except Exception as e:
+        conn.send(("fatal", f"{type(e).__name__}: {e}", 0.0))
+        return
+    conn.send(("ready", None, _current_rss_mb()))
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+            if request is None:
+                return
+            try:
+                result = _process_request(engine, ring, request)
+                conn.send(("ok", result, _current_rss_mb()))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}", _current_rss_mb()))
+    finally:
+        if ring is not None:
+            ring.close()
+
+
+def _process_request(
+    engine: Any, ring: Optional[SharedImageRing], request: Any
+) -> OCRResult:
+    """OCR one worker request; the ring view is released on return."""
+    result: OCRResult
+    if not isinstance(request, tuple):
+        result = engine.process_image(request)
+        return result
+    assert ring is not None
+    image_path, handle, scale, original_size = request
+    decoded = DecodedImage(ring.view(handle), scale, original_size)
+    result = engine.process_decoded(image_path, decoded)
+    return result
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, process: Any, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.started = time.monotonic()
+        self.images_done = 0
+        self.task: Optional[Tuple[int, Path, int]] = None
+        self.deadline = 0.0
+        self.slot: Optional[int] = None
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def retire(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+
+class SupervisedRunner:
+    """
+    Process images in supervised worker processes.
+
+    Example:
+        >>> runner = SupervisedRunner(OCRConfig.for_chinese(), timeout=60)
+        >>> results, failures = runner.run(image_paths)
+        >>> for failure in failures:
+        ...     print(failure.source_file, failure.reason)
+    """
+
+    def __init__(
+        self,
+        config: OCRConfig,
+        workers: int = 1,
+        timeout: float = 120.0,
+        max_images_per_worker: Optional[int] = 500,
+        max_rss_mb: Optional[float] = None,
+        retries: int = 1,
+        startup_timeout: float = 300.0,
+        engine_factory: Callable[[OCRConfig], Any] = OCREngine,
+        shared_memory: bool = False,
+        shm_slot_mb: float = 64.0,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            config: OCR configuration used by every worker.
+            workers: Number of worker processes.
+            timeout: Wall-clock seconds allowed per image.
+            max_images_per_worker: Recycle a worker after this many images.
+            max_rss_mb: Recycle a worker once its RSS exceeds this many MB.
+            retries: Extra attempts for images whose worker hung or crashed.
+            startup_timeout: Seconds allowed for a worker to load its models.
+            engine_factory: Picklable callable building the worker's engine.
+            shared_memory: Decode images in the parent into shared memory
+                          slots that workers read without copying. Not
+                          used with the cascade, which decodes twice.
+            shm_slot_mb: Size of each slot; larger images are sent by path.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if shm_slot_mb <= 0:
+            raise ValueError("shm_slot_mb must be positive")
+
+        self.config = config
+        self.workers = workers
+        self.timeout = timeout
+        self.max_images_per_worker = max_images_per_worker
+        self.max_rss_mb = max_rss_mb
+        self.retries = retries
+        self.startup_timeout = startup_timeout
+        self.engine_factory = engine_factory
+        self.shared_memory = shared_memory and not config.cascade
+        self.shm_slot_bytes = int(shm_slot_mb * 1024 * 1024)
+        self._ring: Optional[SharedImageRing] = None
+        self._decoder = create_decoder(
+            config.decoder,
+            max_side=config.decode_max_side,
+            mmap_min_mb=config.mmap_min_mb,
+        )
+        # Fork is unsafe once inference libraries have started threads
+        self._context = multiprocessing.get_context("spawn")
+
+    def run(
+        self, image_paths: Iterable[Union[str, Path]]
+    ) -> Tuple[List[OCRResult], List[ProcessingFailure]]:
+        """
+        Process images, isolating each in a supervised worker.
+
+        Args:
+            image_paths: Paths of the images to process.
+
+        Returns:
+            Tuple of (results in input order, quarantined failures).
+        """
+        # Paths are pulled as workers need them, so the first image is
+        # dispatched while a long discovery stream is still being read
+        tasks = ((index, Path(path), 0) for index, path in enumerate(image_paths))
+        queue: Deque[Tuple[int, Path, int]] = deque()
+        results: Dict[int, OCRResult] = {}
+        failures: Dict[int, ProcessingFailure] = {}
+        logger.info(f"Supervised run: {self.workers} workers")
+
+        pool: List[_Worker] = []
+        try:
+            while True:
+                # Keep about one waiting task (retries included) per worker
+                while len(queue) < self.workers:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    queue.append(task)
+                if not queue and not any(w.task for w in pool):
+                    break
+
+                if self.shared_memory and self._ring is None:
+                    # One slot per worker: each has at most one image in flight
+                    self._ring = SharedImageRing(self.workers, self.shm_slot_bytes)
+                idle = sum(1 for w in pool if w.task is None)
+                while len(pool) < self.workers and idle < len(queue):
+                    pool.append(self._spawn())
+                    idle += 1
+
+                for worker in pool:
+                    if worker.ready and worker.task is None and queue:
+                        self._dispatch(worker, queue.popleft())
+
+                now = time.monotonic()
+                deadlines = [w.deadline for w in pool if w.task] + [
+                    w.started + self.startup_timeout for w in pool if not w.ready
+                ]
+                timeout = max(0.0, min(deadlines) - now) if deadlines else None
+                ready_conns = wait([w.conn for w in pool], timeout)
+
+                survivors = []
+                for worker in pool:
+                    if worker.conn in ready_conns:
+                        replace = self._receive(worker, queue, results, failures)
+                    else:
+                        replace = self._check_timeout(worker, queue, failures)
+                    # Replacements are spawned above while work remains
+                    if not replace:
+                        survivors.append(worker)
+                pool = survivors
+        finally:
+            for worker in pool:
+                worker.retire()
+            if self._ring is not None:
+                self._ring.close()
+                self._ring = None
+
+        logger.info(
+            f"Supervised run finished: {len(results)} succeeded, "
+            f"{len(failures)} quarantined"
+        )
+        ordered = [results[i] for i in sorted(results)]
+        quarantined = [failures[i] for i in sorted(failures)]
+        return ordered, quarantined
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        ring_spec = (
+            (self._ring.name, self._ring.slots, self._ring.slot_bytes)
+            if self._ring is not None
+            else None
+        )
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self.config, child_conn, self.engine_factory, ring_spec),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _dispatch(self, worker: _Worker, task: Tuple[int, Path, int]) -> None:
+        worker.task = task
+        request: Any = str(task[1])
+        if self._ring is not None:
+            slot = self._ring.acquire()
+            shared = self._decode_into(slot, task[1]) if slot is not None else None
+            if shared is not None:
+                worker.slot = slot
+                request = (request,) + shared
+            elif slot is not None:
+                self._ring.release(slot)
+        worker.deadline = time.monotonic() + self.timeout
+        worker.conn.send(request)
+
+    def _decode_into(
+        self, slot: int, path: Path
+    ) -> Optional[Tuple[ImageHandle, float, Optional[Tuple[int, int]]]]:
+        """
+        Decode an image into a ring slot.
+
+        Returns None when the image does not fit or cannot be decoded;
+        it is then sent by path and the worker decodes (or fails) itself.
+        """
+        assert self._ring is not None
+        try:
+            decoded = self._decoder.decode(path, as_array=True)
+        except Exception as e:
+            logger.debug(f"Not decoding {path} in the parent: {e}")
+            return None
+        if not self._ring.fits(decoded.data):
+            logger.debug(f"{path} exceeds the shared memory slot, sending by path")
+            return None
+        handle = self._ring.write(slot, decoded.data)
+        return handle, decoded.scale, decoded.original_size
+
+    def _release_slot(self, worker: _Worker) -> None:
+        """Free the ring slot of a worker's finished or abandoned image."""
+        if self._ring is not None and worker.slot is not None:
+            self._ring.release(worker.slot)
+        worker.slot = None
+
+    def _receive(
+        self,
+        worker: _Worker,
+        queue: Deque[Tuple[int, Path, int]],
+        results: Dict[int, OCRResult],
+        failures: Dict[int, ProcessingFailure],
+    ) -> bool:
+        """Handle a message (or EOF) from a worker; return True to replace it."""
+        try:
+            status, payload, rss_mb = worker.conn.recv()
+        except (EOFError, OSError):
+            exitcode = worker.process.exitcode
+            worker.kill()
+            self._release_slot(worker)
+            if not worker.ready:
+                raise RuntimeError(f"OCR worker died during startup (exit {exitcode})")
+            if worker.task is None:
+                # Killed between images (e.g. by the OOM killer): nothing
+                # was lost, so just replace it
+                logger.warning(f"Idle OCR worker exited (exit {exitcode}), replacing")
+                return True
+            reason = f"worker crashed (exit {exitcode})"
+            self._fail(worker.task, reason, queue, failures)
+            return True
+
+        if status == "fatal":
+            worker.kill()
+            raise RuntimeError(f"OCR worker failed to start: {payload}")
+        if status == "ready":
+            worker.ready = True
+            return False
+
+        assert worker.task is not None
+        index, path, attempts = worker.task
+        worker.task = None
+        self._release_slot(worker)
+        worker.images_done += 1
+        if status == "ok":
+            results[index] = payload
+        else:
+            logger.error(f"Failed to process {path}: {payload}")
+            failures[index] = ProcessingFailure(path, payload, attempts + 1)
+
+        if self.max_images_per_worker and (
+            worker.images_done >= self.max_images_per_worker
+        ):
+            logger.info(f"Recycling worker after {worker.images_done} images")
+        elif self.max_rss_mb and rss_mb > self.max_rss_mb:
+            logger.info(f"Recycling worker at {rss_mb:.0f} MB RSS")
+        else:
+            return False
+        worker.retire()
+        return True
+
+    def _check_timeout(
+        self,
+        worker: _Worker,
+        queue: Deque[Tuple[int, Path, int]],
+        failures: Dict[int, ProcessingFailure],
+    ) -> bool:
+        """Kill a worker that overran its deadline; return True to replace it."""
+        now = time.monotonic()
+        if worker.task is not None and now >= worker.deadline:
+            worker.kill()
+            self._release_slot(worker)
+            reason = f"timed out after {self.timeout:g}s"
+            self._fail(worker.task, reason, queue, failures)
+            return True
+        if not worker.ready and now >= worker.started + self.startup_timeout:
+            worker.kill()
+            raise RuntimeError(
+                f"OCR worker did not start within {self.startup_timeout:g}s"
+            )
+        return False
+
+    def _fail(
+        self,
+        task: Tuple[int, Path, int],
+        reason: str,
+        queue: Deque[Tuple[int, Path, int]],
+        failures: Dict[int, ProcessingFailure],
+    ) -> None:
+        """Requeue a hung/crashed image, or quarantine it when out of retries."""
+        index, path, attempts = task
+        attempts += 1
+        if attempts <= self.retries:
+            logger.warning(f"{path}: {reason}, retrying ({attempts}/{self.retries})")
+            queue.append((index, path, attempts))
+        else:
+            logger.error(f"{path}: {reason}, quarantined")
+            failures[index] = ProcessingFailure(path, reason, attempts)
+
+
+def write_quarantine(failures: List[ProcessingFailure], path: Union[str, Path]) -> Path:
+    """
+    Write the quarantine list as CSV so failed files can be retried.
+
+    Args:
+        failures: Failures returned by SupervisedRunner.run.
+        path: Output CSV path.
+
+    Returns:
+        Path to the written file.
+    """
+    import csv
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["file", "reason", "attempts"])
+        for failure in failures:
+            writer.writerow([failure.source_file, failure.reason, failure.attempts])
+    return path
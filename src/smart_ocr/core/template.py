@@ -0,0 +1,101 @@
+"""
+Form Template Module
+
+Region-of-interest templates for fixed-layout forms. A template lists named
+regions in normalised page coordinates, so the engine can recognise just
+those crops instead of running detection over the whole page.
+
+Template file format (JSON):
+
+    {
+      "name": "bank_auto_debit",
+      "regions": [
+        {"name": "account_name", "box": [0.12, 0.20, 0.45, 0.24]},
+        {"name": "account_number", "box": [0.55, 0.20, 0.92, 0.24]}
+      ]
+    }
+
+Each ``box`` is ``[left, top, right, bottom]`` as fractions of the page
+width and height.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+
+@dataclass
+class TemplateRegion:
+    """A named rectangle in normalised (0-1) page coordinates."""
+
+    name: str
+    box: Tuple[float, float, float, float]
+
+    def __post_init__(self) -> None:
+        if len(self.box) != 4:
+            raise ValueError(f"Region {self.name}: box must have 4 values")
+        left, top, right, bottom = (float(v) for v in self.box)
+        if not (0.0 <= left < right <= 1.0 and 0.0 <= top < bottom <= 1.0):
+            raise ValueError(
+                f"Region {self.name}: box {list(self.box)} must satisfy "
+                "0 <= left < right <= 1 and 0 <= top < bottom <= 1"
+            )
+        self.box = (left, top, right, bottom)
+
+    def to_pixels(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Convert to integer pixel coordinates (left, top, right, bottom)."""
+        left, top, right, bottom = self.box
+        return (
+            int(round(left * width)),
+            int(round(top * height)),
+            max(int(round(right * width)), int(round(left * width)) + 1),
+            max(int(round(bottom * height)), int(round(top * height)) + 1),
+        )
+
+
+@dataclass
+class FormTemplate:
+    """A named set of regions for one fixed-layout form."""
+
+    name: str = "template"
+    regions: List[TemplateRegion] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.regions:
+            raise ValueError(f"Template {self.name} has no regions")
+        names = [region.name for region in self.regions]
+        duplicates = {n for n in names if names.count(n) > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate region names: {sorted(duplicates)}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FormTemplate":
+        """Create a template from its JSON dictionary form."""
+        try:
+            regions = [
+                TemplateRegion(name=str(item["name"]), box=tuple(item["box"]))
+                for item in data["regions"]
+            ]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid template: {e}")
+        return cls(name=str(data.get("name", "template")), regions=regions)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FormTemplate":
+        """Load a template from a JSON file."""
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Template not found: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "regions": [
+                {"name": region.name, "box": list(region.box)}
+                for region in self.regions
+            ],
+        }
@@ -0,0 +1,337 @@
+"""
+Folder Watcher Module
+
+Detects new image files in an inbox directory and groups them into
+micro-batches. Uses Linux inotify when available and falls back to
+``os.scandir`` polling elsewhere.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTENSIONS = [".png", ".jpg", ".jpeg", ".bmp", ".tiff"]
+
+# inotify constants from <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_EVENT = struct.Struct("iIII")
+
+
+class _InotifySource:
+    """Thin ctypes wrapper around the Linux inotify API."""
+
+    MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+
+    def add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), self.MASK
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+        self._dirs[wd] = directory
+
+    def read(self, timeout: float) -> Tuple[List[Path], List[Path], bool]:
+        """
+        Wait up to ``timeout`` seconds for events.
+
+        Returns:
+            Tuple of (changed files, new directories, queue overflowed).
+        """
+        files: List[Path] = []
+        new_dirs: List[Path] = []
+        overflow = False
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return files, new_dirs, overflow
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return files, new_dirs, overflow
+
+        offset = 0
+        while offset + _IN_EVENT.size <= len(data):
+            wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+            offset += _IN_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+
+            path = parent / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                new_dirs.append(path)
+            else:
+                files.append(path)
+
+        return files, new_dirs, overflow
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class FolderWatcher:
+    """
+    Watch a directory for new image files and yield them in micro-batches.
+
+    A file is only handed out once its size and modification time have
+    stayed the same for ``settle_time`` seconds, so partially copied files
+    are never processed.
+
+    Example:
+        >>> watcher = FolderWatcher("./inbox", settle_time=1.0)
+        >>> for batch in watcher.batches(batch_size=8, max_wait=0.5):
+        ...     results = engine.process_images(batch)
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        extensions: Optional[List[str]] = None,
+        recursive: bool = False,
+        settle_time: float = 1.0,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        include_existing: bool = True,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            directory: Directory to watch.
+            extensions: File extensions to pick up.
+                       Default: ['.png', '.jpg', '.jpeg', '.bmp', '.tiff']
+            recursive: Whether to watch subdirectories.
+            settle_time: Seconds a file's size must stay unchanged.
+            poll_interval: Seconds between scans when polling.
+            use_inotify: Use inotify on Linux; polling is used otherwise.
+            include_existing: Also process files present at startup.
+        """
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError(f"Not a directory: {self.directory}")
+
+        extensions = extensions or DEFAULT_EXTENSIONS
+        self.extensions = {
+            ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+            for ext in extensions
+        }
+        self.recursive = recursive
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
+        self.include_existing = include_existing
+
+        # path -> (size, mtime_ns) of every file seen by the last scan
+        self._known: Dict[str, Tuple[int, int]] = {}
+        # path -> (size, mtime_ns, time the stat last changed)
+        self._pending: Dict[str, Tuple[int, int, float]] = {}
+        self._stopped = False
+
+        self._inotify: Optional[_InotifySource] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _InotifySource()
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify unavailable, falling back to polling: {e}")
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether change detection is event driven."""
+        return self._inotify is not None
+
+    def stop(self) -> None:
+        """Stop the watcher after the current wait."""
+        self._stopped = True
+
+    def batches(
+        self, batch_size: int = 8, max_wait: float = 0.5
+    ) -> Iterator[List[Path]]:
+        """
+        Yield batches of settled files until ``stop()`` is called.
+
+        A batch is emitted as soon as ``batch_size`` files are ready, or
+        once the oldest ready file has waited ``max_wait`` seconds.
+
+        Args:
+            batch_size: Maximum number of files per batch.
+            max_wait: Maximum seconds a ready file waits for batch-mates.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self._start()
+        ready: List[Path] = []
+        ready_since = 0.0
+        tick = min(self.poll_interval, self.settle_time / 2 or self.poll_interval)
+
+        try:
+            while not self._stopped:
+                now = time.monotonic()
+                for path in self._settled(now):
+                    if not ready:
+                        ready_since = now
+                    ready.append(path)
+
+                while ready and (
+                    len(ready) >= batch_size or now - ready_since >= max_wait
+                ):
+                    batch, ready = ready[:batch_size], ready[batch_size:]
+                    ready_since = now
+                    yield batch
+                    if self._stopped:
+                        return
+
+                self._wait(tick if (self._pending or ready) else self.poll_interval)
+        finally:
+            if self._inotify is not None:
+                self._inotify.close()
+
+    def _start(self) -> None:
+        """Register watches and take the initial snapshot."""
+        now = time.monotonic()
+        for directory, entries in self._walk(self.directory):
+            if self._inotify is not None:
+                self._inotify.add_watch(directory)
+            for path, stat in entries:
+                self._known[path] = stat
+                if self.include_existing:
+                    self._pending[path] = (stat[0], stat[1], now)
+
+        mode = "inotify" if self._inotify is not None else "polling"
+        logger.info(f"Watching {self.directory} ({mode}, {len(self._known)} files)")
+
+    def _wait(self, timeout: float) -> None:
+        """Block until new files may have appeared and record them as pending."""
+        now = time.monotonic()
+        if self._inotify is None:
+            time.sleep(timeout)
+            self._rescan(time.monotonic())
+            return
+
+        files, new_dirs, overflow = self._inotify.read(timeout)
+        if overflow:
+            logger.warning("inotify queue overflowed, rescanning")
+            self._rescan(now)
+            return
+        for path in files:
+            self._touch(str(path), now)
+        for directory in new_dirs:
+            if not self.recursive:
+                continue
+            for subdir, entries in self._walk(directory):
+                self._inotify.add_watch(subdir)
+                for file_path, stat in entries:
+                    self._touch(file_path, now, stat)
+
+    def _rescan(self, now: float) -> None:
+        """Diff a full scandir listing against the last snapshot."""
+        current: Dict[str, Tuple[int, int]] = {}
+        for directory, entries in self._walk(self.directory):
+            for path, stat in entries:
+                current[path] = stat
+                if self._known.get(path) != stat:
+                    self._touch(path, now, stat)
+        self._known = current
+
+    def _touch(
+        self, path: str, now: float, stat: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """Mark a file as changed so it restarts its settle period."""
+        if Path(path).suffix.lower() not in self.extensions:
+            return
+        if stat is None:
+            stat = self._stat(path)
+            if stat is None:
+                return
+        self._known[path] = stat
+        self._pending[path] = (stat[0], stat[1], now)
+
+    def _settled(self, now: float) -> List[Path]:
+        """
+        Pop pending files whose size has been stable for settle_time.
+
+        Files still empty by then are dropped rather than handed out; a
+        later write re-arms them through ``_touch``.
+        """
+        settled = []
+        for path, (size, mtime, since) in list(self._pending.items()):
+            if now - since < self.settle_time:
+                continue
+            stat = self._stat(path)
+            if stat is None:
+                del self._pending[path]
+            elif stat != (size, mtime):
+                self._pending[path] = (stat[0], stat[1], now)
+            else:
+                del self._pending[path]
+                if size > 0:
+                    settled.append(Path(path))
+        settled.sort()
+        return settled
+
+    def _walk(
+        self, top: Path
+    ) -> Iterator[Tuple[Path, List[Tuple[str, Tuple[int, int]]]]]:
+        """Yield (directory, [(file path, (size, mtime_ns))]) using scandir."""
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            entries = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.recursive:
+                                    stack.append(Path(entry.path))
+                            elif entry.is_file() and (
+                                os.path.splitext(entry.name)[1].lower()
+                                in self.extensions
+                            ):
+                                st = entry.stat()
+                                entries.append(
+                                    (entry.path, (st.st_size, st.st_mtime_ns))
+                                )
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot scan {directory}: {e}")
+                continue
+            yield directory, entries
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
@@ -0,0 +1,673 @@
+"""
+Result Writers Module
+
+Streaming writers for exporting OCR results. Writers accept results one at a
+time, so exports never need the full result list in memory and appendable
+formats can be extended by long-running jobs such as ``smart-ocr watch``.
+"""
+
+import gzip
+import io
+import json
+import logging
+import time
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from .ocr_engine import OCRResult
+
+logger = logging.getLogger(__name__)
+
+# Streaming compressors and the suffix each appends to the output path
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def compressed_path(path: Union[str, Path], compress: Optional[str]) -> Path:
+    """Append the compression suffix to ``path`` unless it is already there."""
+    path = Path(path)
+    if compress is None:
+        return path
+    suffix = COMPRESSION_SUFFIXES[compress]
+    return path if path.suffix == suffix else path.with_name(path.name + suffix)
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard is required for zstd compression. "
+            "Install it with: pip install zstandard"
+        )
+    return zstandard
+
+
+class ResultWriter:
+    """
+    Base class for streaming result writers.
+
+    Subclasses implement ``_write_header``, ``_write_result`` and
+    ``_write_footer``. Writers are context managers:
+
+    Example:
+        >>> with create_writer("csv", "results.csv") as writer:
+        ...     for result in results:
+        ...         writer.write(result)
+    """
+
+    format: str = ""
+    appendable: bool = False
+    binary: bool = False
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = False,
+        compress: Optional[str] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Output file path.
+            append: Append to an existing file instead of truncating it.
+                   Only supported by appendable formats.
+            compress: Stream output through a compressor ('gzip' or 'zstd').
+                     Appending adds a new gzip member / zstd frame.
+        """
+        if append and not self.appendable:
+            raise ValueError(f"Format {self.format} does not support appending")
+        if compress is not None and compress not in COMPRESSION_SUFFIXES:
+            raise ValueError(
+                f"Invalid compression: {compress}. "
+                f"Valid: {sorted(COMPRESSION_SUFFIXES)}"
+            )
+        if compress is not None and self.binary:
+            raise ValueError(f"Format {self.format} cannot be compressed")
+
+        self.path = Path(path)
+        self.append = append
+        self.compress = compress
+        self.count = 0
+        self._file: Optional[IO[Any]] = None
+
+    def open(self) -> "ResultWriter":
+        """Open the output file and write the format header."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not (self.append and self.path.exists() and self.path.stat().st_size)
+        self._file = self._open_file("a" if self.append else "w")
+        if is_new:
+            self._write_header()
+        return self
+
+    def write(self, result: "OCRResult", image: Any = None) -> None:
+        """
+        Write a single result.
+
+        Args:
+            result: Result to write.
+            image: The decoded source image, if the caller has it. Only
+                   formats that embed the image (pdf) use it.
+        """
+        if self._file is None:
+            self.open()
+        self._write_result(result)
+        self.count += 1
+
+    def write_all(self, results: Iterable["OCRResult"]) -> None:
+        """Write every result from an iterable."""
+        for result in results:
+            self.write(result)
+
+    def flush(self) -> None:
+        """Flush buffered output to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the format footer and close the output file."""
+        if self._file is None:
+            self.open()
+        assert self._file is not None
+        self._write_footer()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "ResultWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _open_file(self, mode: str) -> IO[Any]:
+        if self.binary:
+            return open(self.path, mode + "b")
+        if self.compress == "gzip":
+            return cast(
+                IO[str],
+                gzip.open(self.path, mode + "t", encoding="utf-8", newline=""),
+            )
+        if self.compress == "zstd":
+            raw = open(self.path, mode + "b")
+            stream = _zstandard().ZstdCompressor().stream_writer(raw)
+            return cast(IO[str], io.TextIOWrapper(stream, encoding="utf-8", newline=""))
+        return open(self.path, mode, encoding="utf-8", newline="")
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write_result(self, result: "OCRResult") -> None:
+        raise NotImplementedError
+
+    def _write_footer(self) -> None:
+        pass
+
+
+class TxtWriter(ResultWriter):
+    """Plain text: one ``=== file ===`` block per result."""
+
+    format = "txt"
+    appendable = True
+
+    def _write_result(self, result: "OCRResult") -> None:
+        assert self._file is not None
+        self._file.write(f"=== {result.source_file} ===\n")
+        self._file.write(result.text)
+        self._file.write("\n\n")
+
+
+class JsonWriter(ResultWriter):
+    """JSON array of result objects, streamed item by item."""
+
+    format = "json"
+
+    def _write_header(self) -> None:
+        assert self._file is not None
+        self._file.write("[")
+
+    def _write_result(self, result: "OCRResult") -> None:
+        assert self._file is not None
+        item = json.dumps(result.to_dict(), ensure_ascii=False, indent=2)
+        separator = "\n" if self.count == 0 else ",\n"
+        self._file.write(separator + "  " + item.replace("\n", "\n  "))
+
+    def _write_footer(self) -> None:
+        assert self._file is not None
+        self._file.write("\n]" if self.count else "]")
+
+
+class JsonLinesWriter(ResultWriter):
+    """JSON Lines: one compact result object per line."""
+
+    format = "jsonl"
+    appendable = True
+
+    def _write_result(self, result: "OCRResult") -> None:
+        assert self._file is not None
+        self._file.write(json.dumps(result.to_dict(), ensure_ascii=False))
+        self._file.write("\n")
+
+
+class CsvWriter(ResultWriter):
+    """CSV with one row per recognized line."""
+
+    format = "csv"
+    appendable = True
+
+    def _write_header(self) -> None:
+        self._csv().writerow(["file", "text", "confidence", "bbox"])
+
+    def _write_result(self, result: "OCRResult") -> None:
+        writer = self._csv()
+        for line in result.lines:
+            writer.writerow([result.source_file, line.text, line.confidence, line.bbox])
+
+    def _csv(self) -> Any:
+        import csv
+
+        assert self._file is not None
+        return csv.writer(self._file)
+
+
+class XlsxWriter(ResultWriter):
+    """Excel workbook (UTF-8 encoded), saved when the writer is closed."""
+
+    format = "xlsx"
+    binary = True
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = False,
+        compress: Optional[str] = None,
+    ):
+        super().__init__(path, append, compress)
+        self._wb: Any = None
+        self._ws: Any = None
+        self._row_num = 2
+
+    def _open_file(self, mode: str) -> IO[Any]:
+        # openpyxl writes the file itself on close; nothing to hold open.
+        return cast(IO[Any], _NullFile())
+
+    def _write_header(self) -> None:
+        try:
+            from openpyxl import Workbook
+            from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        except ImportError:
+            raise ImportError(
+                "openpyxl is required for Excel export. "
+                "Install it with: pip install openpyxl"
+            )
+
+        self._wb = Workbook()
+        self._ws = self._wb.active
+        self._ws.title = "OCR Results"
+
+        # Define styles
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(
+            start_color="4472C4", end_color="4472C4", fill_type="solid"
+        )
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        self._border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        )
+
+        # Write headers
+        headers = ["檔案", "行號", "文字內容", "信心分數", "座標"]
+        for col, header in enumerate(headers, 1):
+            cell = self._ws.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            cell.border = self._border
+
+    def _write_result(self, result: "OCRResult") -> None:
+        ws = self._ws
+        border = self._border
+        for line_idx, line in enumerate(result.lines, 1):
+            row = self._row_num
+            ws.cell(row=row, column=1, value=str(result.source_file)).border = border
+            ws.cell(row=row, column=2, value=line_idx).border = border
+            ws.cell(row=row, column=3, value=line.text).border = border
+            ws.cell(row=row, column=4, value=f"{line.confidence:.2%}").border = border
+            ws.cell(row=row, column=5, value=str(line.bbox)).border = border
+            self._row_num += 1
+
+    def _write_footer(self) -> None:
+        ws = self._ws
+
+        # Adjust column widths
+        ws.column_dimensions["A"].width = 30  # 檔案
+        ws.column_dimensions["B"].width = 8  # 行號
+        ws.column_dimensions["C"].width = 60  # 文字內容
+        ws.column_dimensions["D"].width = 12  # 信心分數
+        ws.column_dimensions["E"].width = 40  # 座標
+
+        # Freeze header row
+        ws.freeze_panes = "A2"
+
+        self._wb.save(self.path)
+
+
+class BinaryWriter(ResultWriter):
+    """Binary records (see core/packing.py), one per result."""
+
+    format = "bin"
+    appendable = True
+    binary = True
+
+    def _write_result(self, result: "OCRResult") -> None:
+        assert self._file is not None
+        self._file.write(result.to_bytes())
+
+
+class PdfWriter(ResultWriter):
+    """
+    Searchable PDF: each source image with its text as an invisible layer.
+
+    Pages are written as results arrive (see core/pdf.py), so memory is
+    bounded by one page however long the document grows. Fed from
+    ``OCREngine.process_images(..., on_page=writer.write)``, pages also
+    reuse the engine's decoded image instead of decoding the file again.
+    """
+
+    format = "pdf"
+    binary = True
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = False,
+        compress: Optional[str] = None,
+    ):
+        super().__init__(path, append, compress)
+        self._pdf: Any = None
+
+    def write(self, result: "OCRResult", image: Any = None) -> None:
+        """
+        Write a single result as a page.
+
+        Args:
+            result: Result to write.
+            image: The already decoded source image (full-resolution BGR
+                   or greyscale array), to avoid decoding it again.
+        """
+        if self._file is None:
+            self.open()
+        self._pdf.add_page(result, image)
+        self.count += 1
+
+    def _write_header(self) -> None:
+        from .pdf import SearchablePdf
+
+        assert self._file is not None
+        self._pdf = SearchablePdf(self._file)
+
+    def _write_result(self, result: "OCRResult") -> None:
+        self._pdf.add_page(result)
+
+    def _write_footer(self) -> None:
+        self._pdf.finish()
+
+
+class _NullFile:
+    """Placeholder file handle for writers that save through a library."""
+
+    def write(self, data: Any) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+WRITERS: Dict[str, Type[ResultWriter]] = {
+    "txt": TxtWriter,
+    "json": JsonWriter,
+    "jsonl": JsonLinesWriter,
+    "csv": CsvWriter,
+    "xlsx": XlsxWriter,
+    "bin": BinaryWriter,
+    "pdf": PdfWriter,
+}
+
+
+def create_writer(
+    format: str,
+    path: Union[str, Path],
+    append: bool = False,
+    compress: Optional[str] = None,
+) -> ResultWriter:
+    """
+    Create a streaming writer for an export format.
+
+    Args:
+        format: Export format ('txt', 'json', 'jsonl', 'csv', 'xlsx', 'bin',
+                'pdf').
+        path: Output file path.
+        append: Append to an existing file (appendable formats only).
+        compress: Optional streaming compression ('gzip' or 'zstd').
+
+    Returns:
+        An unopened ResultWriter.
+    """
+    try:
+        writer_class = WRITERS[format]
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {format}")
+    return writer_class(path, append=append, compress=compress)
+
+
+def parse_formats(formats: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Parse export formats given as ``"json,csv,xlsx"`` or a list.
+
+    Duplicates are dropped, keeping the first occurrence's position.
+
+    Raises:
+        ValueError: If a format is unknown or none is given.
+    """
+    if isinstance(formats, str):
+        formats = formats.split(",")
+    parsed: List[str] = []
+    for fmt in formats:
+        fmt = fmt.strip().lower()
+        if fmt not in WRITERS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        if fmt not in parsed:
+            parsed.append(fmt)
+    if not parsed:
+        raise ValueError("No export format given")
+    return parsed
+
+
+def format_paths(path: Union[str, Path], formats: List[str]) -> Dict[str, Path]:
+    """
+    Output path of each format when exporting several at once.
+
+    A format or compression suffix on ``path`` is replaced, so
+    ``results.json`` with json and csv gives ``results.json`` and
+    ``results.csv``.
+    """
+    path = Path(path)
+    suffixes = set(COMPRESSION_SUFFIXES.values()) | {f".{fmt}" for fmt in WRITERS}
+    while path.suffix.lower() in suffixes:
+        path = path.with_suffix("")
+    return {fmt: path.with_name(f"{path.name}.{fmt}") for fmt in formats}
+
+
+def effective_compression(format: str, compress: Optional[str]) -> Optional[str]:
+    """
+    Compression actually applied to a format.
+
+    Binary formats (xlsx, bin and pdf) cannot be compressed and are always
+    written uncompressed; the text formats use ``compress`` as given.
+    """
+    return None if WRITERS[format].binary else compress
+
+
+def uncompressible_formats(
+    formats: Union[str, Iterable[str]], compress: Optional[str]
+) -> List[str]:
+    """Formats that will be written uncompressed although ``compress`` is set."""
+    if compress is None:
+        return []
+    return [fmt for fmt in parse_formats(formats) if WRITERS[fmt].binary]
+
+
+class MultiWriter:
+    """
+    Fan results out to several writers in one pass.
+
+    Each result is handed to every writer as it arrives, so one iteration
+    over the results (or a result stream) produces all of the exports.
+
+    Example:
+        >>> with create_multi_writer(["json", "xlsx"], "out/results") as writer:
+        ...     writer.write_all(results)
+        >>> writer.paths
+        [PosixPath('out/results.json'), PosixPath('out/results.xlsx')]
+    """
+
+    def __init__(self, writers: Iterable[ResultWriter]):
+        self.writers = list(writers)
+
+    @property
+    def paths(self) -> List[Path]:
+        return [writer.path for writer in self.writers]
+
+    def open(self) -> "MultiWriter":
+        """Open every writer; if one fails, close those already open."""
+        opened: List[ResultWriter] = []
+        try:
+            for writer in self.writers:
+                writer.open()
+                opened.append(writer)
+        except BaseException:
+            for writer in opened:
+                try:
+                    writer.close()
+                except Exception as e:
+                    logger.error(f"Failed to close {writer.path}: {e}")
+            raise
+        return self
+
+    def write(self, result: "OCRResult", image: Any = None) -> None:
+        """Write a result to every writer (``image`` as in ResultWriter)."""
+        for writer in self.writers:
+            writer.write(result, image)
+
+    def write_all(self, results: Iterable["OCRResult"]) -> None:
+        for result in results:
+            self.write(result)
+
+    def flush(self) -> None:
+        for writer in self.writers:
+            writer.flush()
+
+    def close(self) -> None:
+        """Close every writer, then raise the first error, if any."""
+        error: Optional[BaseException] = None
+        for writer in self.writers:
+            try:
+                writer.close()
+            except Exception as e:
+                logger.error(f"Failed to finish {writer.path}: {e}")
+                error = error or e
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> "MultiWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def create_multi_writer(
+    formats: Union[str, Iterable[str]],
+    path: Union[str, Path],
+    compress: Optional[str] = None,
+) -> MultiWriter:
+    """
+    Create one writer per format, writing next to each other.
+
+    Args:
+        formats: Formats as ``"json,csv"`` or a list.
+        path: Output path; each format replaces its suffix (see
+              ``format_paths``).
+        compress: Compression for the text formats. Binary formats (xlsx,
+                  bin and pdf) are written uncompressed.
+
+    Returns:
+        An unopened MultiWriter.
+    """
+    writers = []
+    for fmt, fmt_path in format_paths(path, parse_formats(formats)).items():
+        fmt_compress = effective_compression(fmt, compress)
+        writers.append(
+            create_writer(
+                fmt, compressed_path(fmt_path, fmt_compress), compress=fmt_compress
+            )
+        )
+    return MultiWriter(writers)
+
+
+class RollingWriter:
+    """
+    Append results to time-bucketed output files.
+
+    A new file named ``<prefix>-YYYYmmdd-HHMMSS.<format>`` is started every
+    ``interval`` seconds; within a bucket each batch is appended and flushed
+    so downstream readers see results as soon as they are produced.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        format: str = "jsonl",
+        interval: float = 3600,
+        prefix: str = "ocr_results",
+        compress: Optional[str] = None,
+    ):
+        if not WRITERS.get(format, ResultWriter).appendable:
+            raise ValueError(f"Format {format} cannot be used for rolling output")
+        if interval <= 0:
+            raise ValueError("Rolling interval must be positive")
+
+        self.directory = Path(directory)
+        self.format = format
+        self.interval = interval
+        self.prefix = prefix
+        self.compress = effective_compression(format, compress)
+        self._bucket: Optional[int] = None
+        self._writer: Optional[ResultWriter] = None
+
+    @property
+    def current_path(self) -> Optional[Path]:
+        """Path of the file currently being appended to."""
+        return self._writer.path if self._writer else None
+
+    def write_batch(
+        self, results: Iterable["OCRResult"], now: Optional[float] = None
+    ) -> Path:
+        """
+        Append a batch of results to the current bucket file.
+
+        Args:
+            results: Results to append.
+            now: Timestamp used to pick the bucket. Defaults to time.time().
+
+        Returns:
+            Path of the file the batch was written to.
+        """
+        bucket = int((time.time() if now is None else now) // self.interval)
+        if bucket != self._bucket or self._writer is None:
+            self.close()
+            stamp = time.strftime(
+                "%Y%m%d-%H%M%S", time.localtime(bucket * self.interval)
+            )
+            path = compressed_path(
+                self.directory / f"{self.prefix}-{stamp}.{self.format}",
+                self.compress,
+            )
+            self._writer = create_writer(
+                self.format, path, append=True, compress=self.compress
+            ).open()
+            self._bucket = bucket
+            logger.info(f"Rolling output file: {path}")
+
+        self._writer.write_all(results)
+        self._writer.flush()
+        return self._writer.path
+
+    def close(self) -> None:
+        """Close the current bucket file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "RollingWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
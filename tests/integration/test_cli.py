@@ -59,6 +59,26 @@ class TestCLIParser:
         assert args.recursive is True
         assert args.quiet is True
 
+    def test_watch_command(self):
+        """Test watch command parsing."""
+        parser = create_parser()
+        args = parser.parse_args(
+            ["watch", "inbox", "--batch-size", "4", "--poll", "--format", "csv"]
+        )
+        assert args.command == "watch"
+        assert args.input == "inbox"
+        assert args.batch_size == 4
+        assert args.poll is True
+        assert args.format == "csv"
+
+    def test_shard_option(self):
+        """Test --shard parsing and validation."""
+        parser = create_parser()
+        args = parser.parse_args(["process", "docs/", "--shard", "1/4"])
+        assert args.shard == (1, 4)
+        with pytest.raises(SystemExit):
+            parser.parse_args(["process", "docs/", "--shard", "4/4"])
+
     def test_config_command(self):
         """Test config command parsing."""
         parser = create_parser()
@@ -95,6 +115,137 @@ class TestCLIExecution:
         result = main(["process", "nonexistent_file.png", "--quiet"])
         assert result == 1
 
+    def test_merge_command(self, temp_dir, capsys):
+        """Test merging two shard outputs into one export."""
+        from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+        from smart_ocr.core.writers import create_writer
+
+        shard_files = []
+        for i, names in enumerate([["b.png"], ["a.png", "c.png"]]):
+            path = temp_dir / f"shard{i}.jsonl"
+            with create_writer("jsonl", path) as writer:
+                for name in names:
+                    writer.write(OCRResult(Path(name), [OCRLine(name, 0.9, [])]))
+            shard_files.append(str(path))
+
+        output = temp_dir / "merged.txt"
+        result = main(["merge", *shard_files, "-o", str(output)])
+
+        assert result == 0
+        headers = [
+            line
+            for line in output.read_text(encoding="utf-8").splitlines()
+            if line.startswith("===")
+        ]
+        assert headers == ["=== a.png ===", "=== b.png ===", "=== c.png ==="]
+
+    def test_merge_binary_output_with_compression(self, temp_dir, capsys):
+        """Test merging into a binary format skips --compress with a warning."""
+        from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+        from smart_ocr.core.readers import read_results
+        from smart_ocr.core.writers import create_writer
+
+        source = temp_dir / "in.jsonl"
+        with create_writer("jsonl", source) as writer:
+            writer.write(OCRResult(Path("a.png"), [OCRLine("a", 0.9, [])]))
+
+        output = temp_dir / "out.bin"
+        result = main(["merge", str(source), "-o", str(output), "--compress", "gzip"])
+
+        assert result == 0
+        assert "bin cannot be compressed" in capsys.readouterr().err
+        assert [r.text for r in read_results(output)] == ["a"]
+
+    @patch("smart_ocr.cli.OCREngine")
+    def test_process_warns_before_processing(self, mock_engine_class, temp_dir, capsys):
+        """Test an uncompressible format is reported before OCR starts."""
+        stderr_at_start = []
+
+        def process_directory(*args, **kwargs):
+            stderr_at_start.append(capsys.readouterr().err)
+            return []
+
+        mock_engine = MagicMock()
+        mock_engine.process_directory.side_effect = process_directory
+        mock_engine_class.return_value = mock_engine
+
+        output = str(temp_dir / "out.xlsx")
+        result = main(
+            ["process", str(temp_dir), "-o", output, "-f", "xlsx", "--compress", "gzip"]
+        )
+
+        assert result == 0
+        assert "xlsx cannot be compressed" in stderr_at_start[0]
+
+    @patch("smart_ocr.cli.OCREngine")
+    def test_process_streams_pages_to_writer(self, mock_engine_class, temp_dir):
+        """Test a directory's pages are exported while it is processed."""
+        mock_engine = MagicMock()
+        mock_engine.process_directory.return_value = []
+        mock_engine_class.return_value = mock_engine
+        writer = mock_engine.create_export_writer.return_value
+        writer.paths = [temp_dir / "out.pdf"]
+
+        result = main(["process", str(temp_dir), "-o", str(temp_dir / "out.pdf")])
+
+        assert result == 0
+        kwargs = mock_engine.process_directory.call_args.kwargs
+        assert kwargs["on_page"] == writer.write
+        mock_engine.export_results.assert_not_called()
+
+    def test_merge_lossy_input_rejected(self, temp_dir, capsys):
+        """Test a csv shard is refused before the output is written."""
+        path = temp_dir / "shard0.csv"
+        path.write_text("檔案,文字內容,信心分數,座標\n", encoding="utf-8")
+        output = temp_dir / "out.json"
+
+        result = main(["merge", str(path), "-o", str(output)])
+
+        assert result == 1
+        assert "lose results or confidences" in capsys.readouterr().err
+        assert not output.exists()
+
+    def test_merge_unreadable_input(self, temp_dir, capsys):
+        """Test an input without a reader is rejected before merging."""
+        path = temp_dir / "scans.pdf"
+        path.write_bytes(b"%PDF-1.7")
+
+        result = main(["merge", str(path), "-o", str(temp_dir / "out.json")])
+
+        assert result == 1
+        assert "unknown format" in capsys.readouterr().err
+
+    @patch("smart_ocr.cli.OCREngine")
+    def test_shard_files_from(self, mock_engine_class, temp_dir):
+        """Test --shard selects from a --files-from list as well."""
+        from smart_ocr.core.sharding import shard_of
+
+        names = [f"img_{i}.png" for i in range(20)]
+        file_list = temp_dir / "list.txt"
+        file_list.write_text("\n".join(names), encoding="utf-8")
+        selected = []
+        mock_engine = MagicMock()
+        mock_engine.process_images.side_effect = (
+            lambda paths, **kwargs: selected.extend(paths) or []
+        )
+        mock_engine_class.return_value = mock_engine
+
+        result = main(
+            ["process", "--files-from", str(file_list), "--shard", "1/3", "-q"]
+        )
+
+        assert result == 0
+        assert selected == [Path(n) for n in names if shard_of(n, 3) == 1]
+        assert 0 < len(selected) < len(names)
+
+    def test_shard_single_file_rejected(self, temp_dir, capsys):
+        """Test --shard with a single-file input is an error."""
+        path = temp_dir / "one.png"
+        path.write_bytes(b"x")
+
+        assert main(["process", str(path), "--shard", "0/2", "-q"]) == 1
+        assert "--shard" in capsys.readouterr().err
+
     @patch("smart_ocr.cli.OCREngine")
     def test_process_single_image(self, mock_engine_class, temp_dir, capsys):
         """Test processing a single image."""
@@ -166,7 +317,8 @@ class TestCLIExecution:
         mock_result.average_confidence = 0.95
         mock_result.text = "Test"
         mock_engine.process_image.return_value = mock_result
-        mock_engine.export_results.return_value = output_path
+        writer = mock_engine.create_export_writer.return_value
+        writer.paths = [output_path]
         mock_engine_class.return_value = mock_engine
 
         result = main(
@@ -174,4 +326,50 @@ class TestCLIExecution:
         )
 
         assert result == 0
-        mock_engine.export_results.assert_called_once()
+        mock_engine.create_export_writer.assert_called_once_with(
+            str(output_path), "json", None
+        )
+        writer.write.assert_called_once_with(mock_result)
+        assert f"Results exported to: {output_path}" in capsys.readouterr().out
+
+    @patch("smart_ocr.cli.OCREngine")
+    def test_process_files_from(self, mock_engine_class, temp_dir, capsys):
+        """Test --files-from streams the listed paths to the engine."""
+        listing = temp_dir / "files.txt"
+        listing.write_text("a.png\nb.png\n", encoding="utf-8")
+
+        mock_engine = MagicMock()
+        mock_engine.process_images.side_effect = lambda paths, **kwargs: [
+            MagicMock(source_file=path) for path in paths
+        ]
+        mock_engine_class.return_value = mock_engine
+
+        result = main(["process", "--files-from", str(listing)])
+
+        assert result == 0
+        assert "Processed 2 images" in capsys.readouterr().out
+
+    @patch("smart_ocr.cli.OCREngine")
+    def test_process_reports_blank_pages(self, mock_engine_class, temp_dir, capsys):
+        """Test the run summary counts pages skipped as blank."""
+        from smart_ocr.core.ocr_engine import OCRResult
+
+        listing = temp_dir / "files.txt"
+        listing.write_text("a.png\nb.png\nc.png\n", encoding="utf-8")
+
+        mock_engine = MagicMock()
+        mock_engine.process_images.side_effect = lambda paths, **kwargs: [
+            OCRResult(path, [], blank=path.name != "b.png") for path in paths
+        ]
+        mock_engine_class.return_value = mock_engine
+
+        result = main(["process", "--files-from", str(listing), "--skip-blank"])
+
+        assert result == 0
+        assert "Processed 3 images (2 blank)" in capsys.readouterr().out
+        assert mock_engine_class.call_args.args[0].skip_blank
+
+    def test_process_requires_input(self, capsys):
+        """Test process without an input or file list fails."""
+        assert main(["process", "--quiet"]) == 1
+        assert "--files-from" in capsys.readouterr().err
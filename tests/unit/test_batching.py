@@ -0,0 +1,233 @@
+"""
+Unit tests for micro-batching.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.batching import MicroBatcher
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher."""
+
+    def test_concurrent_requests_share_a_batch(self):
+        """Test requests arriving within the wait window run together."""
+        batches = []
+
+        def process(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        with MicroBatcher(process, max_batch_size=8, max_wait_ms=200) as batcher:
+            futures = [batcher.submit(i) for i in range(5)]
+            assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    def test_batch_size_limit(self):
+        """Test batches never exceed max_batch_size."""
+        batches = []
+
+        def process(items):
+            batches.append(len(items))
+            return items
+
+        with MicroBatcher(process, max_batch_size=3, max_wait_ms=200) as batcher:
+            futures = [batcher.submit(i) for i in range(7)]
+            assert [f.result(timeout=5) for f in futures] == list(range(7))
+
+        assert max(batches) <= 3
+        assert sum(batches) == 7
+
+    def test_wait_limit(self):
+        """Test a lone request runs once max_wait_ms has passed."""
+        with MicroBatcher(lambda items: items, max_wait_ms=20) as batcher:
+            start = time.monotonic()
+            assert batcher.submit("a").result(timeout=5) == "a"
+            assert time.monotonic() - start < 2.0
+
+    def test_per_item_exceptions(self):
+        """Test an exception outcome is raised only in its own caller."""
+
+        def process(items):
+            return [ValueError(item) if item == "bad" else item for item in items]
+
+        with MicroBatcher(process, max_wait_ms=100) as batcher:
+            good = batcher.submit("good")
+            bad = batcher.submit("bad")
+            assert good.result(timeout=5) == "good"
+            with pytest.raises(ValueError):
+                bad.result(timeout=5)
+
+    def test_batch_failure_reaches_every_caller(self):
+        """Test a failing batch function fails all of its callers."""
+
+        def process(items):
+            raise RuntimeError("model crashed")
+
+        with MicroBatcher(process, max_wait_ms=100) as batcher:
+            futures = [batcher.submit(i) for i in range(3)]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="model crashed"):
+                    future.result(timeout=5)
+
+    def test_batch_function_never_concurrent(self):
+        """Test batches run one at a time on the batcher thread."""
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def process(items):
+            with lock:
+                active.append(1)
+                overlaps.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return items
+
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=1)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: batcher.submit(i).result(), range(16)))
+        batcher.close()
+
+        assert results == list(range(16))
+        assert max(overlaps) == 1
+
+    def test_submit_after_close(self):
+        """Test a closed batcher rejects new requests."""
+        batcher = MicroBatcher(lambda items: items)
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit(1)
+
+    def test_invalid_limits(self):
+        """Test invalid batch size and wait are rejected."""
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, max_batch_size=0)
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, max_wait_ms=-1)
+
+
+class TestEngineMicroBatching:
+    """Test cases for micro-batched engine calls."""
+
+    def _engine(self, temp_dir, pages=4):
+        import cv2
+        import numpy as np
+
+        paths = []
+        for i in range(pages):
+            path = temp_dir / f"page_{i}.png"
+            cv2.imwrite(str(path), np.full((100, 200, 3), 255, dtype=np.uint8))
+            paths.append(path)
+
+        box = [[10, 10], [110, 10], [110, 30], [10, 30]]
+        config = OCRConfig(show_log=False, micro_batch_size=8, micro_batch_wait_ms=200)
+        engine = OCREngine(config)
+        engine._initialized = True
+        engine._ocr = MagicMock()
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not rec:
+                return [[box]]
+            return [[(f"line{i}", 0.9) for i in range(len(image))]]
+
+        engine._ocr.ocr.side_effect = ocr
+        return engine, paths
+
+    def _rec_calls(self, engine):
+        return [
+            call
+            for call in engine._ocr.ocr.call_args_list
+            if call.kwargs.get("det") is False
+        ]
+
+    def test_threads_share_one_rec_pass(self, temp_dir):
+        """Test concurrent process_image calls are recognized together."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir)
+
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            results = list(pool.map(engine.process_image, paths))
+        engine.close()
+
+        assert [r.source_file for r in results] == paths
+        assert len(self._rec_calls(engine)) < len(paths)
+        assert engine.stats.get("micro_batch_items") == len(paths)
+
+    def test_coroutines_share_one_rec_pass(self, temp_dir):
+        """Test concurrent process_image_async calls are batched."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir)
+
+        async def run():
+            return await asyncio.gather(
+                *(engine.process_image_async(path) for path in paths)
+            )
+
+        results = asyncio.run(run())
+        engine.close()
+
+        assert [r.source_file for r in results] == paths
+        assert len(self._rec_calls(engine)) == 1
+
+    def test_missing_image_fails_only_its_caller(self, temp_dir):
+        """Test one bad request does not fail its batch-mates."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=1)
+
+        missing = engine._batcher.submit(temp_dir / "missing.png")
+        good = engine._batcher.submit(paths[0])
+
+        assert good.result(timeout=5).source_file == paths[0]
+        with pytest.raises(FileNotFoundError):
+            missing.result(timeout=5)
+        engine.close()
+
+    def test_process_images_skips_failures(self, temp_dir):
+        """Test process_images through the batcher keeps good pages."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=2)
+
+        results = engine.process_images([paths[0], temp_dir / "missing.png", paths[1]])
+        engine.close()
+
+        assert [r.source_file for r in results] == paths
+
+    def test_process_images_submits_lazily(self, temp_dir):
+        """Test pages are batched before the whole path stream is read."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=1)
+        done_before_last = []
+
+        def stream(count=40):
+            for i in range(count):
+                if i == count - 1:
+                    done_before_last.append(engine.stats.get("micro_batch_items"))
+                yield paths[0]
+
+        results = engine.process_images(stream())
+        engine.close()
+
+        assert len(results) == 40
+        assert done_before_last[0] > 0
+
+    def test_disabled_by_default(self):
+        """Test micro-batching is opt-in."""
+        assert OCREngine(OCRConfig(show_log=False))._batcher is None
+
+    def test_invalid_config(self):
+        """Test negative micro-batch settings are rejected."""
+        with pytest.raises(ValueError):
+            OCRConfig(micro_batch_size=-1)
+        with pytest.raises(ValueError):
+            OCRConfig(micro_batch_wait_ms=-1)
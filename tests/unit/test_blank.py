@@ -0,0 +1,65 @@
+"""
+Unit tests for blank page detection.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from smart_ocr.core.blank import is_blank, measure_ink  # noqa: E402
+
+
+def _page(shape=(1400, 1000, 3), paper=235, noise=6.0):
+    """A noisy, slightly grey scanned sheet."""
+    rng = np.random.default_rng(0)
+    return np.clip(rng.normal(paper, noise, shape), 0, 255).astype(np.uint8)
+
+
+class TestBlankDetection:
+    """Test cases for the ink coverage check."""
+
+    def test_empty_sheet(self):
+        """Test a noisy empty sheet is blank."""
+        ink = measure_ink(_page())
+        assert ink.coverage == 0.0
+        assert is_blank(_page())
+
+    def test_text_page(self):
+        """Test a page with lines of text is not blank."""
+        page = _page()
+        for top in range(100, 1300, 60):
+            page[top : top + 20, 80:920:3] = 20
+
+        ink = measure_ink(page)
+        assert ink.coverage > 0.05
+        assert not is_blank(page)
+
+    def test_thin_strokes_survive_sampling(self):
+        """Test one-pixel strokes are not lost between sampled pixels."""
+        page = _page(noise=0.0)
+        page[200:1200:50, 100:900] = 0
+
+        assert measure_ink(page).coverage > 0.01
+        assert not is_blank(page)
+
+    def test_bleed_through_ignored(self):
+        """Test faint text from the back of the sheet is not ink."""
+        page = _page()
+        page[300:700, 100:900] = 200
+
+        assert is_blank(page)
+
+    def test_threshold(self):
+        """Test a small mark is blank or not depending on the threshold."""
+        page = _page()
+        page[500:524, 500:524] = 0
+
+        assert is_blank(page, threshold=0.0005)
+        assert not is_blank(page, threshold=0.0001)
+
+    def test_greyscale_and_tiny_images(self):
+        """Test single-channel and very small images are handled."""
+        assert is_blank(np.full((3, 2000), 255, dtype=np.uint8))
+        page = _page(shape=(800, 600))
+        page[100:700, 100:500] = 0
+        assert not is_blank(page)
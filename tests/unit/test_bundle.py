@@ -0,0 +1,224 @@
+"""
+Unit tests for offline model bundles.
+"""
+
+import json
+import shutil
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.cli import main
+from smart_ocr.core import onnx_backend
+from smart_ocr.core.bundle import (
+    BUNDLE_MANIFEST,
+    ModelBundle,
+    file_sha256,
+    load_bundle,
+    pack_bundle,
+)
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine
+
+
+@pytest.fixture
+def paddle_models(temp_dir):
+    """PaddleOCR inference model directories with placeholder weights."""
+    source = temp_dir / "source"
+    for component in ("det", "rec", "cls"):
+        model_dir = source / component
+        model_dir.mkdir(parents=True)
+        (model_dir / "inference.pdmodel").write_bytes(component.encode() * 10)
+        (model_dir / "inference.pdiparams").write_bytes(b"\x00" * 64)
+        (model_dir / "model.tar").write_bytes(b"archive")
+    (source / "keys.txt").write_text("A\nB\n", encoding="utf-8")
+    return source
+
+
+@pytest.fixture
+def onnx_models(temp_dir):
+    """ONNX model directory with placeholder models."""
+    source = temp_dir / "onnx"
+    source.mkdir()
+    for name in ("det.onnx", "rec.onnx"):
+        (source / name).write_bytes(name.encode())
+    (source / "keys.txt").write_text("A\nB\n", encoding="utf-8")
+    return source
+
+
+class TestPackBundle:
+    """Test cases for packing and verifying bundles."""
+
+    def test_pack_paddle(self, paddle_models, temp_dir):
+        """Test a PaddleOCR bundle gets a versioned dir and checksums."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "2024.10")
+
+        assert bundle.path == temp_dir / "models" / "2024.10"
+        assert bundle.backend == "paddle"
+        assert "det/inference.pdiparams" in bundle.files
+        assert "det/model.tar" not in bundle.files
+        entry = bundle.files["rec/inference.pdmodel"]
+        assert entry["sha256"] == file_sha256(paddle_models / "rec/inference.pdmodel")
+        bundle.verify()
+
+        loaded = ModelBundle.load(bundle.path)
+        assert loaded.version == "2024.10"
+        assert loaded.files == bundle.files
+
+    def test_paddle_kwargs(self, paddle_models, temp_dir):
+        """Test PaddleOCR arguments point into the bundle."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1")
+
+        kwargs = bundle.paddle_kwargs()
+        assert kwargs["det_model_dir"] == str(bundle.path / "det")
+        assert kwargs["cls_model_dir"] == str(bundle.path / "cls")
+        assert kwargs["rec_char_dict_path"] == str(bundle.path / "keys.txt")
+
+    def test_pack_onnx(self, onnx_models, temp_dir):
+        """Test an ONNX model dir is packed as an onnxruntime bundle."""
+        bundle = pack_bundle(
+            onnx_models, temp_dir / "models", "v1", external_data=False
+        )
+
+        assert bundle.backend == "onnxruntime"
+        assert sorted(bundle.files) == ["det.onnx", "keys.txt", "rec.onnx"]
+
+    def test_pack_onnx_external_data(self, onnx_models, temp_dir):
+        """Test weights saved beside a model are copied with it."""
+        (onnx_models / "rec.onnx.data").write_bytes(b"weights")
+        bundle = pack_bundle(
+            onnx_models, temp_dir / "models", "v1", external_data=False
+        )
+
+        assert "rec.onnx.data" in bundle.files
+        assert (bundle.path / "rec.onnx.data").read_bytes() == b"weights"
+
+    def test_tampered_file(self, paddle_models, temp_dir):
+        """Test verification detects a modified weight file."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1")
+        (bundle.path / "det" / "inference.pdiparams").write_bytes(b"\x01" * 64)
+
+        with pytest.raises(ValueError, match="checksum"):
+            bundle.verify()
+
+    def test_missing_file(self, paddle_models, temp_dir):
+        """Test verification detects a deleted file."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1")
+        (bundle.path / "keys.txt").unlink()
+
+        with pytest.raises(FileNotFoundError):
+            bundle.verify()
+
+    def test_existing_version(self, paddle_models, temp_dir):
+        """Test a packed version is never overwritten."""
+        pack_bundle(paddle_models, temp_dir / "models", "v1")
+        with pytest.raises(FileExistsError):
+            pack_bundle(paddle_models, temp_dir / "models", "v1")
+
+    def test_invalid_version(self, paddle_models, temp_dir):
+        """Test versions must be plain directory names."""
+        with pytest.raises(ValueError):
+            pack_bundle(paddle_models, temp_dir / "models", "../v1")
+
+    def test_unknown_source(self, temp_dir):
+        """Test a directory without models is rejected."""
+        with pytest.raises(FileNotFoundError):
+            pack_bundle(temp_dir, temp_dir / "models", "v1")
+
+    def test_unsupported_format(self, temp_dir):
+        """Test a manifest of another format version is rejected."""
+        (temp_dir / BUNDLE_MANIFEST).write_text(json.dumps({"format": 99}))
+        with pytest.raises(ValueError):
+            ModelBundle.load(temp_dir)
+
+
+class TestLoadBundle:
+    """Test cases for loading bundles into the engine."""
+
+    def test_no_bundle(self):
+        """Test no bundle is loaded unless configured."""
+        assert load_bundle(OCRConfig(show_log=False)) is None
+
+    def test_backend_mismatch(self, paddle_models, temp_dir):
+        """Test a paddle bundle cannot be used by the onnxruntime backend."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1")
+        config = OCRConfig(backend="onnxruntime", model_bundle=bundle.path)
+
+        with pytest.raises(ValueError, match="paddle backend"):
+            load_bundle(config)
+
+    def test_lang_mismatch(self, paddle_models, temp_dir):
+        """Test a bundle packed for one language is rejected for another."""
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1", lang="ch")
+        config = OCRConfig(lang="en", model_bundle=bundle.path)
+
+        with pytest.raises(ValueError, match="language ch"):
+            load_bundle(config)
+
+    def test_missing_angle_classifier_disables_it(
+        self, paddle_models, temp_dir, monkeypatch
+    ):
+        """Test a bundle without cls/ turns angle classification off."""
+        shutil.rmtree(paddle_models / "cls")
+        bundle = pack_bundle(paddle_models, temp_dir / "models", "v1")
+        paddleocr = MagicMock()
+        monkeypatch.setitem(sys.modules, "paddleocr", paddleocr)
+
+        engine = OCREngine(OCRConfig(model_bundle=bundle.path, show_log=False))
+        engine.warmup()
+
+        kwargs = paddleocr.PaddleOCR.call_args.kwargs
+        assert kwargs["use_angle_cls"] is False
+        assert "cls_model_dir" not in kwargs
+        assert engine.config.use_angle_cls is False
+
+    def test_engine_loads_onnx_from_bundle(self, onnx_models, temp_dir, monkeypatch):
+        """Test the ONNX backend opens the models inside the bundle."""
+        bundle = pack_bundle(
+            onnx_models, temp_dir / "models", "v1", external_data=False
+        )
+        opened = []
+        monkeypatch.setattr(
+            onnx_backend,
+            "_create_session",
+            lambda path, config: opened.append(path) or MagicMock(),
+        )
+
+        config = OCRConfig(
+            backend="onnxruntime", model_bundle=bundle.path, show_log=False
+        )
+        OCREngine(config).warmup()
+
+        assert opened == [bundle.path / "det.onnx", bundle.path / "rec.onnx"]
+
+    def test_engine_rejects_tampered_bundle(self, onnx_models, temp_dir):
+        """Test initialization fails on a bundle that fails verification."""
+        bundle = pack_bundle(
+            onnx_models, temp_dir / "models", "v1", external_data=False
+        )
+        (bundle.path / "rec.onnx").write_bytes(b"changed!")
+
+        config = OCRConfig(
+            backend="onnxruntime", model_bundle=bundle.path, show_log=False
+        )
+        with pytest.raises(ValueError):
+            OCREngine(config).warmup()
+
+
+class TestBundleCommand:
+    """Test cases for the bundle CLI command."""
+
+    def test_pack_and_verify(self, paddle_models, temp_dir, capsys):
+        """Test packing then verifying through the CLI."""
+        output = temp_dir / "models"
+        code = main(["bundle", "pack", str(paddle_models), "v1", "-o", str(output)])
+        assert code == 0
+
+        assert main(["bundle", "verify", str(output / "v1")]) == 0
+        assert "Verified" in capsys.readouterr().out
+
+    def test_verify_failure(self, temp_dir, capsys):
+        """Test verifying a directory without a bundle fails."""
+        assert main(["bundle", "verify", str(temp_dir)]) == 1
+        assert "Error" in capsys.readouterr().err
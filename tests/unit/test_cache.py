@@ -0,0 +1,135 @@
+"""
+Unit tests for the recognition crop cache.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.cache import CropCache, crop_key
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.crops import sort_boxes
+from smart_ocr.core.ocr_engine import OCREngine
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+
+def _label(text: str, scale: float = 1.0):
+    """Render a text label as a BGR crop."""
+    width, height = int(200 * scale), int(40 * scale)
+    crop = np.full((height, width, 3), 255, dtype=np.uint8)
+    cv2.putText(
+        crop, text, (5, int(30 * scale)), cv2.FONT_HERSHEY_SIMPLEX, scale, (0, 0, 0)
+    )
+    return crop
+
+
+class TestCropKey:
+    """Test cases for crop_key."""
+
+    def test_identical_crops_match(self):
+        """Test identical pixels produce the same key."""
+        assert crop_key(_label("Account")) == crop_key(_label("Account"))
+
+    def test_different_text_differs(self):
+        """Test different labels produce different keys."""
+        assert crop_key(_label("Account")) != crop_key(_label("Name"))
+
+    def test_grayscale_input(self):
+        """Test grayscale crops are accepted."""
+        gray = cv2.cvtColor(_label("Account"), cv2.COLOR_BGR2GRAY)
+        assert crop_key(gray) == crop_key(_label("Account"))
+
+
+class TestCropCache:
+    """Test cases for CropCache."""
+
+    def test_hit_and_miss(self):
+        """Test lookups count hits and misses."""
+        cache = CropCache(max_entries=4)
+        assert cache.get(b"a") is None
+        cache.put(b"a", ("戶名", 0.98))
+        assert cache.get(b"a") == ("戶名", 0.98)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        cache = CropCache(max_entries=2)
+        cache.put(b"a", ("A", 0.9))
+        cache.put(b"b", ("B", 0.9))
+        cache.get(b"a")
+        cache.put(b"c", ("C", 0.9))
+        assert len(cache) == 2
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == ("A", 0.9)
+
+    def test_invalid_size(self):
+        """Test a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            CropCache(max_entries=0)
+
+
+class TestSortBoxes:
+    """Test cases for sort_boxes."""
+
+    def test_reading_order(self):
+        """Test boxes on one row are ordered left to right."""
+        right = [[100, 12], [150, 12], [150, 30], [100, 30]]
+        left = [[0, 10], [50, 10], [50, 30], [0, 30]]
+        below = [[0, 60], [50, 60], [50, 80], [0, 80]]
+        assert sort_boxes([below, right, left]) == [left, right, below]
+
+
+class TestEngineCache:
+    """Test cases for the recognition cache in OCREngine."""
+
+    def _engine(self, temp_dir):
+        page = np.full((100, 400, 3), 255, dtype=np.uint8)
+        page[10:50, 0:200] = _label("Account")
+        page[60:100, 0:200] = _label("Account")
+        path = temp_dir / "form.png"
+        cv2.imwrite(str(path), page)
+
+        boxes = [
+            [[0, 10], [200, 10], [200, 50], [0, 50]],
+            [[0, 60], [200, 60], [200, 100], [0, 100]],
+        ]
+        engine = OCREngine(OCRConfig(show_log=False, rec_cache_size=16))
+        engine._initialized = True
+        engine._ocr = MagicMock()
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not rec:
+                return [boxes]
+            return [[("Account", 0.97) for _ in image]]
+
+        engine._ocr.ocr.side_effect = ocr
+        return engine, path
+
+    def test_repeated_crops_skip_recognition(self, temp_dir):
+        """Test identical crops are recognized once and reused."""
+        engine, path = self._engine(temp_dir)
+
+        first = engine.process_image(path)
+        second = engine.process_image(path)
+
+        assert [line.text for line in first.lines] == ["Account", "Account"]
+        assert second.text == first.text
+        calls = engine._ocr.ocr.call_args_list
+        rec_calls = [call for call in calls if call.kwargs.get("det") is False]
+        assert len(rec_calls) == 1
+        assert len(rec_calls[0].args[0]) == 1
+        # Both crops of the first page miss (recognized once), both of the
+        # second hit; the profile reports the cache's own counts
+        assert engine.stats.get("rec_cache_hits") == engine._rec_cache.hits == 2
+        assert engine.stats.get("rec_cache_misses") == engine._rec_cache.misses == 2
+        assert "rec_cache_hit_rate" in engine.stats.format()
+
+    def test_drop_score(self, temp_dir):
+        """Test low-confidence lines are dropped like PaddleOCR does."""
+        engine, path = self._engine(temp_dir)
+        engine.config.drop_score = 0.99
+
+        assert engine.process_image(path).lines == []
@@ -0,0 +1,176 @@
+"""
+Unit tests for the two-pass cascade, crop helpers and engine stats.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.crops import crop_box, scale_box
+from smart_ocr.core.ocr_engine import OCREngine
+from smart_ocr.core.profiling import EngineStats
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+
+@pytest.fixture
+def large_image(temp_dir):
+    """Write a 2000x1000 page so the cascade's first pass is downscaled."""
+    page = np.full((1000, 2000, 3), 255, dtype=np.uint8)
+    page[100:140, 200:1200] = 0
+    path = temp_dir / "page.png"
+    cv2.imwrite(str(path), page)
+    return path
+
+
+def _engine(config, low_pass, full_reading=("full-res", 0.99)):
+    """Engine whose first pass finds ``low_pass``, then reads ``full_reading``."""
+    engine = OCREngine(config)
+    engine._initialized = True
+    engine._ocr = MagicMock()
+    first_readings = iter([[reading for _, reading in low_pass]])
+
+    def ocr(image, det=True, rec=True, cls=False):
+        if det:
+            return [[box for box, _ in low_pass]]
+        return [next(first_readings, [full_reading for _ in image])]
+
+    engine._ocr.ocr.side_effect = ocr
+    return engine
+
+
+class TestCropBox:
+    """Test cases for crop helpers."""
+
+    def test_axis_aligned_crop(self):
+        """Test an axis-aligned box crops to its width and height."""
+        image = np.zeros((100, 200, 3), dtype=np.uint8)
+        crop = crop_box(image, [[10, 20], [110, 20], [110, 50], [10, 50]])
+        assert crop.shape == (30, 100, 3)
+
+    def test_tall_crop_rotated(self):
+        """Test vertical text is rotated to horizontal."""
+        image = np.zeros((200, 100, 3), dtype=np.uint8)
+        crop = crop_box(image, [[10, 10], [30, 10], [30, 110], [10, 110]])
+        assert crop.shape == (20, 100, 3)
+
+    def test_scale_box(self):
+        """Test scaling box coordinates."""
+        assert scale_box([[1, 2], [3, 4]], 2.0) == [[2.0, 4.0], [6.0, 8.0]]
+
+
+class TestEngineStats:
+    """Test cases for EngineStats."""
+
+    def test_counters_and_timers(self):
+        """Test counters accumulate and timers record elapsed time."""
+        stats = EngineStats()
+        stats.increment("images")
+        stats.increment("images", 2)
+        with stats.timer("ocr"):
+            pass
+        assert stats.get("images") == 3
+        assert stats.get("missing") == 0
+        assert stats.timings["ocr"] >= 0.0
+        assert "images" in stats.format()
+
+    def test_reset(self):
+        """Test reset clears everything."""
+        stats = EngineStats()
+        stats.increment("lines")
+        stats.reset()
+        assert stats.to_dict() == {"counters": {}, "timings": {}}
+
+
+class TestCascade:
+    """Test cases for cascade mode in OCREngine."""
+
+    def test_config_validation(self):
+        """Test invalid cascade thresholds are rejected."""
+        with pytest.raises(ValueError):
+            OCRConfig(cascade_threshold=1.5)
+        with pytest.raises(ValueError):
+            OCRConfig(cascade_max_side=0)
+
+    def test_weak_lines_escalated(self, large_image):
+        """Test only lines below the threshold are re-read at full size."""
+        box = [[100, 50], [600, 50], [600, 70], [100, 70]]
+        low_pass = [[box, ("strong", 0.97)], [box, ("weak", 0.40)]]
+        config = OCRConfig(show_log=False, cascade=True, cascade_max_side=1000)
+        engine = _engine(config, low_pass)
+
+        result = engine.process_image(large_image)
+
+        assert [line.text for line in result.lines] == ["strong", "full-res"]
+        assert result.lines[1].confidence == 0.99
+        # Boxes are reported in original image coordinates
+        assert result.lines[0].bbox[1] == [1200.0, 100.0]
+
+        det_call, _, full_call = engine._ocr.ocr.call_args_list
+        assert det_call.args[0].shape == (500, 1000, 3)
+        crops = full_call.args[0]
+        assert len(crops) == 1
+        assert crops[0].shape == (40, 1000, 3)
+
+        assert engine.stats.get("cascade_escalated") == 1
+        assert engine.stats.get("cascade_improved") == 1
+
+    def test_better_reading_kept(self, large_image):
+        """Test the low-resolution reading wins when it scored higher."""
+        box = [[100, 50], [600, 50], [600, 70], [100, 70]]
+        config = OCRConfig(show_log=False, cascade=True, cascade_max_side=1000)
+        engine = _engine(config, [[box, ("weak", 0.60)]], ("worse", 0.10))
+
+        result = engine.process_image(large_image)
+
+        assert result.lines[0].text == "weak"
+        assert engine.stats.get("cascade_escalated") == 1
+        assert engine.stats.get("cascade_improved") == 0
+
+    def test_no_escalation_when_confident(self, large_image):
+        """Test confident pages never decode the full-resolution image."""
+        box = [[100, 50], [600, 50], [600, 70], [100, 70]]
+        config = OCRConfig(show_log=False, cascade=True, cascade_max_side=1000)
+        engine = _engine(config, [[box, ("fine", 0.95)]])
+
+        engine.process_image(large_image)
+
+        # Detection and first-pass recognition only
+        assert engine._ocr.ocr.call_count == 2
+        assert engine.stats.get("cascade_escalated") == 0
+
+    def test_small_image_not_escalated(self, sample_image):
+        """Test images already within the first-pass size are not re-read."""
+        box = [[0, 0], [50, 0], [50, 10], [0, 10]]
+        config = OCRConfig(show_log=False, cascade=True)
+        engine = _engine(config, [[box, ("weak", 0.60)]])
+
+        result = engine.process_image(sample_image)
+
+        assert result.lines[0].text == "weak"
+        assert engine._ocr.ocr.call_count == 2
+
+    def test_lines_below_drop_score_recovered(self, large_image):
+        """Test low-resolution lines below drop_score are still escalated."""
+        box = [[100, 50], [600, 50], [600, 70], [100, 70]]
+        config = OCRConfig(show_log=False, cascade=True, cascade_max_side=1000)
+        engine = _engine(config, [[box, ("blurry", 0.30)]])
+
+        result = engine.process_image(large_image)
+
+        assert [line.text for line in result.lines] == ["full-res"]
+        assert engine.stats.get("cascade_improved") == 1
+
+    def test_drop_score_applied_after_escalation(self, large_image):
+        """Test lines still below drop_score after escalation are dropped."""
+        box = [[100, 50], [600, 50], [600, 70], [100, 70]]
+        low_pass = [[box, ("fine", 0.95)], [box, ("noise", 0.30)]]
+        config = OCRConfig(show_log=False, cascade=True, cascade_max_side=1000)
+        engine = _engine(config, low_pass, ("still noise", 0.35))
+
+        result = engine.process_image(large_image)
+
+        assert [line.text for line in result.lines] == ["fine"]
+        assert engine.stats.get("cascade_escalated") == 1
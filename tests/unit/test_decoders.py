@@ -0,0 +1,115 @@
+"""
+Unit tests for image decoders.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.decoders import _map_raw, create_decoder
+from smart_ocr.core.ocr_engine import OCREngine
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def pixels():
+    """A random RGB test image as an array."""
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(90, 160, 3), dtype=np.uint8)
+
+
+def _save(temp_dir, pixels, name, mode="RGB"):
+    path = temp_dir / name
+    image = Image.fromarray(pixels if mode == "RGB" else pixels[:, :, 0])
+    image.save(path)
+    return path
+
+
+class TestDecoders:
+    """Test cases for the decoder implementations."""
+
+    def test_path_decoder_passes_path(self, temp_dir, pixels):
+        """Test the default decoder hands the path to PaddleOCR."""
+        path = _save(temp_dir, pixels, "a.png")
+        decoded = create_decoder("path").decode(path)
+        assert decoded.data == str(path)
+        assert not decoded.is_array
+
+    @pytest.mark.parametrize("name", ["path", "opencv", "pillow"])
+    def test_full_decode_is_bgr(self, temp_dir, pixels, name):
+        """Test every decoder produces the same BGR array at full size."""
+        path = _save(temp_dir, pixels, "a.png")
+        decoded = create_decoder(name).decode(path, as_array=True)
+        assert decoded.scale == 1.0
+        assert np.array_equal(decoded.data, pixels[:, :, ::-1])
+
+    @pytest.mark.parametrize("name", ["opencv", "pillow"])
+    def test_reduced_jpeg_decode(self, temp_dir, name):
+        """Test JPEGs decode straight to the requested maximum side."""
+        big = np.full((800, 1200, 3), 200, dtype=np.uint8)
+        path = temp_dir / "big.jpg"
+        Image.fromarray(big).save(path, quality=90)
+
+        decoded = create_decoder(name, max_side=300).decode(path)
+        assert decoded.data.shape == (200, 300, 3)
+        assert decoded.scale == pytest.approx(0.25)
+        assert decoded.original_size == (1200, 800)
+
+    @pytest.mark.parametrize(
+        "name,mode",
+        [("a.bmp", "RGB"), ("a.tiff", "RGB"), ("g.bmp", "L"), ("g.tiff", "L")],
+    )
+    def test_memory_mapped_raw_files(self, temp_dir, pixels, name, mode):
+        """Test uncompressed BMP/TIFF files decode identically via mmap."""
+        path = _save(temp_dir, pixels, name, mode)
+        expected = cv2.imdecode(np.fromfile(str(path), np.uint8), cv2.IMREAD_COLOR)
+
+        with Image.open(path) as img:
+            assert _map_raw(path, img, img.size) is not None
+
+        decoded = create_decoder("pillow", mmap_min_mb=0).decode(path)
+        assert np.array_equal(decoded.data, expected)
+
+    def test_unknown_decoder(self):
+        """Test unknown decoder names are rejected."""
+        with pytest.raises(ValueError):
+            create_decoder("magic")
+
+    def test_undecodable_file(self, temp_dir):
+        """Test garbage files raise ValueError."""
+        path = temp_dir / "broken.png"
+        path.write_bytes(b"not an image")
+        with pytest.raises(ValueError):
+            create_decoder("opencv").decode(path)
+
+
+class TestEngineDecoding:
+    """Test cases for decoder integration in OCREngine."""
+
+    def test_invalid_decoder_config(self):
+        """Test OCRConfig validates the decoder name."""
+        with pytest.raises(ValueError):
+            OCRConfig(decoder="magic")
+
+    def test_bboxes_mapped_to_original_size(self, temp_dir):
+        """Test boxes from a reduced decode are scaled back to the original."""
+        path = temp_dir / "page.png"
+        Image.new("RGB", (400, 200), color="white").save(path)
+
+        engine = OCREngine(
+            OCRConfig(show_log=False, decoder="opencv", decode_max_side=100)
+        )
+        engine._initialized = True
+        engine._ocr = MagicMock()
+        engine._ocr.ocr.return_value = [
+            [[[[10, 5], [20, 5], [20, 10], [10, 10]], ("字", 0.9)]]
+        ]
+
+        result = engine.process_image(path)
+
+        assert engine._ocr.ocr.call_args[0][0].shape == (50, 100, 3)
+        assert result.lines[0].bbox == [[40, 20], [80, 20], [80, 40], [40, 40]]
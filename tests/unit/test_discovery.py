@@ -0,0 +1,96 @@
+"""
+Unit tests for streaming file discovery.
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from smart_ocr.core.discovery import iter_images, read_file_list
+from smart_ocr.core.sharding import select_shard
+
+
+@pytest.fixture
+def tree(temp_dir):
+    """Nested directory of images and other files."""
+    for name in [
+        "b.png",
+        "a.JPG",
+        "notes.txt",
+        "a/z.png",
+        "a/deep/y.tiff",
+        "a.png",
+        "c/x.bmp",
+        "c/readme.md",
+    ]:
+        path = temp_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    (temp_dir / "empty").mkdir()
+    return temp_dir
+
+
+class TestIterImages:
+    """Test cases for iter_images."""
+
+    def test_recursive_sorted_order(self, tree):
+        """Test the streamed order equals sorting the full listing."""
+        expected = sorted(
+            p
+            for p in tree.rglob("*")
+            if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".tiff", ".bmp"}
+        )
+        assert list(iter_images(tree, recursive=True)) == expected
+
+    def test_top_level_only(self, tree):
+        """Test subdirectories are skipped unless recursive."""
+        expected = [tree / "a.JPG", tree / "a.png", tree / "b.png"]
+        assert list(iter_images(tree)) == expected
+
+    def test_extensions(self, tree):
+        """Test extension filtering is case-insensitive and accepts bare names."""
+        assert list(iter_images(tree, extensions=["jpg"])) == [tree / "a.JPG"]
+
+    def test_unsorted_same_files(self, tree):
+        """Test listing order yields the same set of files."""
+        assert sorted(iter_images(tree, recursive=True, sort=False)) == list(
+            iter_images(tree, recursive=True)
+        )
+
+    def test_shard_matches_select_shard(self, tree):
+        """Test streamed sharding agrees with select_shard."""
+        everything = list(iter_images(tree, recursive=True))
+        for index in range(3):
+            assert list(
+                iter_images(tree, recursive=True, shard=(index, 3))
+            ) == select_shard(everything, tree, index, 3)
+
+    def test_lazy(self, tree):
+        """Test files are produced one at a time."""
+        images = iter_images(tree, recursive=True)
+        assert next(images) == tree / "a" / "deep" / "y.tiff"
+
+    def test_not_a_directory(self, temp_dir):
+        """Test a missing directory raises immediately."""
+        with pytest.raises(NotADirectoryError):
+            iter_images(temp_dir / "missing")
+
+
+class TestReadFileList:
+    """Test cases for read_file_list."""
+
+    def test_from_file(self, temp_dir):
+        """Test paths are read one per line, blank lines skipped."""
+        listing = temp_dir / "files.txt"
+        listing.write_text("a.png\n\n dir/with space.png\r\n", encoding="utf-8")
+
+        assert list(read_file_list(listing)) == [
+            Path("a.png"),
+            Path(" dir/with space.png"),
+        ]
+
+    def test_from_stdin(self, monkeypatch):
+        """Test '-' reads standard input."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("x.png\ny.png\n"))
+        assert list(read_file_list("-")) == [Path("x.png"), Path("y.png")]
@@ -0,0 +1,194 @@
+"""
+Unit tests for the golden-corpus evaluation harness.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.evaluation import (
+    EvaluationReport,
+    FileScore,
+    character_error_rate,
+    compare,
+    edit_distance,
+    evaluate,
+    format_tradeoff,
+    load_corpus,
+    tokenize_words,
+    word_error_rate,
+    worsened_files,
+)
+
+
+@pytest.fixture
+def corpus_dir(temp_dir):
+    """Create a two-image labelled corpus (image contents are irrelevant)."""
+    for name, truth in [("a", "戶名 王小明"), ("b", "存款帳號\n12345")]:
+        (temp_dir / f"{name}.png").write_bytes(b"")
+        (temp_dir / f"{name}.gt.txt").write_text(truth, encoding="utf-8")
+    (temp_dir / "unlabelled.png").write_bytes(b"")
+    return temp_dir
+
+
+def _report(cer_errors: int, seconds: float) -> EvaluationReport:
+    return EvaluationReport(
+        files=[FileScore("a.png", cer_errors, 100, 0, 10, seconds)], seconds=seconds
+    )
+
+
+class TestMetrics:
+    """Test cases for CER/WER computation."""
+
+    def test_edit_distance(self):
+        """Test Levenshtein distance."""
+        assert edit_distance("kitten", "sitting") == 3
+        assert edit_distance("", "abc") == 3
+        assert edit_distance(["a", "b"], ["a", "b"]) == 0
+
+    def test_character_error_rate(self):
+        """Test CER ignores whitespace layout differences."""
+        assert character_error_rate("存款帳號", "存款帳號") == 0.0
+        assert character_error_rate("存款帳號", "存歀帳號") == 0.25
+        assert character_error_rate("a b\nc", "a  b c") == 0.0
+
+    def test_word_error_rate(self):
+        """Test WER over whitespace-separated words."""
+        assert word_error_rate("the quick fox", "the quack fox") == pytest.approx(1 / 3)
+        assert word_error_rate("", "") == 0.0
+
+    def test_cjk_characters_are_words(self):
+        """Test an unspaced Chinese line is scored per character, not as one word."""
+        assert tokenize_words("戶名 王小明 A-12") == [
+            "戶",
+            "名",
+            "王",
+            "小",
+            "明",
+            "A-12",
+        ]
+        assert word_error_rate("存款帳號", "存歀帳號") == 0.25
+
+
+class TestEvaluate:
+    """Test cases for running and comparing evaluations."""
+
+    def test_load_corpus(self, corpus_dir):
+        """Test images without ground truth are skipped."""
+        corpus = load_corpus(corpus_dir)
+        assert [path.name for path, _ in corpus] == ["a.png", "b.png"]
+
+    def test_load_empty_corpus(self, temp_dir):
+        """Test an unlabelled directory is rejected."""
+        with pytest.raises(ValueError):
+            load_corpus(temp_dir)
+
+    def test_evaluate(self, corpus_dir):
+        """Test per-file and overall scores."""
+        engine = MagicMock()
+        engine.process_image.side_effect = [
+            MagicMock(text="戶名 王小明"),
+            MagicMock(text="存款帳號\n12346"),
+        ]
+
+        report = evaluate(engine, load_corpus(corpus_dir), root=corpus_dir)
+
+        engine.warmup.assert_called_once()
+        assert [f.source_file for f in report.files] == ["a.png", "b.png"]
+        assert report.files[0].cer == 0.0
+        assert report.files[1].char_errors == 1
+        assert report.cer == pytest.approx(1 / 16)
+        assert report.files[1].words == 5  # 4 characters and "12345"
+        assert report.files[1].word_errors == 1
+        assert report.images_per_second > 0
+        assert "node" not in report.environment
+
+    def test_host_recorded_on_request(self, corpus_dir):
+        """Test the host name is only stored when asked for."""
+        engine = MagicMock()
+        engine.process_image.return_value = MagicMock(text="")
+
+        report = evaluate(engine, load_corpus(corpus_dir), record_host=True)
+
+        assert "node" in report.environment
+
+    def test_failed_file_scores_as_wrong(self, corpus_dir):
+        """Test an engine error counts every character as an error."""
+        engine = MagicMock()
+        engine.process_image.side_effect = RuntimeError("boom")
+
+        report = evaluate(engine, load_corpus(corpus_dir))
+
+        assert report.cer == 1.0
+
+    def test_baseline_round_trip(self, temp_dir):
+        """Test a saved baseline loads back with the same scores."""
+        report = _report(5, 2.0)
+        loaded = EvaluationReport.load(report.save(temp_dir / "baseline.json"))
+        assert loaded.cer == report.cer
+        assert loaded.images_per_second == report.images_per_second
+
+    def test_compare(self):
+        """Test accuracy and speed regressions are both detected."""
+        baseline = _report(5, 1.0)
+        assert compare(_report(5, 1.05), baseline) == []
+        assert len(compare(_report(10, 1.0), baseline)) == 1
+        assert len(compare(_report(10, 2.0), baseline)) == 2
+
+    def test_format_tradeoff(self):
+        """Test the trade-off summary shows accuracy and speed changes."""
+        summary = format_tradeoff(_report(8, 1.0), _report(5, 2.0))
+        assert "CER 0.0500 -> 0.0800 (+0.0300)" in summary
+        assert "(2.00x)" in summary
+
+    def test_worsened_files(self):
+        """Test files whose CER rose are listed."""
+        worse = worsened_files(_report(9, 1.0), _report(5, 1.0))
+        assert worse == [("a.png", 0.05, 0.09)]
+
+
+class TestEvaluateCommand:
+    """Test cases for the evaluate CLI command."""
+
+    def test_regression_fails(self, corpus_dir, monkeypatch, capsys):
+        """Test the command exits 1 when accuracy regresses."""
+        from smart_ocr import cli
+
+        engine = MagicMock()
+        engine.process_image.return_value = MagicMock(text="")
+        monkeypatch.setattr(cli, "OCREngine", MagicMock(return_value=engine))
+
+        baseline = EvaluationReport(
+            files=[FileScore("a.png", 0, 6, 0, 2, 0.1)], seconds=0.1
+        ).save(corpus_dir / "baseline.json")
+
+        code = cli.main(["evaluate", str(corpus_dir), "--baseline", str(baseline)])
+
+        assert code == 1
+        assert "REGRESSION: CER" in capsys.readouterr().err
+
+    def test_save_baseline(self, corpus_dir, monkeypatch):
+        """Test --save-baseline writes a loadable baseline."""
+        from smart_ocr import cli
+
+        engine = MagicMock()
+        engine.process_image.return_value = MagicMock(text="戶名 王小明")
+        monkeypatch.setattr(cli, "OCREngine", MagicMock(return_value=engine))
+        output = corpus_dir / "new.json"
+
+        code = cli.main(
+            [
+                "evaluate",
+                str(corpus_dir),
+                "--preset",
+                "english",
+                "-q",
+                "--save-baseline",
+                str(output),
+            ]
+        )
+
+        assert code == 0
+        assert len(EvaluationReport.load(output).files) == 2
+        config = cli.OCREngine.call_args.args[0]
+        assert config.lang == "en"
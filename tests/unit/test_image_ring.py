@@ -0,0 +1,74 @@
+"""
+Unit tests for the shared memory image ring.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from smart_ocr.core.image_ring import SharedImageRing  # noqa: E402
+
+
+@pytest.fixture
+def ring():
+    ring = SharedImageRing(slots=2, slot_bytes=64 * 64 * 3)
+    yield ring
+    ring.close()
+
+
+class TestSharedImageRing:
+    """Test cases for SharedImageRing."""
+
+    def test_write_and_view(self, ring):
+        """Test an image round-trips through a slot."""
+        image = np.random.randint(0, 255, (64, 64, 3), dtype=np.uint8)
+        slot = ring.acquire()
+        handle = ring.write(slot, image)
+
+        assert handle.shape == (64, 64, 3)
+        assert np.array_equal(ring.view(handle), image)
+
+    def test_attach_sees_same_memory(self, ring):
+        """Test a second attachment reads the slot without copying."""
+        image = np.full((10, 20), 7, dtype=np.uint8)
+        handle = ring.write(1, image)
+
+        other = SharedImageRing.attach(ring.name, ring.slots, ring.slot_bytes)
+        view = other.view(handle)
+        assert np.array_equal(view, image)
+        assert not view.flags.owndata
+        del view
+        other.close()
+
+    def test_slots_do_not_overlap(self, ring):
+        """Test writing one slot leaves the other untouched."""
+        first = ring.write(0, np.zeros((64, 64, 3), dtype=np.uint8))
+        ring.write(1, np.full((64, 64, 3), 255, dtype=np.uint8))
+        assert ring.view(first).max() == 0
+
+    def test_acquire_and_release(self, ring):
+        """Test slots are handed out until exhausted and can be reused."""
+        slots = [ring.acquire(), ring.acquire()]
+        assert sorted(slots) == [0, 1]
+        assert ring.acquire() is None
+        ring.release(slots[0])
+        assert ring.acquire() == slots[0]
+
+    def test_too_large(self, ring):
+        """Test an image larger than a slot is rejected."""
+        image = np.zeros((65, 64, 3), dtype=np.uint8)
+        assert not ring.fits(image)
+        with pytest.raises(ValueError):
+            ring.write(0, image)
+
+    def test_close_with_live_view_unlinks(self):
+        """Test the owner unlinks the block even while a view is alive."""
+        ring = SharedImageRing(slots=1, slot_bytes=16)
+        view = ring.view(ring.write(0, np.arange(16, dtype=np.uint8)))
+
+        ring.close()
+        with pytest.raises(FileNotFoundError):
+            SharedImageRing.attach(ring.name, 1, 16)
+        assert view[3] == 3
+        del view
+        ring.close()
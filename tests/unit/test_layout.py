@@ -0,0 +1,121 @@
+"""
+Unit tests for layout analysis.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from smart_ocr.core.layout import analyze_layout  # noqa: E402
+
+
+def _box(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+def _two_column_page():
+    """Title, two columns in interleaved detector order, then a footer."""
+    boxes, names = [], []
+    for row in range(5):
+        # The columns' lines do not share baselines
+        top = 200 + row * 30
+        boxes += [_box(600, top + 15, 1000, top + 35), _box(100, top, 500, top + 20)]
+        names += [f"R{row}", f"L{row}"]
+    boxes += [_box(100, 100, 1000, 130), _box(100, 420, 1000, 440)]
+    names += ["title", "footer"]
+    return boxes, names
+
+
+class TestAnalyzeLayout:
+    """Test cases for reading order, paragraphs and columns."""
+
+    def test_empty(self):
+        """Test a page without boxes has an empty layout."""
+        layout = analyze_layout([])
+        assert layout.order == []
+        assert layout.columns == []
+
+    def test_two_columns(self):
+        """Test columns are read one after the other, under the title."""
+        boxes, names = _two_column_page()
+        layout = analyze_layout(boxes)
+
+        order = [names[i] for i in layout.order]
+        assert order == (
+            ["title"] + [f"L{r}" for r in range(5)] + [f"R{r}" for r in range(5)]
+        ) + ["footer"]
+        assert [[names[i] for i in p] for p in layout.paragraphs][1] == [
+            f"L{r}" for r in range(5)
+        ]
+        assert len(layout.columns) == 4
+
+    def test_row_read_left_to_right(self):
+        """Test boxes of one slightly skewed row are read left to right."""
+        boxes = [_box(320, 104, 600, 124), _box(100, 100, 300, 120)]
+        layout = analyze_layout(boxes)
+
+        assert layout.rows == [[1, 0]]
+
+    def test_paragraph_gap(self):
+        """Test a wide vertical gap starts a new paragraph in the column."""
+        boxes = [
+            _box(100, 100, 900, 120),
+            _box(100, 130, 900, 150),
+            _box(100, 200, 900, 220),
+        ]
+        layout = analyze_layout(boxes)
+
+        assert layout.paragraphs == [[0, 1], [2]]
+        assert len(layout.columns) == 1
+
+    def test_mixed_point_counts(self):
+        """Test boxes with differing numbers of points are bounded each."""
+        boxes = [_box(100, 200, 500, 220), [[100, 100], [500, 100], [500, 120]]]
+
+        assert analyze_layout(boxes).order == [1, 0]
+
+    def test_scale_invariant(self):
+        """Test thresholds follow the line height, not pixels."""
+        boxes, _ = _two_column_page()
+        scaled = [[[x * 3, y * 3] for x, y in box] for box in boxes]
+
+        assert analyze_layout(scaled).order == analyze_layout(boxes).order
+
+    def test_many_boxes(self):
+        """Test a dense page is ordered without pairwise comparisons."""
+        boxes = [
+            _box(
+                100 + col * 700,
+                100 + row * 30 + col * 15,
+                600 + col * 700,
+                120 + row * 30 + col * 15,
+            )
+            for row in range(1000)
+            for col in range(2)
+        ]
+        layout = analyze_layout(boxes)
+
+        assert layout.order == list(range(0, 2000, 2)) + list(range(1, 2000, 2))
+
+    def test_form_read_row_by_row(self):
+        """Test labels and values that line up are read as rows, not columns."""
+        boxes = []
+        for row in range(3):
+            top = 100 + row * 40
+            boxes += [_box(100, top, 220, top + 20), _box(400, top + 2, 800, top + 22)]
+        layout = analyze_layout(boxes)
+
+        assert layout.order == [0, 1, 2, 3, 4, 5]
+        assert layout.rows == [[0, 1], [2, 3], [4, 5]]
+
+    def test_single_row_side_is_not_a_column(self):
+        """Test a lone line beside a paragraph does not start a column."""
+        boxes = [
+            _box(100, 100, 500, 120),
+            _box(100, 130, 500, 150),
+            _box(700, 135, 900, 155),
+            _box(100, 160, 500, 180),
+        ]
+        layout = analyze_layout(boxes)
+
+        assert layout.order == [0, 1, 2, 3]
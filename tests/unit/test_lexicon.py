@@ -0,0 +1,117 @@
+"""
+Unit tests for lexicon correction.
+"""
+
+import random
+
+import pytest
+
+from smart_ocr.core.lexicon import Lexicon, LexiconMatch
+
+TERMS = [
+    "台北富邦商業銀行",
+    "台灣電力股份有限公司",
+    "中華電信股份有限公司",
+    "台中市",
+    "台北市",
+    "忠孝東路",
+]
+
+
+class TestLexicon:
+    """Test cases for seed matching and bounded correction."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (
+                "轉帳至台北富邦商業很行帳戶",
+                "轉帳至台北富邦商業銀行帳戶",
+            ),  # substitution
+            ("台北邦商業銀行", "台北富邦商業銀行"),  # deletion
+            ("台北富邦商業銀X行", "台北富邦商業銀行"),  # insertion
+            ("台灣電力股份有限公可繳費", "台灣電力股份有限公司繳費"),
+            ("中華電言股份有限公司", "中華電信股份有限公司"),
+        ],
+    )
+    def test_corrects_near_misses(self, text, expected):
+        """Test one edit is corrected to the lexicon term."""
+        assert Lexicon(TERMS).correct(text) == (expected, 1)
+
+    def test_exact_terms_kept(self):
+        """Test a correct term is never rewritten into a similar one."""
+        lexicon = Lexicon(TERMS)
+
+        assert lexicon.correct("台中市北屯區") == ("台中市北屯區", 0)
+        assert lexicon.matches("台北市忠孝東路") == [
+            LexiconMatch(0, 3, "台北市", 0),
+            LexiconMatch(3, 7, "忠孝東路", 0),
+        ]
+
+    def test_distance_bound(self):
+        """Test misses beyond the edit bound are left alone."""
+        text = "台北福邦商業很行"
+        assert Lexicon(TERMS).correct(text) == (text, 0)
+        assert Lexicon(TERMS, max_distance=2).correct(text) == (text, 0)
+
+        lexicon = Lexicon(TERMS, max_distance=2, chars_per_edit=4)
+        assert lexicon.correct(text) == ("台北富邦商業銀行", 1)
+
+    def test_short_terms_not_rewritten(self):
+        """Test terms too short to seed k + 1 pieces get no edits."""
+        lexicon = Lexicon(["台中", "中"])
+
+        assert lexicon.correct("台北") == ("台北", 0)
+        assert len(lexicon) == 1
+
+    @pytest.mark.parametrize(
+        "term, text",
+        [
+            ("中山北路", "台北市中山南路一段"),
+            ("台灣電力公司", "台灣電視公司"),
+        ],
+    )
+    def test_similar_names_not_rewritten(self, term, text):
+        """Test a different real name one character off a short term is kept."""
+        assert Lexicon([term]).correct(text) == (text, 0)
+
+    def test_ambiguous_near_miss_kept(self):
+        """Test a span close to two different terms is left as read."""
+        lexicon = Lexicon(["台北富邦商業銀行", "台北復興商業銀行"])
+
+        assert lexicon.correct("台北富興商業銀行") == ("台北富興商業銀行", 0)
+        assert lexicon.correct("台北富邦商業很行") == ("台北富邦商業銀行", 1)
+
+    def test_several_corrections(self):
+        """Test every near-miss in a line is corrected."""
+        text = "中華電言股份有限公司與台灣電力股份有限公可"
+        expected = "中華電信股份有限公司與台灣電力股份有限公司"
+        assert Lexicon(TERMS).correct(text) == (expected, 2)
+
+    def test_large_lexicon(self):
+        """Test a lexicon of many terms finds the one that was misread."""
+        rng = random.Random(0)
+        chars = [chr(code) for code in range(0x4E00, 0x4E00 + 3000)]
+        terms = [
+            "".join(rng.choice(chars) for _ in range(rng.randint(7, 12)))
+            for _ in range(5000)
+        ]
+        misread = terms[42][:2] + "錯" + terms[42][3:]
+
+        corrected, changed = Lexicon(terms).correct(f"前言{misread}後記")
+        assert corrected == f"前言{terms[42]}後記"
+        assert changed == 1
+
+    def test_load(self, temp_dir):
+        """Test loading a lexicon file with comments and blank lines."""
+        path = temp_dir / "banks.txt"
+        path.write_text("# banks\n台北富邦商業銀行\n\n中華電信\n", encoding="utf-8")
+
+        assert Lexicon.load(path).terms == ["台北富邦商業銀行", "中華電信"]
+
+    def test_invalid_distance(self):
+        """Test a negative edit bound is rejected."""
+        with pytest.raises(ValueError):
+            Lexicon(TERMS, max_distance=-1)
+        with pytest.raises(ValueError):
+            Lexicon(TERMS, chars_per_edit=0)
@@ -0,0 +1,91 @@
+"""
+Unit tests for text normalization.
+"""
+
+import pytest
+
+from smart_ocr.core.normalize import TextNormalizer, load_conversion
+
+CHARACTERS = {"头": "頭", "发": "發", "国": "國", "台": "臺"}
+PHRASES = {"头发": "頭髮", "发展": "發展", "台风": "颱風", "台风眼": "颱風眼"}
+
+
+class TestTextNormalizer:
+    """Test cases for width and dictionary conversion."""
+
+    def test_width(self):
+        """Test full-width digits, letters and spaces become half-width."""
+        normalizer = TextNormalizer(width=True)
+
+        assert normalizer.normalize("ＡＢｃ１２３　號") == "ABc123 號"
+        assert normalizer.normalize("，。") == "，。"  # CJK punctuation kept
+
+    def test_disabled(self):
+        """Test a normalizer without tables changes nothing."""
+        normalizer = TextNormalizer()
+
+        assert not normalizer.enabled
+        assert normalizer.normalize("ＡＢ头") == "ＡＢ头"
+
+    def test_phrase_before_character(self):
+        """Test phrases take precedence over the character map."""
+        normalizer = TextNormalizer(characters=CHARACTERS, phrases=PHRASES)
+
+        assert normalizer.normalize("头发") == "頭髮"
+        assert normalizer.normalize("国家发展") == "國家發展"
+        assert normalizer.normalize("头") == "頭"
+
+    def test_longest_match(self):
+        """Test the longest phrase at a position wins."""
+        normalizer = TextNormalizer(characters=CHARACTERS, phrases=PHRASES)
+
+        assert normalizer.normalize("台风眼台风台") == "颱風眼颱風臺"
+
+    def test_overlapping_phrase_starts(self):
+        """Test a phrase is not matched inside an already converted one."""
+        normalizer = TextNormalizer(characters=CHARACTERS, phrases=PHRASES)
+
+        # 发展 must not be matched from the 发 of 头发
+        assert normalizer.normalize("头发展") == "頭髮展"
+
+    def test_normalize_lines(self):
+        """Test lines are normalized together without phrases crossing."""
+        normalizer = TextNormalizer(width=True, characters=CHARACTERS, phrases=PHRASES)
+
+        assert normalizer.normalize_lines(["头", "发", "１头发"]) == [
+            "頭",
+            "發",
+            "1頭髮",
+        ]
+        assert normalizer.normalize_lines(["a\n头", "发"]) == ["a\n頭", "發"]
+        assert normalizer.normalize_lines([]) == []
+
+
+class TestLoadConversion:
+    """Test cases for OpenCC-format dictionaries."""
+
+    def test_file(self, temp_dir):
+        """Test characters and phrases are split and first targets used."""
+        path = temp_dir / "STPhrases.txt"
+        path.write_text(
+            "# comment\n头\t頭\n发\t發 髮\n\n头发\t頭髮\n同\t同\n", encoding="utf-8"
+        )
+
+        characters, phrases = load_conversion(path)
+
+        assert characters == {"头": "頭", "发": "發"}
+        assert phrases == {"头发": "頭髮"}
+
+    def test_directory(self, temp_dir):
+        """Test every dictionary in a directory is loaded."""
+        (temp_dir / "STCharacters.txt").write_text("国\t國\n", encoding="utf-8")
+        (temp_dir / "STPhrases.txt").write_text("头发\t頭髮\n", encoding="utf-8")
+
+        normalizer = TextNormalizer.from_dictionary(temp_dir, width=True)
+
+        assert normalizer.normalize("国１头发") == "國1頭髮"
+
+    def test_missing(self, temp_dir):
+        """Test a missing dictionary raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_conversion(temp_dir / "missing.txt")
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.normalize import TextNormalizer
 from smart_ocr.core.ocr_engine import OCREngine, OCRLine, OCRResult
 
 
@@ -181,3 +182,445 @@ class TestOCREngine:
         output = engine.export_results(results, format="txt")
         assert output.exists()
         assert output.suffix == ".txt"
+
+    def test_export_compressed(self, sample_config, temp_dir):
+        """Test gzip export appends the .gz suffix."""
+        import gzip
+        import json
+
+        sample_config.output_dir = temp_dir
+        engine = OCREngine(sample_config)
+
+        results = [OCRResult(Path("test.png"), [OCRLine("Test", 0.95, [])])]
+
+        output = engine.export_results(results, format="json", compress="gzip")
+        assert output.name == "ocr_results.json.gz"
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert json.load(f)[0]["text"] == "Test"
+
+    def test_export_binary_format_with_compression(self, sample_config, temp_dir):
+        """Test a binary format with compress is written uncompressed."""
+        sample_config.output_dir = temp_dir
+        engine = OCREngine(sample_config)
+
+        results = [OCRResult(Path("test.png"), [OCRLine("Test", 0.95, [])])]
+
+        output = engine.export_results(results, format="bin", compress="gzip")
+        assert output.name == "ocr_results.bin"
+        assert OCRResult.from_bytes(output.read_bytes()).text == "Test"
+
+    def test_export_several_formats(self, sample_config, temp_dir):
+        """Test several formats are exported side by side in one call."""
+        engine = OCREngine(sample_config)
+        results = [OCRResult(Path("a.png"), [OCRLine("Test", 0.9, [])])]
+
+        outputs = engine.export_results(
+            results, temp_dir / "out" / "results.json", format="json,csv"
+        )
+
+        assert outputs == [
+            temp_dir / "out" / "results.json",
+            temp_dir / "out" / "results.csv",
+        ]
+        assert all(path.exists() for path in outputs)
+
+
+class TestPagePooling:
+    """Test cases for cross-page recognition pooling."""
+
+    def _engine(self, temp_dir, pages=3):
+        import cv2
+        import numpy as np
+
+        paths = []
+        for i in range(pages):
+            path = temp_dir / f"page_{i}.png"
+            cv2.imwrite(str(path), np.full((100, 200, 3), 255, dtype=np.uint8))
+            paths.append(path)
+
+        box = [[10, 10], [110, 10], [110, 30], [10, 30]]
+        engine = OCREngine(OCRConfig(show_log=False, rec_page_batch=2))
+        engine._initialized = True
+        engine._ocr = MagicMock()
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not rec:
+                return [[box, box]]
+            return [[(f"line{i}", 0.9) for i in range(len(image))]]
+
+        engine._ocr.ocr.side_effect = ocr
+        return engine, paths
+
+    def test_crops_pooled_across_pages(self, temp_dir):
+        """Test one recognition call per group of pages, order restored."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir)
+
+        results = engine.process_images(paths)
+
+        assert [r.source_file for r in results] == paths
+        assert [line.text for line in results[0].lines] == ["line0", "line1"]
+        assert [line.text for line in results[1].lines] == ["line2", "line3"]
+        assert [line.text for line in results[2].lines] == ["line0", "line1"]
+        rec_calls = [
+            call
+            for call in engine._ocr.ocr.call_args_list
+            if call.kwargs.get("det") is False
+        ]
+        assert [len(call.args[0]) for call in rec_calls] == [4, 2]
+        assert engine.stats.get("images") == 3
+
+    def test_failed_page_skipped(self, temp_dir):
+        """Test a missing page is skipped without losing its group."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=1)
+
+        results = engine.process_images([temp_dir / "missing.png", paths[0]])
+
+        assert [r.source_file for r in results] == paths
+
+    def test_rec_failure_falls_back(self, temp_dir):
+        """Test a failed pooled recognition retries page by page."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=2)
+        box = [[10, 10], [110, 10], [110, 30], [10, 30]]
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not det:
+                raise RuntimeError("rec failed")
+            if not rec:
+                return [[box]]
+            return [[[box, ("whole page", 0.9)]]]
+
+        engine._ocr.ocr.side_effect = ocr
+        results = engine.process_images(paths)
+
+        assert [r.text for r in results] == ["whole page", "whole page"]
+
+
+class TestStreamingExport:
+    """Test cases for handing pages to a writer as they are produced."""
+
+    def _engine(self, temp_dir, pages=3, **options):
+        import cv2
+        import numpy as np
+
+        paths = []
+        for i in range(pages):
+            path = temp_dir / f"page_{i}.png"
+            cv2.imwrite(str(path), np.full((100, 200, 3), 255, dtype=np.uint8))
+            paths.append(path)
+
+        box = [[10, 10], [110, 10], [110, 30], [10, 30]]
+        engine = OCREngine(OCRConfig(show_log=False, **options))
+        engine._initialized = True
+        engine._ocr = MagicMock()
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not rec:
+                return [[box]]
+            if not det:
+                return [[("text", 0.9) for _ in image]]
+            return [[[box, ("text", 0.9)]]]
+
+        engine._ocr.ocr.side_effect = ocr
+        return engine, paths
+
+    @pytest.mark.parametrize("rec_page_batch", [1, 2])
+    def test_pages_passed_with_decoded_images(self, temp_dir, rec_page_batch):
+        """Test each page reaches on_page in order with its pixels."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, rec_page_batch=rec_page_batch)
+        pages = []
+
+        results = engine.process_images(
+            paths, on_page=lambda result, image: pages.append((result, image))
+        )
+
+        assert [result for result, _ in pages] == results
+        assert [result.source_file for result in results] == paths
+        assert [image.shape for _, image in pages] == [(100, 200, 3)] * 3
+
+    def test_reduced_decode_passes_no_image(self, temp_dir):
+        """Test downscaled pixels are not passed on as the source image."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, pages=1, decode_max_side=50)
+        images = []
+
+        engine.process_images(paths, on_page=lambda result, image: images.append(image))
+
+        assert images == [None]
+
+    def test_pdf_written_without_decoding_again(self, temp_dir, monkeypatch):
+        """Test a streamed pdf export embeds the engine's decoded pages."""
+        pytest.importorskip("cv2")
+        import smart_ocr.core.pdf as pdf
+
+        def fail(*args):
+            raise AssertionError("image decoded again")
+
+        monkeypatch.setattr(pdf, "_decode", fail)
+        engine, paths = self._engine(temp_dir)
+
+        writer = engine.create_export_writer(temp_dir / "out.pdf", "pdf")
+        with writer:
+            engine.process_images(paths, on_page=writer.write)
+
+        assert writer.paths == [temp_dir / "out.pdf"]
+        assert b"/Count 3" in (temp_dir / "out.pdf").read_bytes()
+
+
+class TestBlankPages:
+    """Test cases for skipping OCR on blank pages."""
+
+    def _engine(self, temp_dir, **options):
+        import cv2
+        import numpy as np
+
+        blank = np.full((400, 300, 3), 240, dtype=np.uint8)
+        text = blank.copy()
+        text[50:350:40, 30:270] = 0
+        paths = []
+        for name, image in (("blank.png", blank), ("text.png", text)):
+            cv2.imwrite(str(temp_dir / name), image)
+            paths.append(temp_dir / name)
+
+        box = [[30, 50], [270, 50], [270, 60], [30, 60]]
+        engine = OCREngine(OCRConfig(show_log=False, skip_blank=True, **options))
+        engine._initialized = True
+        engine._ocr = MagicMock()
+
+        def ocr(image, det=True, rec=True, cls=False):
+            if not rec:
+                return [[box]]
+            if not det:
+                return [[("text", 0.9) for _ in image]]
+            return [[[box, ("text", 0.9)]]]
+
+        engine._ocr.ocr.side_effect = ocr
+        return engine, paths
+
+    def test_blank_page_skips_ocr(self, temp_dir):
+        """Test a blank page returns an empty result without running OCR."""
+        pytest.importorskip("cv2")
+        engine, (blank, text) = self._engine(temp_dir)
+
+        result = engine.process_image(blank)
+        assert result.blank
+        assert result.lines == []
+        engine._ocr.ocr.assert_not_called()
+
+        assert not engine.process_image(text).blank
+        assert engine._ocr.ocr.called
+        assert engine.stats.get("blank_pages") == 1
+        assert engine.stats.get("images") == 2
+
+    def test_blank_pages_in_pooled_batch(self, temp_dir):
+        """Test blank pages drop out of pooled detection and recognition."""
+        pytest.importorskip("cv2")
+        engine, paths = self._engine(temp_dir, rec_page_batch=2)
+
+        results = engine.process_images(paths)
+
+        assert [r.blank for r in results] == [True, False]
+        assert results[1].text == "text"
+        assert engine._ocr.ocr.call_count == 2  # text page: detect + recognize
+
+    def test_blank_round_trip(self):
+        """Test the blank flag survives serialization."""
+        result = OCRResult(Path("blank.png"), [], blank=True)
+        assert OCRResult.from_dict(result.to_dict()).blank
+        assert "blank" not in OCRResult(Path("a.png"), []).to_dict()
+
+
+class TestReadingOrder:
+    """Test cases for layout-aware text on OCRResult."""
+
+    def _result(self, **kwargs):
+        def box(x0, y0, x1, y1):
+            return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+        # Two columns whose lines do not share baselines
+        lines = [
+            OCRLine("right 1", 0.9, box(600, 115, 1000, 135)),
+            OCRLine("left 1", 0.9, box(100, 100, 500, 120)),
+            OCRLine("right 2", 0.9, box(600, 145, 1000, 165)),
+            OCRLine("left 2", 0.9, box(100, 130, 500, 150)),
+        ]
+        return OCRResult(Path("page.png"), lines, **kwargs)
+
+    def test_text_in_reading_order(self):
+        """Test multi-column text is joined column by column."""
+        result = self._result()
+
+        assert result.text == "left 1\nleft 2\nright 1\nright 2"
+        assert [[line.text for line in c] for c in result.columns] == [
+            ["left 1", "left 2"],
+            ["right 1", "right 2"],
+        ]
+        assert [line.text for line in result.lines][0] == "right 1"
+
+    def test_layout_follows_added_lines(self):
+        """Test the cached layout is rebuilt when lines are appended."""
+        result = self._result()
+        assert len(result.paragraphs) == 2
+
+        result.lines.append(OCRLine("footer", 0.9, [[100, 300], [1000, 300]]))
+        assert result.text.endswith("\nfooter")
+        assert len(result.paragraphs) == 3
+
+    def test_layout_follows_reordered_lines(self):
+        """Test the cached layout is rebuilt when lines are reordered."""
+        result = self._result()
+        text = result.text
+
+        result.lines.reverse()
+        assert result.text == text
+
+    def test_without_boxes(self):
+        """Test lines without boxes keep detector order."""
+        lines = [OCRLine("b", 0.9, []), OCRLine("a", 0.9, [])]
+        result = OCRResult(Path("a.png"), lines)
+
+        assert result.layout is None
+        assert result.text == "b\na"
+        assert [[line.text for line in p] for p in result.paragraphs] == [["b", "a"]]
+
+    def test_template_keeps_region_order(self):
+        """Test template results keep the template's region order."""
+        result = self._result(fields={"total": "right 1"})
+
+        assert result.layout is None
+        assert result.text.startswith("right 1\nleft 1")
+
+
+class TestRegionQueries:
+    """Test cases for spatial queries on OCRResult."""
+
+    def _result(self):
+        def box(x0, y0, x1, y1):
+            return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+        lines = [
+            OCRLine("姓名", 0.9, box(100, 100, 180, 120)),
+            OCRLine("王小明", 0.9, box(220, 101, 380, 121)),
+            OCRLine("日期", 0.9, box(100, 150, 180, 170)),
+            OCRLine("2024-10-01", 0.9, box(220, 150, 400, 170)),
+            OCRLine("備註", 0.9, []),
+        ]
+        return OCRResult(Path("form.png"), lines)
+
+    def test_lines_in(self):
+        """Test lines inside or touching a rectangle."""
+        result = self._result()
+
+        assert [line.text for line in result.lines_in((200, 90, 420, 180))] == [
+            "王小明",
+            "2024-10-01",
+        ]
+        touching = result.lines_in((150, 95, 230, 110), contained=False)
+        assert [line.text for line in touching] == ["姓名", "王小明"]
+
+    def test_key_value(self):
+        """Test reading form values with right_of and nearest."""
+        result = self._result()
+        key = result.nearest((90, 160))
+
+        assert key.text == "日期"
+        assert result.right_of(key).text == "2024-10-01"
+        assert result.right_of(result.lines[1]) is None
+        assert result.right_of(result.lines[4]) is None
+
+    def test_index_rebuilt_for_new_lines(self):
+        """Test the index covers lines appended after first use."""
+        result = self._result()
+        assert result.lines_in((0, 190, 500, 260)) == []
+
+        extra = OCRLine("地址", 0.9, [[100, 200], [180, 200], [180, 220], [100, 220]])
+        result.lines.append(extra)
+        assert result.lines_in((0, 190, 500, 260)) == [extra]
+
+    def test_index_rebuilt_for_replaced_lines(self):
+        """Test in-place replacement and new boxes invalidate the index."""
+        result = self._result()
+        assert [line.text for line in result.lines_in((0, 0, 200, 130))] == ["姓名"]
+
+        other = OCRLine("電話", 0.9, [[500, 500], [560, 500], [560, 520], [500, 520]])
+        result.lines[0] = other
+        assert result.lines_in((0, 0, 200, 130)) == []
+
+        other.bbox = [[10, 10], [70, 10], [70, 30], [10, 30]]
+        assert result.lines_in((0, 0, 200, 130)) == [other]
+
+    def test_single_line_has_nothing_right_of_it(self):
+        """Test right_of on a one-line page does not return the line."""
+        line = OCRLine("合計", 0.9, [[0, 0], [50, 0], [50, 20], [0, 20]])
+        result = OCRResult(Path("one.png"), [line])
+
+        assert result.right_of(line) is None
+
+
+class TestLexiconCorrection:
+    """Test cases for the engine's lexicon stage."""
+
+    def test_lines_corrected(self, temp_dir, sample_image):
+        """Test recognized lines are corrected and counted."""
+        lexicon = temp_dir / "banks.txt"
+        lexicon.write_text("台北富邦商業銀行\n", encoding="utf-8")
+        engine = OCREngine(OCRConfig(show_log=False, lexicon=lexicon))
+        engine._initialized = True
+        engine._ocr = MagicMock()
+        box = [[0, 0], [90, 0], [90, 20], [0, 20]]
+        engine._ocr.ocr.return_value = [[[box, ("台北富邦商業很行", 0.8)]]]
+
+        result = engine.process_image(sample_image)
+
+        assert result.text == "台北富邦商業銀行"
+        assert engine.stats.get("lexicon_corrections") == 1
+
+
+class TestNormalization:
+    """Test cases for the engine's normalization stage."""
+
+    def test_lines_normalized(self, temp_dir, sample_image):
+        """Test lines are normalized before lexicon correction."""
+        conversion = temp_dir / "st.txt"
+        conversion.write_text("银\t銀\n", encoding="utf-8")
+        lexicon = temp_dir / "banks.txt"
+        lexicon.write_text("台北富邦銀行\n", encoding="utf-8")
+        config = OCRConfig(
+            show_log=False,
+            normalize_width=True,
+            conversion_dict=conversion,
+            lexicon=lexicon,
+        )
+        engine = OCREngine(config)
+        engine._initialized = True
+        engine._ocr = MagicMock()
+        box = [[0, 0], [90, 0], [90, 20], [0, 20]]
+        low = [[0, 30], [90, 30], [90, 50], [0, 50]]
+        engine._ocr.ocr.return_value = [
+            [[box, ("台北富邦银行", 0.8)], [low, ("帳號１２３", 0.9)]]
+        ]
+
+        result = engine.process_image(sample_image)
+
+        assert result.text == "台北富邦銀行\n帳號123"
+        assert engine.stats.get("normalized_lines") == 2
+        assert engine.stats.get("lexicon_corrections") == 0
+
+    def test_disabled_by_default(self):
+        """Test no normalizer is built without options."""
+        assert OCREngine(OCRConfig(show_log=False))._normalizer is None
+
+    def test_result_fields(self):
+        """Test template fields are normalized with the lines."""
+        result = OCRResult(
+            Path("form.png"), [OCRLine("ＩＤ", 0.9, [])], fields={"id": "Ａ１２３"}
+        )
+
+        changed = result.normalize(TextNormalizer(width=True))
+
+        assert changed == 2
+        assert result.lines[0].text == "ID"
+        assert result.fields == {"id": "A123"}
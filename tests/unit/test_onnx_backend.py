@@ -0,0 +1,186 @@
+"""
+Unit tests for the ONNX Runtime backend.
+"""
+
+import pytest
+
+from smart_ocr.core import onnx_backend
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine
+from smart_ocr.core.onnx_backend import (
+    OnnxOCR,
+    ctc_decode,
+    db_postprocess,
+    det_preprocess,
+    rec_preprocess,
+)
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+CHARACTERS = ["", "A", "B", " "]
+
+
+class FakeSession:
+    """Stands in for an onnxruntime.InferenceSession."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = []
+
+    def get_inputs(self):
+        class Input:
+            name = "x"
+
+        return [Input()]
+
+    def run(self, outputs, feeds):
+        self.calls.append(feeds["x"])
+        return [self.func(feeds["x"])]
+
+
+def _det_output(blob):
+    """Probability map with one text line across the middle of the page."""
+    _, _, height, width = blob.shape
+    pred = np.zeros((1, 1, height, width), dtype=np.float32)
+    pred[0, 0, height // 2 - 4 : height // 2 + 4, width // 8 : width // 2] = 0.95
+    return pred
+
+
+def _rec_output(blob):
+    """Per-timestep probabilities decoding to "AB" for every crop."""
+    steps = [1, 1, 0, 2, 2, 0]
+    probs = np.full((blob.shape[0], len(steps), len(CHARACTERS)), 0.01, np.float32)
+    for t, index in enumerate(steps):
+        probs[:, t, index] = 0.9
+    return probs
+
+
+@pytest.fixture
+def model_dir(temp_dir, monkeypatch):
+    """Model directory whose sessions are replaced by fakes."""
+    for name in ("det.onnx", "rec.onnx", "det.int8.onnx", "rec.int8.onnx"):
+        (temp_dir / name).write_bytes(b"")
+    (temp_dir / "keys.txt").write_text("A\nB\n", encoding="utf-8")
+
+    sessions = {
+        "det.onnx": FakeSession(_det_output),
+        "rec.onnx": FakeSession(_rec_output),
+        "det.int8.onnx": FakeSession(_det_output),
+        "rec.int8.onnx": FakeSession(_rec_output),
+    }
+    monkeypatch.setattr(
+        onnx_backend, "_create_session", lambda path, config: sessions[path.name]
+    )
+    return temp_dir
+
+
+class TestProcessing:
+    """Test cases for pre- and post-processing."""
+
+    def test_det_preprocess(self):
+        """Test pages are limited to 960 px and rounded to multiples of 32."""
+        blob = det_preprocess(np.zeros((1000, 2000, 3), dtype=np.uint8))
+        assert blob.shape == (1, 3, 480, 960)
+        assert blob.dtype == np.float32
+
+    def test_db_postprocess(self):
+        """Test a text kernel becomes one grown box in source coordinates."""
+        pred = np.zeros((100, 200), dtype=np.float32)
+        pred[40:50, 20:120] = 0.9
+
+        boxes = db_postprocess(pred, (200, 400), unclip_ratio=1.5)
+
+        assert len(boxes) == 1
+        box = boxes[0]
+        assert box[0][0] < 40 and box[1][0] > 238
+        assert box[0][1] < 80 and box[2][1] > 98
+
+    def test_db_postprocess_low_score(self):
+        """Test boxes below box_thresh are dropped."""
+        pred = np.zeros((100, 200), dtype=np.float32)
+        pred[40:50, 20:120] = 0.4
+        assert db_postprocess(pred, (100, 200), box_thresh=0.6) == []
+
+    def test_ctc_decode(self):
+        """Test repeats merge and blanks separate characters."""
+        probs = _rec_output(np.zeros((2, 3, 48, 320)))
+        assert ctc_decode(probs, CHARACTERS)[0] == ("AB", pytest.approx(0.9))
+
+    def test_ctc_decode_empty(self):
+        """Test an all-blank sequence decodes to empty text."""
+        probs = np.zeros((1, 4, 4), dtype=np.float32)
+        probs[:, :, 0] = 1.0
+        assert ctc_decode(probs, CHARACTERS) == [("", 0.0)]
+
+    def test_rec_preprocess_width(self):
+        """Test the batch width follows the widest crop."""
+        crops = [
+            np.zeros((32, 64, 3), dtype=np.uint8),
+            np.zeros((32, 640, 3), dtype=np.uint8),
+        ]
+        assert rec_preprocess(crops).shape == (2, 3, 48, 960)
+
+
+class TestOnnxOCR:
+    """Test cases for OnnxOCR."""
+
+    def test_missing_model(self, temp_dir):
+        """Test a missing model file raises FileNotFoundError."""
+        config = OCRConfig(backend="onnxruntime", onnx_model_dir=temp_dir)
+        with pytest.raises(FileNotFoundError):
+            OnnxOCR(config)
+
+    def test_config_requires_model_dir(self):
+        """Test the onnxruntime backend needs a model directory."""
+        with pytest.raises(ValueError):
+            OCRConfig(backend="onnxruntime")
+
+    def test_paddle_compatible_output(self, model_dir):
+        """Test det+rec, det-only and rec-only result layouts."""
+        config = OCRConfig(backend="onnxruntime", onnx_model_dir=model_dir)
+        ocr = OnnxOCR(config)
+        page = np.full((200, 400, 3), 255, dtype=np.uint8)
+
+        full = ocr.ocr(page, cls=True)
+        assert len(full[0]) == 1
+        box, (text, score) = full[0][0]
+        assert text == "AB" and score == pytest.approx(0.9)
+        assert len(box) == 4
+
+        assert len(ocr.ocr(page, rec=False)[0]) == 1
+        crops = [page[:20, :100], page[:20, :50]]
+        assert ocr.ocr(crops, det=False) == [[("AB", pytest.approx(0.9))] * 2]
+
+    def test_quantized_models(self, model_dir):
+        """Test quantized=True loads the INT8 det/rec models."""
+        config = OCRConfig(
+            backend="onnxruntime", onnx_model_dir=model_dir, quantized=True
+        )
+        ocr = OnnxOCR(config)
+        ocr.ocr(np.full((200, 400, 3), 255, dtype=np.uint8))
+
+        assert ocr._det is onnx_backend._create_session(
+            model_dir / "det.int8.onnx", config
+        )
+        assert ocr._det.calls
+
+    def test_quantized_requires_onnxruntime(self):
+        """Test quantized models are rejected for the paddle backend."""
+        with pytest.raises(ValueError):
+            OCRConfig(quantized=True)
+
+    def test_engine_backend(self, model_dir, temp_dir):
+        """Test OCREngine produces an OCRResult through the ONNX backend."""
+        import cv2
+
+        image_path = temp_dir / "page.png"
+        cv2.imwrite(str(image_path), np.full((200, 400, 3), 255, dtype=np.uint8))
+
+        config = OCRConfig(
+            backend="onnxruntime", onnx_model_dir=model_dir, show_log=False
+        )
+        result = OCREngine(config).process_image(image_path)
+
+        assert result.text == "AB"
+        assert result.lines[0].bbox
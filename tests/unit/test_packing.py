@@ -0,0 +1,111 @@
+"""
+Unit tests for the binary result format.
+"""
+
+import io
+import struct
+from pathlib import Path
+
+import pytest
+
+from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+from smart_ocr.core.packing import HEADER, MAGIC, VERSION, iter_records
+from smart_ocr.core.readers import read_results
+from smart_ocr.core.writers import create_writer
+
+
+def _result():
+    return OCRResult(
+        Path("scans/頁 1.png"),
+        [
+            OCRLine(
+                "台北富邦銀行", 0.987654321, [[10, 20], [110, 20], [110, 40], [10, 40]]
+            ),
+            OCRLine("", 0.0, []),
+            OCRLine("emoji 🙂 ok", 0.5, [[0.5, 1.25], [3.75, 8]]),
+        ],
+    )
+
+
+class TestBinaryFormat:
+    """Test cases for to_bytes/from_bytes."""
+
+    def test_round_trip(self):
+        """Test text, confidences and integer boxes survive exactly."""
+        result = _result()
+        restored = OCRResult.from_bytes(result.to_bytes())
+
+        assert restored.source_file == result.source_file
+        assert [line.to_dict() for line in restored.lines] == [
+            line.to_dict() for line in result.lines
+        ]
+        assert restored.fields is None
+        assert not restored.blank
+
+    def test_float32_boxes(self):
+        """Test non-integer coordinates are kept to float32 precision."""
+        line = OCRLine("x", 0.9, [[0.1, 1234.567]])
+        restored = OCRResult.from_bytes(OCRResult(Path("a"), [line]).to_bytes())
+
+        assert restored.lines[0].bbox == [
+            [pytest.approx(0.1, rel=1e-6), pytest.approx(1234.567, rel=1e-6)]
+        ]
+
+    def test_fields_and_blank(self):
+        """Test template fields and the blank flag are kept."""
+        fields = {"姓名": "王小明", "帳號": ""}
+        data = OCRResult(Path("f.png"), [], fields=fields, blank=True).to_bytes()
+        restored = OCRResult.from_bytes(data)
+
+        assert restored.fields == fields
+        assert restored.blank
+        assert restored.lines == []
+
+    def test_smaller_than_json(self):
+        """Test the binary form is smaller than compact JSON."""
+        import json
+
+        result = _result()
+        text = json.dumps(result.to_dict(), ensure_ascii=False).encode("utf-8")
+        assert len(result.to_bytes()) < len(text)
+
+    def test_rejects_bad_records(self):
+        """Test foreign, truncated and newer-version data raise ValueError."""
+        data = _result().to_bytes()
+
+        with pytest.raises(ValueError, match="Not a binary"):
+            OCRResult.from_bytes(b"JUNK" + data[4:])
+        with pytest.raises(ValueError, match="Truncated"):
+            OCRResult.from_bytes(data[:-1])
+        newer = struct.pack("<4sH", MAGIC, VERSION + 1) + data[6:]
+        with pytest.raises(ValueError, match="newer"):
+            OCRResult.from_bytes(newer)
+
+    def test_iter_records(self):
+        """Test concatenated records stream back one at a time."""
+        first, second = _result().to_bytes(), OCRResult(Path("b"), []).to_bytes()
+
+        assert list(iter_records(io.BytesIO(first + second))) == [first, second]
+        with pytest.raises(ValueError):
+            list(iter_records(io.BytesIO(first + second[: HEADER.size - 1])))
+
+
+class TestBinaryExport:
+    """Test cases for the bin export format."""
+
+    def test_append(self, temp_dir):
+        """Test appended results are read back in order."""
+        path = temp_dir / "out.bin"
+        for name in ("a.png", "b.png"):
+            with create_writer("bin", path, append=True) as writer:
+                writer.write(OCRResult(Path(name), [OCRLine(name, 0.9, [])]))
+
+        results = list(read_results(path))
+
+        assert [r.source_file for r in results] == [Path("a.png"), Path("b.png")]
+        assert results[1].text == "b.png"
+
+    def test_cannot_be_compressed(self, temp_dir):
+        """Test bin output rejects stream compression."""
+        with pytest.raises(ValueError):
+            create_writer("bin", temp_dir / "out.bin", compress="gzip")
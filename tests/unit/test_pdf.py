@@ -0,0 +1,137 @@
+"""
+Unit tests for the searchable PDF writer.
+"""
+
+import re
+import zlib
+from pathlib import Path
+
+import pytest
+
+from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+from smart_ocr.core.writers import create_multi_writer, create_writer
+
+BOX = [[10, 10], [210, 10], [210, 40], [10, 40]]
+
+
+def _image(path, grey=False):
+    cv2 = pytest.importorskip("cv2")
+    import numpy as np
+
+    image = np.full((400, 600) if grey else (400, 600, 3), 255, dtype=np.uint8)
+    cv2.imwrite(str(path), image)
+    return path
+
+
+def _objects(data):
+    """Map object numbers to their bytes, checking the xref offsets."""
+    start = int(re.search(rb"startxref\n(\d+)", data).group(1))
+    rows = data[start:].split(b"trailer")[0].split(b"\n")[2:]
+    objects = {}
+    for number, row in enumerate(rows):
+        if number == 0 or not row:
+            continue
+        offset = int(row[:10])
+        assert data[offset:].startswith(f"{number} 0 obj".encode())
+        objects[number] = data[offset : data.index(b"endobj", offset)]
+    return objects
+
+
+def _streams(data):
+    """Decompressed Flate streams of the document."""
+    pattern = re.compile(rb"FlateDecode[^>]*>>\nstream\n(.*?)\nendstream", re.S)
+    return [zlib.decompress(match.group(1)) for match in pattern.finditer(data)]
+
+
+class TestPdfWriter:
+    """Test cases for the pdf export format."""
+
+    def test_pages_and_text_layer(self, temp_dir):
+        """Test one page per result with invisible, mapped text."""
+        results = [
+            OCRResult(_image(temp_dir / "a.png"), [OCRLine("台北富邦", 0.9, BOX)]),
+            OCRResult(_image(temp_dir / "b.png", True), [OCRLine("ok", 0.9, BOX)]),
+        ]
+        path = temp_dir / "out.pdf"
+        with create_writer("pdf", path) as writer:
+            writer.write_all(results)
+
+        data = path.read_bytes()
+        assert data.startswith(b"%PDF-1.7") and data.endswith(b"%%EOF\n")
+        objects = _objects(data)
+        assert b"/Count 2" in b"".join(objects.values())
+        assert b"/ColorSpace /DeviceGray" in data
+        # 600 x 400 px at the default 300 dpi
+        assert b"/MediaBox [0 0 144.00 96.00]" in data
+
+        streams = _streams(data)
+        content = [s for s in streams if b"3 Tr" in s]
+        assert len(content) == 2
+        assert b"<0001000200030004> Tj" in content[0]
+        to_unicode = next(s for s in streams if b"beginbfchar" in s)
+        assert b"<0001> <53F0>" in to_unicode  # 台
+        assert b"<0005> <006F>" in to_unicode  # o
+
+    def test_jpeg_embedded_as_is(self, temp_dir):
+        """Test JPEG sources are passed through without re-encoding."""
+        source = _image(temp_dir / "scan.jpg")
+        path = temp_dir / "out.pdf"
+        with create_writer("pdf", path) as writer:
+            writer.write(OCRResult(source, [OCRLine("x", 0.9, BOX)]))
+
+        data = path.read_bytes()
+        assert b"/Filter /DCTDecode" in data
+        assert source.read_bytes() in data
+
+    def test_reuses_decoded_image(self, temp_dir, monkeypatch):
+        """Test a caller's decoded array is embedded without decoding."""
+        import smart_ocr.core.pdf as pdf
+
+        source = _image(temp_dir / "a.png")
+        image = pytest.importorskip("cv2").imread(str(source))
+
+        def fail(*args):
+            raise AssertionError("image decoded again")
+
+        monkeypatch.setattr(pdf, "_decode", fail)
+        with create_writer("pdf", temp_dir / "out.pdf") as writer:
+            writer.write(OCRResult(source, []), image=image)
+        assert writer.count == 1
+
+    def test_rotated_line(self, temp_dir):
+        """Test a slanted box rotates the text matrix."""
+        box = [[100, 200], [300, 100], [310, 120], [110, 220]]
+        path = temp_dir / "out.pdf"
+        with create_writer("pdf", path) as writer:
+            source = _image(temp_dir / "a.png")
+            writer.write(OCRResult(source, [OCRLine("ab", 0.9, box)]))
+
+        content = next(s for s in _streams(path.read_bytes()) if b"3 Tr" in s)
+        assert b"0.8944 0.4472 -0.4472 0.8944" in content
+
+    def test_missing_image_writes_text_only(self, temp_dir):
+        """Test a missing source still gives a page with its text."""
+        path = temp_dir / "out.pdf"
+        with create_writer("pdf", path) as writer:
+            writer.write(OCRResult(temp_dir / "gone.png", [OCRLine("x", 0.9, BOX)]))
+
+        data = path.read_bytes()
+        _objects(data)
+        assert b"/XObject" not in data
+        assert any(b"3 Tr" in s for s in _streams(data))
+
+    def test_empty_document(self, temp_dir):
+        """Test a document without results is still well formed."""
+        path = temp_dir / "out.pdf"
+        with create_writer("pdf", path):
+            pass
+        assert b"/Count 0" in b"".join(_objects(path.read_bytes()).values())
+
+    def test_not_compressed_in_multi_export(self, temp_dir):
+        """Test pdf is written uncompressed next to compressed text formats."""
+        source = _image(temp_dir / "a.png")
+        writer = create_multi_writer("jsonl,pdf", temp_dir / "out", compress="gzip")
+        with writer:
+            writer.write(OCRResult(source, [OCRLine("x", 0.9, BOX)]))
+        assert writer.paths == [temp_dir / "out.jsonl.gz", temp_dir / "out.pdf"]
+        assert Path(writer.paths[1]).read_bytes().startswith(b"%PDF")
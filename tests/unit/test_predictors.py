@@ -0,0 +1,147 @@
+"""
+Unit tests for the predictor pool and thread-safe engine use.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine
+from smart_ocr.core.predictors import PredictorPool
+
+
+class FakePredictor:
+    """PaddleOCR stand-in that fails if it is ever used reentrantly."""
+
+    def __init__(self):
+        self.busy = False
+        self.calls = 0
+
+    def ocr(self, image, det=True, rec=True, cls=False):
+        assert not self.busy, "predictor used by two threads at once"
+        self.busy = True
+        time.sleep(0.02)
+        self.calls += 1
+        self.busy = False
+        return [[[[[0, 0], [10, 0], [10, 5], [0, 5]], ("text", 0.9)]]]
+
+
+class TestPredictorPool:
+    """Test cases for PredictorPool."""
+
+    def test_creates_on_demand(self):
+        """Test sequential use never creates more than the first predictor."""
+        pool = PredictorPool("first", lambda: "extra", size=4)
+
+        for _ in range(3):
+            with pool.checkout() as predictor:
+                assert predictor == "first"
+        assert pool.created == 1
+
+    def test_bounded(self):
+        """Test concurrent callers share at most ``size`` predictors."""
+        pool = PredictorPool(FakePredictor(), FakePredictor, size=2)
+        in_use = []
+        peak = []
+        lock = threading.Lock()
+
+        def call(_):
+            with pool.checkout() as predictor:
+                with lock:
+                    in_use.append(predictor)
+                    peak.append(len(in_use))
+                predictor.ocr(None)
+                with lock:
+                    in_use.remove(predictor)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(call, range(12)))
+
+        assert pool.created == 2
+        assert max(peak) == 2
+
+    def test_failed_creation_frees_slot(self):
+        """Test a factory error is raised and does not use up the pool."""
+        attempts = []
+
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("out of memory")
+            return "extra"
+
+        pool = PredictorPool("first", factory, size=2)
+        with pool.checkout():
+            with pytest.raises(RuntimeError):
+                with pool.checkout():
+                    pass
+            with pool.checkout() as predictor:
+                assert predictor == "extra"
+        assert pool.created == 2
+
+    def test_fill(self):
+        """Test fill creates every predictor up front."""
+        pool = PredictorPool("first", object, size=3)
+        pool.fill()
+        assert pool.created == 3
+
+    def test_invalid_size(self):
+        """Test a size below one is rejected."""
+        with pytest.raises(ValueError):
+            PredictorPool("first", object, size=0)
+
+
+class TestThreadSafeEngine:
+    """Test cases for sharing one OCREngine across threads."""
+
+    def test_initialized_once(self):
+        """Test concurrent first calls load the models only once."""
+        engine = OCREngine(OCRConfig(show_log=False))
+        created = []
+
+        def create():
+            time.sleep(0.05)
+            created.append(FakePredictor())
+            return created[-1]
+
+        with patch.object(engine, "_create_predictor", side_effect=create):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: engine._ensure_initialized(), range(8)))
+
+        assert len(created) == 1
+        assert engine._ocr is created[0]
+
+    def test_threads_use_separate_predictors(self, sample_image):
+        """Test parallel pages never share a predictor mid-call."""
+        engine = OCREngine(OCRConfig(show_log=False, predictor_pool_size=3))
+        engine._initialized = True
+        engine._ocr = FakePredictor()
+        extras = []
+
+        def create():
+            extras.append(FakePredictor())
+            return extras[-1]
+
+        with patch.object(engine, "_create_predictor", side_effect=create):
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(executor.map(engine.process_image, [sample_image] * 12))
+
+        assert [r.text for r in results] == ["text"] * 12
+        assert len(extras) <= 2
+        assert engine._ocr.calls + sum(p.calls for p in extras) == 12
+
+    def test_warmup_fills_pool(self):
+        """Test warmup creates every predictor of the pool."""
+        engine = OCREngine(OCRConfig(show_log=False, predictor_pool_size=2))
+        with patch.object(engine, "_create_predictor", side_effect=FakePredictor):
+            engine.warmup()
+        assert engine._predictor_pool().created == 2
+
+    def test_invalid_pool_size(self):
+        """Test predictor_pool_size below one is rejected."""
+        with pytest.raises(ValueError):
+            OCRConfig(show_log=False, predictor_pool_size=0)
@@ -0,0 +1,54 @@
+"""
+Unit tests for INT8 model quantization helpers.
+"""
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.quantization import (
+    _CalibrationReader,
+    find_calibration_images,
+    quantize_models,
+)
+
+
+class TestCalibration:
+    """Test cases for calibration data handling."""
+
+    def test_reader_yields_and_rewinds(self):
+        """Test the reader feeds every blob and can start over."""
+        reader = _CalibrationReader("x", lambda: iter([1, 2]))
+        assert reader.get_next() == {"x": 1}
+        assert reader.get_next() == {"x": 2}
+        assert reader.get_next() is None
+        reader.rewind()
+        assert reader.get_next() == {"x": 1}
+
+    def test_find_calibration_images(self, temp_dir):
+        """Test images are listed sorted and capped."""
+        for name in ("b.png", "a.jpg", "notes.txt"):
+            (temp_dir / name).write_bytes(b"")
+        images = find_calibration_images(temp_dir, max_images=1)
+        assert [p.name for p in images] == ["a.jpg"]
+
+    def test_empty_calibration_dir(self, temp_dir):
+        """Test a directory without images is rejected."""
+        with pytest.raises(ValueError):
+            find_calibration_images(temp_dir)
+
+    def test_missing_calibration_dir(self, temp_dir):
+        """Test a missing directory raises NotADirectoryError."""
+        with pytest.raises(NotADirectoryError):
+            find_calibration_images(temp_dir / "missing")
+
+    def test_quantize_requires_onnxruntime(self, temp_dir):
+        """Test a helpful ImportError without onnxruntime."""
+        try:
+            import onnxruntime  # noqa: F401
+
+            pytest.skip("onnxruntime is installed")
+        except ImportError:
+            pass
+        config = OCRConfig(backend="onnxruntime", onnx_model_dir=temp_dir)
+        with pytest.raises(ImportError, match="pip install onnxruntime"):
+            quantize_models(config, temp_dir)
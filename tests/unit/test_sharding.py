@@ -0,0 +1,128 @@
+"""
+Unit tests for sharding and result merging.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_ocr.core import readers
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine, OCRLine, OCRResult
+from smart_ocr.core.readers import merge_results, read_results
+from smart_ocr.core.sharding import parse_shard, select_shard, shard_of
+from smart_ocr.core.writers import create_writer
+
+
+class TestSharding:
+    """Test cases for shard selection."""
+
+    def test_parse_shard(self):
+        """Test parsing i/N specifications."""
+        assert parse_shard("0/4") == (0, 4)
+        assert parse_shard("3/4") == (3, 4)
+
+    @pytest.mark.parametrize("spec", ["4/4", "-1/2", "1", "a/b", "0/0"])
+    def test_parse_shard_invalid(self, spec):
+        """Test malformed or out-of-range shards are rejected."""
+        with pytest.raises(ValueError):
+            parse_shard(spec)
+
+    def test_shards_are_disjoint_and_complete(self):
+        """Test every path lands in exactly one shard."""
+        root = Path("/corpus")
+        paths = [root / f"dir_{i % 7}" / f"img_{i}.png" for i in range(200)]
+        shards = [select_shard(paths, root, i, 3) for i in range(3)]
+
+        assert sorted(p for shard in shards for p in shard) == sorted(paths)
+        assert all(shards)
+
+    def test_shard_is_stable_across_separators(self):
+        """Test the hash uses the POSIX form of the relative path."""
+        assert shard_of("a/b/c.png", 16) == shard_of(Path("a") / "b" / "c.png", 16)
+
+    def test_find_images_with_shard(self, temp_dir):
+        """Test OCREngine.find_images honours the shard selection."""
+        for i in range(10):
+            (temp_dir / f"img_{i}.png").write_bytes(b"x")
+        engine = OCREngine(OCRConfig(show_log=False, output_dir=temp_dir / "out"))
+
+        shards = [engine.find_images(temp_dir, shard=(i, 2)) for i in range(2)]
+        assert sorted(shards[0] + shards[1]) == engine.find_images(temp_dir)
+        assert not set(shards[0]) & set(shards[1])
+
+
+def _write(path, fmt, names):
+    results = [
+        OCRResult(Path(name), [OCRLine(f"{name} text", 0.9, [[0, 0], [1, 1]])])
+        for name in names
+    ]
+    with create_writer(fmt, path) as writer:
+        writer.write_all(results)
+    return path
+
+
+class TestReaders:
+    """Test cases for reading exports back and merging them."""
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl", "csv", "txt", "xlsx", "bin"])
+    def test_round_trip(self, temp_dir, fmt):
+        """Test each export format can be read back."""
+        path = _write(temp_dir / f"out.{fmt}", fmt, ["a.png", "b.png"])
+        results = list(read_results(path))
+        assert [r.source_file for r in results] == [Path("a.png"), Path("b.png")]
+        assert results[0].text == "a.png text"
+
+    def test_merge_mixed_formats_in_order(self, temp_dir):
+        """Test shard outputs in different formats merge in file order."""
+        first = _write(temp_dir / "s0.json", "json", ["a.png", "c.png"])
+        second = _write(temp_dir / "s1.bin", "bin", ["b.png", "d.png"])
+
+        merged = [r.source_file.name for r in merge_results([first, second])]
+        assert merged == ["a.png", "b.png", "c.png", "d.png"]
+
+    def test_merge_reads_each_input_once(self, temp_dir, monkeypatch):
+        """Test the merge streams every input a single time."""
+        first = _write(temp_dir / "s0.jsonl", "jsonl", ["a.png", "c.png"])
+        second = _write(temp_dir / "s1.jsonl", "jsonl", ["b.png"])
+        opened = []
+        read_jsonl = readers.READERS["jsonl"]
+        monkeypatch.setitem(
+            readers.READERS,
+            "jsonl",
+            lambda path: opened.append(path) or read_jsonl(path),
+        )
+
+        assert len(list(merge_results([first, second]))) == 3
+        assert opened == [first, second]
+
+    def test_merge_unsorted_input_warns(self, temp_dir, caplog):
+        """Test an unsorted input is reported and still fully merged."""
+        first = _write(temp_dir / "s0.jsonl", "jsonl", ["c.png", "a.png"])
+        second = _write(temp_dir / "s1.jsonl", "jsonl", ["b.png", "d.png"])
+
+        merged = [r.source_file.name for r in merge_results([first, second])]
+        assert sorted(merged) == ["a.png", "b.png", "c.png", "d.png"]
+        assert f"Not sorted by source file: {first}" in caplog.text
+
+    @pytest.mark.parametrize("fmt", ["csv", "txt", "xlsx"])
+    def test_merge_refuses_lossy_formats(self, temp_dir, fmt):
+        """Test inputs that drop results or confidences are refused."""
+        path = _write(temp_dir / f"s0.{fmt}", fmt, ["a.png"])
+
+        with pytest.raises(ValueError, match="lose results or confidences"):
+            merge_results([path])
+
+    def test_from_dict_keeps_fields(self):
+        """Test template fields survive a dictionary round trip."""
+        result = OCRResult(Path("f.png"), [], fields={"name": "王小明"})
+        restored = OCRResult.from_dict(json.loads(json.dumps(result.to_dict())))
+        assert restored.fields == {"name": "王小明"}
+
+    def test_unknown_format(self, temp_dir):
+        """Test unreadable suffixes raise ValueError."""
+        path = temp_dir / "out.xml"
+        path.write_text("<xml/>")
+        with pytest.raises(ValueError):
+            read_results(path)
@@ -0,0 +1,89 @@
+"""
+Unit tests for the spatial index.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from smart_ocr.core.spatial import SpatialIndex  # noqa: E402
+
+
+def _box(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+@pytest.fixture
+def random_boxes():
+    """Random text-line boxes on a page, with their bounds."""
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 2000, 600), rng.uniform(0, 3000, 600)
+    w, h = rng.uniform(20, 400, 600), rng.uniform(10, 30, 600)
+    bounds = np.c_[x, y, x + w, y + h]
+    return [_box(*b) for b in bounds], bounds
+
+
+class TestSpatialIndex:
+    """Test cases for the packed R-tree, checked against brute force."""
+
+    def test_empty(self):
+        """Test queries on an empty index."""
+        index = SpatialIndex([])
+        assert len(index) == 0
+        assert index.within((0, 0, 10, 10)) == []
+        assert index.nearest((0, 0)) is None
+
+    def test_within(self, random_boxes):
+        """Test contained and intersecting rectangle queries."""
+        boxes, b = random_boxes
+        index = SpatialIndex(boxes, fanout=4)
+
+        for rect in [(0, 0, 2500, 3500), (300, 400, 900, 1200), (5, 5, 6, 6)]:
+            x0, y0, x1, y1 = rect
+            inside = (b[:, 0] >= x0) & (b[:, 2] <= x1) & (b[:, 1] >= y0)
+            inside &= b[:, 3] <= y1
+            touching = (b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1)
+            touching &= b[:, 3] >= y0
+            assert index.within(rect) == np.flatnonzero(inside).tolist()
+            assert index.within(rect, contained=False) == (
+                np.flatnonzero(touching).tolist()
+            )
+
+    def test_nearest(self, random_boxes):
+        """Test the nearest box has the smallest distance to the point."""
+        boxes, b = random_boxes
+        index = SpatialIndex(boxes)
+
+        for x, y in [(0, 0), (1000, 1500), (2500, -100)]:
+            dx = np.maximum(np.maximum(b[:, 0] - x, x - b[:, 2]), 0)
+            dy = np.maximum(np.maximum(b[:, 1] - y, y - b[:, 3]), 0)
+            distance = np.hypot(dx, dy)
+            assert distance[index.nearest((x, y))] == distance.min()
+
+    def test_right_of(self):
+        """Test the value to the right of a key is found on its row."""
+        boxes = [
+            _box(100, 100, 200, 120),  # key
+            _box(600, 102, 800, 122),  # far value on the row
+            _box(250, 98, 400, 118),  # value
+            _box(220, 140, 400, 160),  # next row
+            _box(50, 100, 90, 120),  # left of the key
+        ]
+        index = SpatialIndex(boxes, fanout=2)
+
+        assert index.right_of(0) == 2
+        assert index.right_of(2) == 1
+        assert index.right_of(1) is None
+        assert index.right_of(3) is None
+
+    def test_single_box(self):
+        """Test a one-box tree never returns the reference box itself."""
+        index = SpatialIndex([_box(100, 100, 200, 120)])
+
+        assert index.right_of(0) is None
+        assert index.nearest((0, 0)) == 0
+
+    def test_invalid_fanout(self):
+        """Test a fanout below two is rejected."""
+        with pytest.raises(ValueError):
+            SpatialIndex([], fanout=1)
@@ -0,0 +1,201 @@
+"""
+Unit tests for supervised worker execution.
+"""
+
+import os
+import time
+from collections import deque
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+from smart_ocr.core.supervisor import (
+    ProcessingFailure,
+    SupervisedRunner,
+    _Worker,
+    write_quarantine,
+)
+
+
+class FakeEngine:
+    """Engine stand-in whose behaviour depends on the file name."""
+
+    def __init__(self, config):
+        self.config = config
+
+    def warmup(self):
+        pass
+
+    def process_image(self, image_path):
+        name = Path(image_path).name
+        if name.startswith("hang"):
+            time.sleep(60)
+        if name.startswith("crash"):
+            os._exit(3)
+        if name.startswith("bad"):
+            raise ValueError("cannot decode")
+        return OCRResult(Path(image_path), [OCRLine(name, 0.9, [])])
+
+
+class PidEngine(FakeEngine):
+    """Engine stand-in that reports which process handled each image."""
+
+    def process_image(self, image_path):
+        return OCRResult(Path(image_path), [OCRLine(str(os.getpid()), 0.9, [])])
+
+
+class MarkerEngine(FakeEngine):
+    """Engine stand-in that leaves a ``.done`` file next to each image."""
+
+    def process_image(self, image_path):
+        Path(f"{image_path}.done").touch()
+        return super().process_image(image_path)
+
+
+class SharedMemoryEngine(FakeEngine):
+    """Engine stand-in that reports how each image reached the worker."""
+
+    def process_decoded(self, image_path, decoded):
+        image = decoded.data
+        text = f"shared {image.shape[1]}x{image.shape[0]} {int(image[0, 0, 0])}"
+        return OCRResult(Path(image_path), [OCRLine(text, 0.9, [])])
+
+    def process_image(self, image_path):
+        return OCRResult(Path(image_path), [OCRLine("path", 0.9, [])])
+
+
+@pytest.fixture
+def config(temp_dir):
+    return OCRConfig(show_log=False, output_dir=temp_dir)
+
+
+class TestSupervisedRunner:
+    """Test cases for SupervisedRunner."""
+
+    def test_results_in_input_order(self, config):
+        """Test results come back in input order across workers."""
+        runner = SupervisedRunner(config, workers=2, engine_factory=FakeEngine)
+        paths = [f"img_{i}.png" for i in range(6)]
+        results, failures = runner.run(paths)
+        assert [r.text for r in results] == paths
+        assert failures == []
+
+    def test_paths_pulled_lazily(self, config, temp_dir):
+        """Test images are dispatched before the whole path stream is read."""
+        first_done_when_pulling_third = []
+
+        def paths():
+            for i in range(3):
+                if i == 2:
+                    done = (temp_dir / "img_0.png.done").exists()
+                    first_done_when_pulling_third.append(done)
+                yield temp_dir / f"img_{i}.png"
+
+        runner = SupervisedRunner(config, engine_factory=MarkerEngine)
+        results, _ = runner.run(paths())
+
+        assert len(results) == 3
+        assert first_done_when_pulling_third == [True]
+
+    def test_timeout_crash_and_error_are_quarantined(self, config):
+        """Test hung, crashed and failing images end up in the quarantine list."""
+        runner = SupervisedRunner(
+            config, timeout=1.0, retries=1, engine_factory=FakeEngine
+        )
+        results, failures = runner.run(
+            ["ok_1.png", "hang.png", "crash.png", "bad.png", "ok_2.png"]
+        )
+
+        assert [r.text for r in results] == ["ok_1.png", "ok_2.png"]
+        by_name = {f.source_file.name: f for f in failures}
+        assert "timed out" in by_name["hang.png"].reason
+        assert by_name["hang.png"].attempts == 2
+        assert "crashed" in by_name["crash.png"].reason
+        assert by_name["bad.png"].attempts == 1
+        assert "cannot decode" in by_name["bad.png"].reason
+
+    def test_recycles_after_max_images(self, config):
+        """Test workers are replaced after max_images_per_worker images."""
+        runner = SupervisedRunner(
+            config, max_images_per_worker=2, engine_factory=PidEngine
+        )
+        results, _ = runner.run([f"img_{i}.png" for i in range(4)])
+        pids = [r.text for r in results]
+        assert pids[0] == pids[1]
+        assert pids[1] != pids[2]
+        assert pids[2] == pids[3]
+
+    def test_shared_memory_hand_off(self, config, temp_dir):
+        """Test workers read parent-decoded images from shared memory."""
+        cv2 = pytest.importorskip("cv2")
+        import numpy as np
+
+        paths = []
+        for i in range(4):
+            path = temp_dir / f"page_{i}.png"
+            cv2.imwrite(str(path), np.full((30, 40, 3), i * 10, dtype=np.uint8))
+            paths.append(path)
+
+        runner = SupervisedRunner(
+            config,
+            workers=2,
+            shared_memory=True,
+            engine_factory=SharedMemoryEngine,
+        )
+        results, failures = runner.run(paths + [temp_dir / "missing.png"])
+
+        assert [r.text for r in results] == [
+            f"shared 40x30 {i * 10}" for i in range(4)
+        ] + ["path"]
+        assert failures == []
+
+    def test_shared_memory_large_image_sent_by_path(self, config, temp_dir):
+        """Test images larger than a slot fall back to the file path."""
+        cv2 = pytest.importorskip("cv2")
+        import numpy as np
+
+        path = temp_dir / "big.png"
+        cv2.imwrite(str(path), np.zeros((100, 100, 3), dtype=np.uint8))
+
+        runner = SupervisedRunner(
+            config,
+            shared_memory=True,
+            shm_slot_mb=0.01,
+            engine_factory=SharedMemoryEngine,
+        )
+        results, _ = runner.run([path])
+
+        assert [r.text for r in results] == ["path"]
+
+    def test_idle_worker_death_is_replaced(self, config):
+        """Test a ready worker dying between images is replaced, not fatal."""
+        runner = SupervisedRunner(config, engine_factory=FakeEngine)
+        conn = MagicMock()
+        conn.recv.side_effect = EOFError
+        worker = _Worker(MagicMock(exitcode=-9), conn)
+
+        with pytest.raises(RuntimeError, match="during startup"):
+            runner._receive(worker, deque(), {}, {})
+
+        worker.ready = True
+        failures = {}
+        assert runner._receive(worker, deque(), {}, failures) is True
+        assert failures == {}
+
+    def test_invalid_workers(self, config):
+        """Test invalid worker counts are rejected."""
+        with pytest.raises(ValueError):
+            SupervisedRunner(config, workers=0)
+
+
+def test_write_quarantine(temp_dir):
+    """Test the quarantine list is written as CSV."""
+    path = write_quarantine(
+        [ProcessingFailure(Path("a.tiff"), "timed out after 60s", 2)],
+        temp_dir / "out.failed.csv",
+    )
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["file,reason,attempts", "a.tiff,timed out after 60s,2"]
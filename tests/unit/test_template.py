@@ -0,0 +1,86 @@
+"""
+Unit tests for form templates.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.config import OCRConfig
+from smart_ocr.core.ocr_engine import OCREngine
+from smart_ocr.core.template import FormTemplate, TemplateRegion
+
+
+@pytest.fixture
+def template_file(temp_dir):
+    """Write a two-region template file."""
+    path = temp_dir / "form.json"
+    data = {
+        "name": "auto_debit",
+        "regions": [
+            {"name": "account_name", "box": [0.0, 0.0, 0.5, 0.5]},
+            {"name": "account_number", "box": [0.5, 0.5, 1.0, 1.0]},
+        ],
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestFormTemplate:
+    """Test cases for FormTemplate and TemplateRegion."""
+
+    def test_load(self, template_file):
+        """Test loading a template from JSON."""
+        template = FormTemplate.load(template_file)
+        assert template.name == "auto_debit"
+        assert [r.name for r in template.regions] == ["account_name", "account_number"]
+
+    def test_to_pixels(self):
+        """Test normalised boxes convert to pixel rectangles."""
+        region = TemplateRegion("field", (0.1, 0.2, 0.5, 0.6))
+        assert region.to_pixels(200, 100) == (20, 20, 100, 60)
+
+    def test_invalid_box(self):
+        """Test out-of-range boxes are rejected."""
+        with pytest.raises(ValueError):
+            TemplateRegion("field", (0.5, 0.2, 0.4, 0.6))
+
+    def test_duplicate_names(self):
+        """Test duplicate region names are rejected."""
+        with pytest.raises(ValueError):
+            FormTemplate.from_dict(
+                {
+                    "regions": [
+                        {"name": "a", "box": [0, 0, 1, 1]},
+                        {"name": "a", "box": [0, 0, 1, 1]},
+                    ]
+                }
+            )
+
+    def test_missing_file(self, temp_dir):
+        """Test a missing template file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FormTemplate.load(temp_dir / "missing.json")
+
+
+class TestTemplateProcessing:
+    """Test cases for template-driven recognition in OCREngine."""
+
+    def test_process_image_with_template(self, sample_image, template_file):
+        """Test only region crops are recognized, in a single call."""
+        config = OCRConfig(show_log=False, template=template_file)
+        engine = OCREngine(config)
+        engine._initialized = True
+        engine._ocr = MagicMock()
+        engine._ocr.ocr.return_value = [[("王小明", 0.97), ("", 0.0)]]
+
+        result = engine.process_image(sample_image)
+
+        engine._ocr.ocr.assert_called_once()
+        crops = engine._ocr.ocr.call_args[0][0]
+        assert [c.shape[:2] for c in crops] == [(25, 50), (25, 50)]
+        assert engine._ocr.ocr.call_args[1]["det"] is False
+        assert result.fields == {"account_name": "王小明", "account_number": ""}
+        assert len(result.lines) == 1
+        assert result.to_dict()["fields"]["account_name"] == "王小明"
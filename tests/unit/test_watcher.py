@@ -0,0 +1,109 @@
+"""
+Unit tests for the folder watcher.
+"""
+
+import threading
+import time
+
+import pytest
+
+from smart_ocr.core.watcher import FolderWatcher
+
+
+def _collect(watcher, batch_size=8, max_wait=0.05, timeout=5.0, expected=1):
+    """Run the watcher until ``expected`` files were batched or timeout."""
+    batches = []
+    stopper = threading.Timer(timeout, watcher.stop)
+    stopper.start()
+    try:
+        for batch in watcher.batches(batch_size=batch_size, max_wait=max_wait):
+            batches.append(batch)
+            if sum(len(b) for b in batches) >= expected:
+                watcher.stop()
+    finally:
+        stopper.cancel()
+    return batches
+
+
+class TestFolderWatcher:
+    """Test cases for FolderWatcher."""
+
+    def test_not_a_directory(self, temp_dir):
+        """Test watching a missing directory raises."""
+        with pytest.raises(NotADirectoryError):
+            FolderWatcher(temp_dir / "missing")
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_existing_files_batched(self, temp_dir, use_inotify):
+        """Test files present at startup are batched by size."""
+        for i in range(5):
+            (temp_dir / f"img_{i}.png").write_bytes(b"data")
+        (temp_dir / "notes.txt").write_bytes(b"skip")
+
+        watcher = FolderWatcher(
+            temp_dir, settle_time=0.05, poll_interval=0.02, use_inotify=use_inotify
+        )
+        batches = _collect(watcher, batch_size=2, expected=5)
+
+        names = [p.name for b in batches for p in b]
+        assert sorted(names) == [f"img_{i}.png" for i in range(5)]
+        assert max(len(b) for b in batches) == 2
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_new_file_detected(self, temp_dir, use_inotify):
+        """Test a file dropped after startup is picked up."""
+        (temp_dir / "old.png").write_bytes(b"old")
+        watcher = FolderWatcher(
+            temp_dir,
+            settle_time=0.05,
+            poll_interval=0.02,
+            use_inotify=use_inotify,
+            include_existing=False,
+        )
+
+        def drop():
+            time.sleep(0.1)
+            (temp_dir / "new.jpg").write_bytes(b"new")
+
+        threading.Thread(target=drop).start()
+        batches = _collect(watcher, expected=1)
+        assert [p.name for b in batches for p in b] == ["new.jpg"]
+
+    def test_waits_for_size_to_settle(self, temp_dir):
+        """Test a growing file is not emitted until it stops changing."""
+        path = temp_dir / "scan.tiff"
+        path.write_bytes(b"x")
+        watcher = FolderWatcher(
+            temp_dir, settle_time=0.3, poll_interval=0.02, use_inotify=False
+        )
+
+        def grow():
+            for _ in range(3):
+                time.sleep(0.1)
+                with open(path, "ab") as f:
+                    f.write(b"more")
+
+        start = time.monotonic()
+        threading.Thread(target=grow).start()
+        batches = _collect(watcher, expected=1)
+        assert [p.name for b in batches for p in b] == ["scan.tiff"]
+        assert time.monotonic() - start >= 0.5
+
+    def test_empty_file_dropped_until_written(self, temp_dir):
+        """Test an empty file stops being pending and is re-armed on write."""
+        path = temp_dir / "scan.png"
+        path.write_bytes(b"")
+        watcher = FolderWatcher(
+            temp_dir, settle_time=0.05, poll_interval=0.02, use_inotify=False
+        )
+        watcher._start()
+
+        assert watcher._settled(time.monotonic() + 1) == []
+        assert not watcher._pending
+
+        watcher._rescan(time.monotonic())
+        assert not watcher._pending
+
+        path.write_bytes(b"data")
+        watcher._rescan(time.monotonic())
+        assert watcher._settled(time.monotonic() + 1) == [path]
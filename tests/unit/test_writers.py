@@ -0,0 +1,198 @@
+"""
+Unit tests for streaming result writers.
+"""
+
+import csv
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_ocr.core.ocr_engine import OCRLine, OCRResult
+from smart_ocr.core.writers import (
+    RollingWriter,
+    create_multi_writer,
+    create_writer,
+    format_paths,
+    parse_formats,
+)
+
+
+def _results():
+    return [
+        OCRResult(
+            Path("a.png"), [OCRLine("第一行", 0.9, [[0, 0], [10, 0], [10, 5], [0, 5]])]
+        ),
+        OCRResult(Path("b.png"), [OCRLine("Second", 0.8, [])]),
+    ]
+
+
+class TestResultWriters:
+    """Test cases for the format writers."""
+
+    def test_json_matches_json_dump(self, temp_dir):
+        """Test streamed JSON is identical to a single json.dump."""
+        path = temp_dir / "out.json"
+        with create_writer("json", path) as writer:
+            writer.write_all(_results())
+
+        expected = json.dumps(
+            [r.to_dict() for r in _results()], ensure_ascii=False, indent=2
+        )
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_json_empty(self, temp_dir):
+        """Test exporting no results yields an empty array."""
+        path = temp_dir / "out.json"
+        create_writer("json", path).close()
+        assert json.loads(path.read_text(encoding="utf-8")) == []
+
+    def test_csv_append_writes_header_once(self, temp_dir):
+        """Test appending to a CSV does not repeat the header."""
+        path = temp_dir / "out.csv"
+        for _ in range(2):
+            with create_writer("csv", path, append=True) as writer:
+                writer.write_all(_results())
+
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["file", "text", "confidence", "bbox"]
+        assert len(rows) == 5
+
+    def test_json_not_appendable(self, temp_dir):
+        """Test formats without append support reject append mode."""
+        with pytest.raises(ValueError):
+            create_writer("json", temp_dir / "out.json", append=True)
+
+    def test_unknown_format(self, temp_dir):
+        """Test unknown formats raise ValueError."""
+        with pytest.raises(ValueError):
+            create_writer("xml", temp_dir / "out.xml")
+
+
+class TestRollingWriter:
+    """Test cases for time-bucketed output."""
+
+    def test_rolls_per_interval(self, temp_dir):
+        """Test batches in different buckets go to different files."""
+        with RollingWriter(temp_dir, format="jsonl", interval=60) as writer:
+            first = writer.write_batch(_results(), now=0)
+            same = writer.write_batch(_results()[:1], now=30)
+            second = writer.write_batch(_results(), now=61)
+
+        assert first == same
+        assert first != second
+        assert len(first.read_text(encoding="utf-8").splitlines()) == 3
+        assert len(second.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_rejects_non_appendable_format(self, temp_dir):
+        """Test rolling output requires an appendable format."""
+        with pytest.raises(ValueError):
+            RollingWriter(temp_dir, format="xlsx")
+
+
+class TestCompressedExport:
+    """Test cases for streaming compressed exports."""
+
+    @pytest.mark.parametrize("compress", ["gzip", "zstd"])
+    @pytest.mark.parametrize("fmt", ["json", "jsonl", "csv", "txt"])
+    def test_round_trip(self, temp_dir, compress, fmt):
+        """Test compressed exports stream back through the readers."""
+        if compress == "zstd":
+            pytest.importorskip("zstandard")
+        from smart_ocr.core.readers import read_results
+        from smart_ocr.core.writers import compressed_path
+
+        path = compressed_path(temp_dir / f"out.{fmt}", compress)
+        with create_writer(fmt, path, compress=compress) as writer:
+            writer.write_all(_results())
+
+        assert path.name == f"out.{fmt}" + {"gzip": ".gz", "zstd": ".zst"}[compress]
+        results = list(read_results(path))
+        assert [r.source_file.name for r in results] == ["a.png", "b.png"]
+        assert results[0].text == "第一行"
+
+    def test_gzip_append_members(self, temp_dir):
+        """Test appending adds gzip members that read back as one stream."""
+        from smart_ocr.core.readers import read_results
+
+        path = temp_dir / "out.jsonl.gz"
+        for _ in range(2):
+            with create_writer("jsonl", path, append=True, compress="gzip") as writer:
+                writer.write_all(_results())
+        assert len(list(read_results(path))) == 4
+
+    def test_xlsx_cannot_be_compressed(self, temp_dir):
+        """Test compression is rejected for binary formats."""
+        with pytest.raises(ValueError):
+            create_writer("xlsx", temp_dir / "out.xlsx", compress="gzip")
+
+    def test_invalid_compression(self, temp_dir):
+        """Test unknown compressors are rejected."""
+        with pytest.raises(ValueError):
+            create_writer("json", temp_dir / "out.json", compress="lzma")
+
+
+class TestMultiWriter:
+    """Test cases for single-pass multi-format export."""
+
+    def test_parse_formats(self):
+        """Test comma lists are validated and de-duplicated in order."""
+        assert parse_formats("json, CSV,json,xlsx") == ["json", "csv", "xlsx"]
+        assert parse_formats(["txt"]) == ["txt"]
+        with pytest.raises(ValueError):
+            parse_formats("json,xml")
+        with pytest.raises(ValueError):
+            parse_formats("")
+
+    def test_format_paths(self):
+        """Test format and compression suffixes are replaced per format."""
+        paths = format_paths("out/results.json.gz", ["json", "csv"])
+        assert paths == {
+            "json": Path("out/results.json"),
+            "csv": Path("out/results.csv"),
+        }
+        assert format_paths("scan.v2", ["txt"]) == {"txt": Path("scan.v2.txt")}
+
+    def test_one_pass_to_all_formats(self, temp_dir):
+        """Test a result stream is consumed once and written to each format."""
+        consumed = []
+
+        def stream():
+            for result in _results():
+                consumed.append(result.source_file)
+                yield result
+
+        with create_multi_writer("json,csv,txt", temp_dir / "out") as writer:
+            writer.write_all(stream())
+
+        assert consumed == [Path("a.png"), Path("b.png")]
+        formats = ("json", "csv", "txt")
+        assert writer.paths == [temp_dir / f"out.{fmt}" for fmt in formats]
+        data = json.loads((temp_dir / "out.json").read_text(encoding="utf-8"))
+        assert [item["source_file"] for item in data] == ["a.png", "b.png"]
+        with open(temp_dir / "out.csv", encoding="utf-8", newline="") as f:
+            assert len(list(csv.reader(f))) == 3
+        assert "=== b.png ===" in (temp_dir / "out.txt").read_text(encoding="utf-8")
+
+    def test_compression_skips_binary_formats(self, temp_dir):
+        """Test xlsx stays uncompressed when the text formats are compressed."""
+        pytest.importorskip("openpyxl")
+        writer = create_multi_writer(["jsonl", "xlsx"], temp_dir / "out", "gzip")
+        with writer:
+            writer.write_all(_results())
+
+        assert writer.paths == [temp_dir / "out.jsonl.gz", temp_dir / "out.xlsx"]
+        assert all(path.exists() for path in writer.paths)
+
+    def test_failed_open_closes_opened_writers(self, temp_dir):
+        """Test writers opened before a failing one are closed again."""
+        writer = create_multi_writer(["jsonl", "json"], temp_dir / "out")
+        first, second = writer.writers
+        second.open = MagicMock(side_effect=OSError("disk full"))
+
+        with pytest.raises(OSError):
+            writer.open()
+
+        assert first._file is None